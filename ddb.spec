@@ -11,7 +11,7 @@ from pathlib import Path
 COOKIECUTTER_PATH = Path(cookiecutter.__file__).parent.resolve()
 
 
-a = Analysis(['ddb/__main__.py'],
+a = Analysis(['ddb/console.py'],
              pathex=[],
              binaries=[],
              datas=[
@@ -20,6 +20,7 @@ a = Analysis(['ddb/__main__.py'],
              ],
              hiddenimports=[
                  'ddb.feature.jsonnet.docker',
+                 'ddb.__main__',  # imported by console script when command line is not forwarded to daemon
                  'pkg_resources.py2_warn',  # https://github.com/pypa/setuptools/issues/1963
                  'cookiecutter.extensions',  # https://github.com/cookiecutter/cookiecutter/blob/b155476851448f1858884bf73c177c997319f5a6/cookiecutter/environment.py#L25-L30
                  'jinja2_time'
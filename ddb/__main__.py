@@ -6,6 +6,7 @@ import os
 import sys
 import threading
 from argparse import ArgumentParser, Namespace
+from copy import deepcopy
 from gettext import gettext as _
 from importlib import import_module
 from typing import Optional, Sequence, Iterable, Callable, Union, List
@@ -24,15 +25,18 @@ from ddb.cache import register_project_cache
 from ddb.command import commands
 from ddb.command.command import execute_command, Command
 from ddb.config import config
+from ddb.config.snapshot import ConfigSnapshot
 from ddb.context import context
 from ddb.event import bus, events
 from ddb.feature import features, Feature
 from ddb.feature.bootstrap import reset_available_features, append_available_feature, \
-    load_bootstrap_config, bootstrap_register_features
+    load_bootstrap_config, bootstrap_register_features, get_available_features
 from ddb.feature.core import ConfigureSecondPassException
+from ddb.feature.plugins import PluginsManifest
 from ddb.phase import phases
 from ddb.registry import Registry, RegistryObject
 from ddb.service import services
+from ddb.utils.importtime import profile_import_arg
 
 _watch_started_event = threading.Event()
 _watch_stop_event = threading.Event()
@@ -40,22 +44,16 @@ _watch_stop_event = threading.Event()
 
 def load_plugins():
     """Load plugins"""
-    for directory in [d for d in config.paths if d]:
-        extension_directory = os.path.join(directory, ".ddb")
-        if os.path.exists(extension_directory):
-            sys.path.append(os.path.abspath(extension_directory))
-            for dirpath, _, files in os.walk(extension_directory):
-                module_name = os.path.relpath(dirpath, extension_directory).replace(os.sep, ".")
-                if module_name == '.':
-                    module_name = None
-
-                for file in files:
-                    if file == "__init__.py":
-                        _load_plugins_module(module_name)
-                    elif file.endswith("py"):
-                        file_module_name = os.path.splitext(file)[0]
-                        _load_plugins_module(
-                            file_module_name if not module_name else '.'.join((module_name, file_module_name)))
+    manifest = PluginsManifest()
+    try:
+        for directory in [d for d in config.paths if d]:
+            extension_directory = os.path.join(directory, ".ddb")
+            if os.path.exists(extension_directory):
+                sys.path.append(os.path.abspath(extension_directory))
+                for module_name in manifest.get_modules(extension_directory):
+                    _load_plugins_module(module_name)
+    finally:
+        manifest.save()
 
 
 def _load_plugins_module(module_name):
@@ -106,11 +104,11 @@ def register_objects(features_list: Iterable[Feature],
         registry.register(obj)
 
 
-def preload_registered_features():
+def preload_registered_features(config_snapshot: Optional[ConfigSnapshot] = None):
     """
     Load phases and commands from all registered features.
     """
-    load_bootstrap_config()
+    load_bootstrap_config(config_snapshot)
     all_features = features.all()
     enabled_features = [f for f in all_features if not f.disabled]  # type: Iterable[Feature]
     register_objects(enabled_features, lambda f: f.phases, phases)
@@ -118,27 +116,33 @@ def preload_registered_features():
     return enabled_features
 
 
-def load_registered_features(preload=True):
+def load_registered_features(preload=True, config_snapshot: Optional[ConfigSnapshot] = None):
     """
     Load all registered features.
     """
     if preload:
-        load_bootstrap_config()
+        load_bootstrap_config(config_snapshot)
 
     all_features = features.all()
 
     for feature in all_features:
         feature.before_load()
 
-    try:
-        for feature in all_features:
-            feature.configure()
-    except ConfigureSecondPassException:
+    if config_snapshot and config_snapshot.valid and (config.eject or config.clear_cache):
+        config_snapshot.discard()
         config.clear()
         load_bootstrap_config()
 
-        for feature in all_features:
+    volatile_features = _get_volatile_features(all_features)
+
+    if config_snapshot and config_snapshot.valid:
+        for feature in volatile_features:
+            config.data[feature.name] = config_snapshot.get_raw(feature.name)
             feature.configure()
+    else:
+        raw = _configure_features(all_features, volatile_features)
+        if config_snapshot and not config.eject:
+            config_snapshot.save(raw)
 
     # migrations.compat(config.data)
 
@@ -158,6 +162,39 @@ def load_registered_features(preload=True):
     return enabled_features
 
 
+def _configure_features(all_features: Iterable[Feature], volatile_features: Iterable[Feature]):
+    """
+    Configure all features, and return configuration of volatile features as it was before validation.
+    """
+    raw = {feature.name: deepcopy(config.data.get(feature.name)) for feature in volatile_features}
+    try:
+        for feature in all_features:
+            feature.configure()
+    except ConfigureSecondPassException:
+        config.clear()
+        load_bootstrap_config()
+
+        raw = {feature.name: deepcopy(config.data.get(feature.name)) for feature in volatile_features}
+        for feature in all_features:
+            feature.configure()
+    return raw
+
+
+def _get_volatile_features(all_features: Iterable[Feature]) -> List[Feature]:
+    """
+    Get volatile features, and features depending on them.
+    """
+    volatile_names = set()
+    volatile_features = []
+    for feature in all_features:
+        dependencies = {dependency[:-len('[optional]')] if dependency.endswith('[optional]') else dependency
+                        for dependency in feature.dependencies}
+        if feature.volatile or dependencies & volatile_names:
+            volatile_names.add(feature.name)
+            volatile_features.append(feature)
+    return volatile_features
+
+
 def configure_logging(level: Union[str, int] = logging.INFO):
     """
     Configure context logger.
@@ -263,13 +300,17 @@ def parse_command_line(args: Optional[Sequence[str]] = None):
                       default=config.data.get('defaults.fail_fast', False),
                       help="Stop on first error")
     opts.add_argument('--version', action="store_true", help='Display the ddb version and check for new ones.')
+    opts.add_argument(profile_import_arg, action="store_true",
+                      help="Display the import time of each python module on exit")
 
     command_parsers = {}
 
+    selected_command_name = _get_command_name(args)
     subparsers = opts.add_subparsers(dest="command", help='Available commands')
     for command in commands.all():
         parser = command.add_parser(subparsers)
-        command.configure_parser(parser)
+        if command.name == selected_command_name:
+            command.configure_parser(parser)
         command_parsers[command.name] = parser
 
     parsed_args, unknown_args = opts.parse_known_args(args)
@@ -296,6 +337,19 @@ def parse_command_line(args: Optional[Sequence[str]] = None):
     return command, parsed_args, unknown_args
 
 
+def _get_command_name(args: Optional[Sequence[str]] = None) -> Optional[str]:
+    """
+    Get the command name from command line arguments, so only the parser of this command is configured. Global
+    options are all flags, so the command name is the first positional argument.
+    """
+    if args is None:
+        args = sys.argv[1:]
+    for arg in args:
+        if not arg.startswith('-'):
+            return arg
+    return None
+
+
 def handle_command_line(command: Command):
     """
     Execute the command and handle additional given arguments like watch mode
@@ -350,8 +404,10 @@ def main(args: Optional[Sequence[str]] = None,  # pylint:disable=too-many-statem
     initial_cwd = os.getcwd()
     try:
         load_plugins()
-        bootstrap_register_features()
-        preload_registered_features()
+        available_features = get_available_features()
+        config_snapshot = ConfigSnapshot(available_features)
+        bootstrap_register_features(config_snapshot, available_features)
+        preload_registered_features(config_snapshot)
 
         try:
             command, args, unknown_args = parse_command_line(args)
@@ -364,7 +420,7 @@ def main(args: Optional[Sequence[str]] = None,  # pylint:disable=too-many-statem
                 exc.opts.print_help()
                 raise
 
-        load_registered_features(False)
+        load_registered_features(False, config_snapshot)
         register_actions_in_event_bus(config.args.fail_fast)
 
         if config.args.version:
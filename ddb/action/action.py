@@ -1,14 +1,20 @@
 # -*- coding: utf-8 -*-
+import hashlib
+import json
 import os
+import threading
 from abc import abstractmethod, ABC
-from typing import Callable, Iterable, Union, Tuple, Optional
+from typing import Callable, Iterable, Union, Tuple, Optional, List, Dict
 
+from ddb.__version__ import __version__
 from ddb.cache import register_project_cache, caches
+from ddb.cache.cache import Cache, CacheTransaction
 from ddb.config import config
 from ddb.context import context
 from ddb.event import events
 from ddb.registry import RegistryObject
-from ddb.utils.file import write_if_different, TemplateFinder, force_remove, copy_if_different
+from ddb.utils.file import write_if_different, TemplateFinder, force_remove, copy_if_different, \
+    get_file_signature, get_content_digest, encode_content, is_content_digest_equal
 
 
 class EventBinding:
@@ -116,17 +122,38 @@ class AbstractTemplateAction(InitializableAction, ABC):  # pylint:disable=abstra
     def __init__(self):
         super().__init__()
         self.template_finder = None  # type: TemplateFinder
+        self._config_digest = None  # type: Optional[str]
+        self._batch = None  # type: Optional[List[Tuple[str, str]]]
+        self._batch_results = {}
+        self._transactions = None  # type: Optional[Dict[str, CacheTransaction]]
         register_project_cache(self._cache_key)
+        register_project_cache(self._inputs_cache_key)
 
     @property
     def _cache_key(self):
         """
-        This cache is used to store the rendered data of all targets.
+        This cache is used to store the size and digest of rendered data of all targets.
         When a template is deleted, target file will remove only if content is still the same than the generated one,
         thanks to this cache.
         """
         return "template.target." + self.__class__.__name__
 
+    @property
+    def _inputs_cache_key(self):
+        """
+        This cache is used to store the inputs of all rendered templates, i.e. a digest of the configuration and stat
+        signatures of the template, its dependencies and targets.
+        When inputs are unchanged, the template is not rendered again on next configure.
+        """
+        return "template.inputs." + self.__class__.__name__
+
+    @property
+    def _parallel_rendering(self) -> bool:
+        """
+        Should templates found while walking the project be rendered in parallel, when core.parallelism is set.
+        """
+        return False
+
     @property
     def event_bindings(self):
         def file_found_processor(file: str):
@@ -152,10 +179,13 @@ class AbstractTemplateAction(InitializableAction, ABC):  # pylint:disable=abstra
 
         return (EventBinding(events.file.found, processor=file_found_processor),
                 EventBinding(events.file.deleted, call=self.delete, processor=file_delete_processor),
-                EventBinding("file:generated", processor=file_generated_processor))
+                EventBinding("file:generated", processor=file_generated_processor),
+                EventBinding(events.file.before_found_events, call=self.begin_batch),
+                EventBinding(events.file.after_found_events, call=self.render_batch))
 
     def initialize(self):
         self.template_finder = self._build_template_finder()
+        self._config_digest = _get_config_digest() if _is_incremental() else None
 
     def delete(self, template: str, target: str):
         """
@@ -164,7 +194,8 @@ class AbstractTemplateAction(InitializableAction, ABC):  # pylint:disable=abstra
         if os.path.exists(target):
             force_remove(target)
             context.log.warning("%s removed", target)
-            caches.get(self._cache_key).pop(target)
+            self._get_cache(self._cache_key).pop(target)
+            self._pop_inputs(template)
             events.file.deleted(target)
 
     def execute(self, template: str, target: str, migrate_retries_count=0, original_template=None):
@@ -176,25 +207,22 @@ class AbstractTemplateAction(InitializableAction, ABC):  # pylint:disable=abstra
             return
 
         if original_template is None:
+            if self._is_up_to_date(template):
+                return
+            if self._batch is not None:
+                self._batch.append((template, target))
+                return
             original_template = template
 
+        template_signature = get_file_signature(template)
+        destinations = []
         try:
             for rendered, destination in self._render_template(template, target):
-                if original_template != template and 'autofix' in config.args and config.args.autofix:
-                    context.logger.info("[autofix]: %s", original_template)
-                    copy_if_different(template, original_template, log=True)
-                written = False
-                if not isinstance(rendered, bool):
-                    is_bynary = isinstance(rendered, (bytes, bytearray))
-                    written = write_if_different(destination, rendered,
-                                                 'rb' if is_bynary else 'r',
-                                                 'wb' if is_bynary else 'w',
-                                                 log_source=original_template)
-                    caches.get(self._cache_key).set(target, rendered)
-                context.mark_as_processed(template, destination)
-
-                if written or rendered is True or config.eject:
-                    events.file.generated(source=original_template, target=destination)
+                destinations.append(destination)
+                self._write_rendered(template, target, original_template, rendered, destination)
+
+            if template == original_template:
+                self._save_inputs(template, template_signature, destinations, self._render_dependencies(template))
         except Exception as render_error:  # pylint:disable=broad-except
             if migrate_retries_count > 50:
                 raise render_error
@@ -209,18 +237,151 @@ class AbstractTemplateAction(InitializableAction, ABC):  # pylint:disable=abstra
             migrate_retries_count += 1
             self.execute(template, target, migrate_retries_count, original_template)
 
+    def begin_batch(self):
+        """
+        Start collecting found templates, to render them at once when all files have been found.
+
+        Changes to caches are buffered in transactions until all files have been found.
+        """
+        self._commit_transactions()
+        self._transactions = {name: caches.get(name).transaction() for name in (self._cache_key,
+                                                                                 self._inputs_cache_key)}
+        if self._batch_enabled:
+            self._batch = []
+
+    def _get_cache(self, name: str) -> Union[Cache, CacheTransaction]:
+        if self._transactions:
+            return self._transactions[name]
+        return caches.get(name)
+
+    def _commit_transactions(self):
+        transactions, self._transactions = self._transactions, None
+        if transactions:
+            for transaction in transactions.values():
+                transaction.commit()
+
+    @property
+    def _batch_enabled(self) -> bool:
+        """
+        Should templates found while walking the project be collected and rendered at once.
+        """
+        return self._parallel_rendering and _get_parallelism() > 1
+
+    def _render_batch_items(self, batch: List[Tuple[str, str]]) -> List[Optional[Tuple[list, Optional[list]]]]:
+        """
+        Render a batch of templates, without writing them.
+        :return for each template, a tuple of rendered items and dependencies, or None if rendering has failed.
+        """
+        return _render_in_processes(self, batch)
+
+    def render_batch(self):
+        """
+        Render collected templates, then write them in the order they were found, and commit changes to caches.
+        """
+        try:
+            self._render_batch()
+        finally:
+            self._commit_transactions()
+
+    def _render_batch(self):
+        batch, self._batch = self._batch, None
+        if not batch:
+            return
+
+        signatures = [get_file_signature(template) for template, _ in batch]
+        results = self._render_batch_items(batch)
+
+        # Inline import because runner module depends on this module
+        from .runner import ActionEventBindingRunner  # pylint:disable=import-outside-toplevel,cyclic-import
+        fail_fast = getattr(config.args, "fail_fast", False)
+
+        for (template, target), signature, result in zip(batch, signatures, results):
+            if self.template_finder.get_target(template) != target:
+                # Template or target has been processed by another template in the meantime.
+                continue
+            if result is None:
+                # Render again in this process, so error is reported and autofix is supported.
+                to_call = self.execute
+            else:
+                self._batch_results[template] = (signature,) + result
+                to_call = self._write_batch_result
+            ActionEventBindingRunner(self, events.file.found.name, to_call, fail_fast=fail_fast) \
+                .run(template=template, target=target)
+
+    def _write_batch_result(self, template: str, target: str):
+        template_signature, rendered_items, dependencies = self._batch_results.pop(template)
+        for rendered, destination in rendered_items:
+            self._write_rendered(template, target, template, rendered, destination)
+        self._save_inputs(template, template_signature, [destination for _, destination in rendered_items],
+                          dependencies)
+
+    def _write_rendered(self, template: str, target: str, original_template: str,  # pylint:disable=too-many-arguments
+                        rendered: Union[str, bytes, bool], destination: str):
+        if original_template != template and 'autofix' in config.args and config.args.autofix:
+            context.logger.info("[autofix]: %s", original_template)
+            copy_if_different(template, original_template, log=True)
+        written = False
+        if not isinstance(rendered, bool):
+            is_bynary = isinstance(rendered, (bytes, bytearray))
+            written = write_if_different(destination, rendered,
+                                         'rb' if is_bynary else 'r',
+                                         'wb' if is_bynary else 'w',
+                                         log_source=original_template)
+            self._get_cache(self._cache_key).set(target, get_content_digest(encode_content(rendered, is_bynary)))
+        context.mark_as_processed(template, destination)
+
+        if written or rendered is True or config.eject:
+            events.file.generated(source=original_template, target=destination)
+
+    def _is_up_to_date(self, template: str) -> bool:
+        """
+        Check if configuration, template, dependencies and targets are unchanged since template was last rendered.
+        """
+        if not self._config_digest:
+            return False
+        inputs = self._get_cache(self._inputs_cache_key).get(template)
+        if not inputs or inputs.get("config") != self._config_digest:
+            return False
+        for signatures in (inputs["template"], inputs["dependencies"], inputs["targets"]):
+            for file, signature in signatures.items():
+                if get_file_signature(file) != signature:
+                    return False
+        for destination in inputs["targets"]:
+            context.mark_as_processed(template, destination)
+        context.log.debug("%s is up to date", template)
+        return True
+
+    def _save_inputs(self, template: str, template_signature, destinations: Iterable[str],
+                     dependencies: Optional[Iterable[str]]):
+        if not self._config_digest:
+            return
+        if dependencies is None:
+            self._pop_inputs(template)
+            return
+        self._get_cache(self._inputs_cache_key).set(template, {
+            "config": self._config_digest,
+            "template": {template: template_signature},
+            "dependencies": {dependency: get_file_signature(dependency) for dependency in dependencies},
+            "targets": {destination: get_file_signature(destination) for destination in destinations}
+        })
+
+    def _pop_inputs(self, template: str):
+        cache = self._get_cache(self._inputs_cache_key)
+        if cache.get(template) is not None:
+            cache.pop(template)
+
     def _target_is_modified(self, template: str, target: str) -> bool:
-        rendered = caches.get(self._cache_key).get(target)
-        if rendered is None:
+        content_digest = self._get_cache(self._cache_key).get(target)
+        if content_digest is None:
             return True
         if not os.path.exists(target):
-            caches.get(self._cache_key).pop(target)
+            self._get_cache(self._cache_key).pop(target)
             return True
-        is_bynary = isinstance(rendered, (bytes, bytearray))
-        read_encoding = None if is_bynary else "utf-8"
-        with open(target, mode='rb' if is_bynary else 'r', encoding=read_encoding) as read_file:
-            existing_data = read_file.read()
-        return existing_data != rendered
+        if isinstance(content_digest, (str, bytes, bytearray)):
+            # Rendered content was stored by previous versions.
+            content_digest = get_content_digest(encode_content(content_digest,
+                                                               isinstance(content_digest, (bytes, bytearray))))
+        return not is_content_digest_equal(target, content_digest)
 
     @abstractmethod
     def _build_template_finder(self) -> TemplateFinder:
@@ -234,6 +395,13 @@ class AbstractTemplateAction(InitializableAction, ABC):  # pylint:disable=abstra
         Perform template rendering to a string.
         """
 
+    def _render_dependencies(self, template: str) -> Optional[Iterable[str]]:  # pylint:disable=unused-argument
+        """
+        Files read while rendering the last template, excluding the template itself.
+        :return None if dependencies are unknown, so the template will always be rendered.
+        """
+        return None
+
     def _autofix_render_error(self,
                               template: str,
                               target: str,
@@ -244,3 +412,76 @@ class AbstractTemplateAction(InitializableAction, ABC):  # pylint:disable=abstra
         :return a temporary filepath to render again, if template has been fixed.
         """
         return None
+
+
+def _get_parallelism() -> int:
+    """
+    Number of processes to use for template rendering. Parallel rendering requires fork start method, and is disabled
+    when other threads are running (watch mode, daemon), as forking them may deadlock on locks they hold.
+    """
+    parallelism = config.data.get("core.parallelism")
+    if parallelism is None or parallelism < 2:
+        return 1
+    import multiprocessing  # pylint:disable=import-outside-toplevel
+    if "fork" not in multiprocessing.get_all_start_methods():
+        return 1
+    if threading.active_count() > 1:
+        context.log.debug("Parallel rendering is disabled, as other threads are running")
+        return 1
+    return parallelism
+
+
+_batch_action = None  # type: Optional[AbstractTemplateAction]
+
+
+def _render_batch_item(item: Tuple[str, str]):
+    """
+    Render a template inside a worker process, forked from the process holding features and configuration.
+    :return None if an error occured.
+    """
+    template, target = item
+    try:
+        rendered_items = list(_batch_action._render_template(template, target))  # pylint:disable=protected-access
+        dependencies = _batch_action._render_dependencies(template)  # pylint:disable=protected-access
+        return rendered_items, list(dependencies) if dependencies is not None else None
+    except Exception:  # pylint:disable=broad-except
+        return None
+
+
+def _render_in_processes(action: AbstractTemplateAction, batch: List[Tuple[str, str]]) -> list:
+    """
+    Render a batch of templates in a pool of forked processes, or in current process if there's a single template.
+    """
+    global _batch_action  # pylint:disable=global-statement
+    processes = min(_get_parallelism(), len(batch))
+    _batch_action = action
+    try:
+        if processes < 2:
+            return [_render_batch_item(item) for item in batch]
+        import multiprocessing  # pylint:disable=import-outside-toplevel
+        with multiprocessing.get_context("fork").Pool(processes) as pool:
+            return pool.map(_render_batch_item, batch, chunksize=1)
+    finally:
+        _batch_action = None
+
+
+def _is_incremental() -> bool:
+    """
+    Check if templates rendering can be skipped when inputs are unchanged.
+    """
+    if config.eject:
+        return False
+    return not any(getattr(config.args, arg, False) for arg in ("full", "autofix"))
+
+
+def _get_config_digest() -> Optional[str]:
+    """
+    Digest of all data that may be available in template engines.
+    """
+    args = {key: value for key, value in vars(config.args).items() if key != "full"}
+    try:
+        serialized = json.dumps([__version__, config.data.to_dict(), args, config.unknown_args],
+                                sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha1(serialized.encode("utf-8")).hexdigest()
@@ -1,9 +1,14 @@
 # -*- coding: utf-8 -*-
 from abc import abstractmethod, ABC
-from typing import Iterable, Tuple
+from collections import namedtuple
+from typing import Iterable, Tuple, Optional
 
 from ddb.registry import RegistryObject
 
+# A binary command resolved at configuration time. When workdir is defined, the working directory relative to project
+# home should be appended to it, and given as --workdir option between prefix and suffix.
+PrecompiledCommand = namedtuple('PrecompiledCommand', ['prefix', 'workdir', 'suffix'])
+
 
 class Binary(RegistryObject, ABC):
     """
@@ -48,6 +53,12 @@ class Binary(RegistryObject, ABC):
         Check if binary should be registered globally.
         """
 
+    def precompiled_command(self) -> Optional[PrecompiledCommand]:
+        """
+        Get the command resolved once for all invocations, or None if it requires runtime evaluation.
+        """
+        return None
+
     @abstractmethod
     def __eq__(self, other) -> bool:
         pass
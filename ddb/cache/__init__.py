@@ -1,10 +1,14 @@
 # -*- coding: utf-8 -*-
+import os
+from typing import Dict, Optional
 from uuid import uuid4
 
 from slugify import slugify
 
-from .cache import Cache
+from .cache import Cache, get_cache_directory
+from .http_cache import HttpCache
 from .shelve_cache import ShelveCache
+from .sqlite_cache import SqliteCache
 from ..config import config
 from ..registry import Registry
 
@@ -12,26 +16,54 @@ caches = Registry(Cache, 'Cache')  # type: Registry[Cache]
 
 global_cache_name = 'global'
 requests_cache_name = 'requests'
+autodetect_cache_name = 'autodetect'
 
 project_cache_name = 'project'
 project_binary_cache_name = 'binary'
 
+cache_backends = {'shelve': ShelveCache, 'sqlite': SqliteCache}
+default_cache_backend = 'sqlite'
 
-def register_project_cache(cache_name):
+default_http_cache_max_size = 256 * 1024 * 1024
+
+
+def open_cache(namespace: str, eternal=False, store: Optional[str] = None) -> Cache:
+    """
+    Creates a cache with given namespace, using the backend from core.cache_backend configuration.
+    """
+    backend = config.data.get('core.cache_backend') or default_cache_backend
+    return cache_backends[backend](namespace, eternal=eternal, store=store)
+
+
+_project_cache_uuids = {}  # type: Dict[str, str]
+
+
+def get_project_cache_uuid() -> str:
     """
-    Creates a ShelveCache for current project, and register it with given name.
+    Get the UUID of current project cache store, resolved once per process.
     """
-    registered_projects_cache_name = ShelveCache('project-cache-uuid', eternal=True)
-    try:
-        project_cache_uuid = registered_projects_cache_name.get(config.paths.project_home)
-        if project_cache_uuid is None:
-            project_cache_uuid = str(uuid4())
-            registered_projects_cache_name.set(config.paths.project_home, project_cache_uuid)
-    finally:
-        registered_projects_cache_name.close()
+    project_home = config.paths.project_home
+    project_cache_uuid = _project_cache_uuids.get(project_home)
+    if project_cache_uuid is None:
+        registered_projects_cache_name = open_cache('project-cache-uuid', eternal=True)
+        try:
+            project_cache_uuid = registered_projects_cache_name.get(project_home)
+            if project_cache_uuid is None:
+                project_cache_uuid = str(uuid4())
+                registered_projects_cache_name.set(project_home, project_cache_uuid)
+        finally:
+            registered_projects_cache_name.close()
+        _project_cache_uuids[project_home] = project_cache_uuid
+    return project_cache_uuid
 
-    namespace = [item for item in (project_cache_uuid, cache_name) if item]
-    cache = ShelveCache(slugify('.'.join(namespace), regex_pattern=r'[^-a-z0-9_\.]+'))
+
+def register_project_cache(cache_name):
+    """
+    Creates a cache for current project, and register it with given name.
+
+    All caches of the project are namespaces of the same store, named with project cache UUID.
+    """
+    cache = open_cache(slugify(cache_name, regex_pattern=r'[^-a-z0-9_\.]+'), store=get_project_cache_uuid())
 
     caches.register(cache, cache_name)
     return cache
@@ -39,9 +71,9 @@ def register_project_cache(cache_name):
 
 def register_global_cache(cache_name):
     """
-    Creates a ShelveCache shared for all projects, and register it with given name.
+    Creates a cache shared for all projects, and register it with given name.
     """
-    cache = ShelveCache(slugify(cache_name, regex_pattern=r'[^-a-z0-9_\.]+'))
+    cache = open_cache(slugify(cache_name, regex_pattern=r'[^-a-z0-9_\.]+'))
     caches.register(cache, cache_name)
     return cache
 
@@ -65,3 +97,13 @@ def requests_cache() -> Cache:
     Get current requests cache.
     """
     return caches.get(requests_cache_name)
+
+
+def http_cache() -> HttpCache:
+    """
+    Get HTTP cache, storing responses of outbound GET requests in requests cache.
+    """
+    if not caches.has(requests_cache_name):
+        register_global_cache(requests_cache_name)
+    max_size = config.data.get('core.http_cache_max_size', default_http_cache_max_size)
+    return HttpCache(requests_cache(), os.path.join(get_cache_directory(), requests_cache_name + ".bodies"), max_size)
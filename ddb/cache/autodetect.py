@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+import time
+from typing import Callable, TypeVar, Union, Tuple
+
+from . import caches, register_global_cache, autodetect_cache_name
+from .cache import Cache
+from ..config import config
+
+T = TypeVar('T')
+
+
+def autodetect(config_keys: Union[str, Tuple[str, ...]], detect: Callable[[], T], *inputs) -> T:
+    """
+    Detect configuration default values from host state, like network interfaces or users database.
+
+    Detected value is stored in a global cache, and reused for core.autodetect_ttl seconds as long as given inputs are
+    unchanged. Configuration keys of values restored from cache are added to config.cached_defaults.
+    """
+    if isinstance(config_keys, str):
+        config_keys = (config_keys,)
+
+    ttl = config.data.get('core.autodetect_ttl')
+    if not ttl or ttl <= 0:
+        return detect()
+
+    cache = _get_autodetect_cache()
+    key = repr(config_keys + inputs)
+
+    cached = cache.get(key)
+    if cached and 0 <= time.time() - cached["time"] < ttl:
+        config.cached_defaults.update(config_keys)
+        return cached["value"]
+
+    value = detect()
+    cache.set(key, {"time": time.time(), "value": value})
+    cache.flush()
+    return value
+
+
+def _get_autodetect_cache() -> Cache:
+    if caches.has(autodetect_cache_name):
+        return caches.get(autodetect_cache_name)
+    return register_global_cache(autodetect_cache_name)
@@ -1,5 +1,24 @@
 # -*- coding: utf-8 -*-
+import os
+import tempfile
 from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Mapping
+
+from ..config import config
+
+_missing = object()
+
+
+def get_cache_directory() -> str:
+    """
+    Get the directory where caches are stored, creating it if it doesn't exist.
+    """
+    if config.paths.home:
+        path = os.path.join(config.paths.home, "cache")
+    else:
+        path = os.path.join(tempfile.gettempdir(), "ddb", "cache")
+    os.makedirs(path, exist_ok=True)
+    return path
 
 
 class Cache(ABC):
@@ -40,6 +59,40 @@ class Cache(ABC):
         Remove all cache entries.
         """
 
+    def get_many(self, keys: Iterable[str], default=None) -> Dict[str, Any]:
+        """
+        Get many cache entries values at once, with default value for keys that doesn't exist.
+        """
+        return {key: self.get(key, default) for key in keys}
+
+    def set_many(self, items: Mapping[str, Any]):
+        """
+        Set many cache entries values at once.
+        """
+        for key, data in items.items():
+            self.set(key, data)
+
+    def pop_many(self, keys: Iterable[str]):
+        """
+        Remove many cache entries at once, ignoring keys that doesn't exist.
+        """
+        for key in keys:
+            if key in self:
+                self.pop(key)
+
+    def apply(self, items: Mapping[str, Any], popped_keys: Iterable[str]):
+        """
+        Remove and set many cache entries at once, as a single write when supported by the backend.
+        """
+        self.pop_many(popped_keys)
+        self.set_many(items)
+
+    def transaction(self) -> 'CacheTransaction':
+        """
+        Start a transaction, buffering changes in memory until it's committed.
+        """
+        return CacheTransaction(self)
+
     def close(self):
         """
         Close the cache access.
@@ -54,3 +107,96 @@ class Cache(ABC):
         """
         Check if key exists.
         """
+        return self.get(key, _missing) is not _missing
+
+
+class CacheTransaction:
+    """
+    Changes to a cache buffered in memory, and written at once with apply when committed.
+
+    It can be used as a context manager, committing on exit or discarding changes if an exception is raised.
+    """
+
+    def __init__(self, cache: Cache):
+        self.cache = cache
+        self._set = {}
+        self._popped = set()
+
+    def get(self, key: str, default=None):
+        """
+        Get a cache entry value, including uncommitted changes.
+        """
+        if key in self._set:
+            return self._set[key]
+        if key in self._popped:
+            return default
+        return self.cache.get(key, default)
+
+    def get_many(self, keys: Iterable[str], default=None) -> Dict[str, Any]:
+        """
+        Get many cache entries values at once, including uncommitted changes.
+        """
+        keys = list(keys)
+        values = self.cache.get_many([key for key in keys if key not in self._set and key not in self._popped],
+                                     default)
+        for key in keys:
+            if key in self._set:
+                values[key] = self._set[key]
+            elif key in self._popped:
+                values[key] = default
+        return values
+
+    def keys(self):
+        """
+        Get all cache keys, including uncommitted changes.
+        """
+        keys = [key for key in self.cache.keys() if key not in self._popped and key not in self._set]
+        keys.extend(self._set.keys())
+        return keys
+
+    def set(self, key: str, data):
+        """
+        Set a cache entry value.
+        """
+        self._popped.discard(key)
+        self._set[key] = data
+
+    def pop(self, key: str):
+        """
+        Remove a cache entry.
+        """
+        value = self.get(key, _missing)
+        if value is _missing:
+            raise KeyError(key)
+        self._set.pop(key, None)
+        self._popped.add(key)
+        return value
+
+    def commit(self):
+        """
+        Write buffered changes to the cache, and flush it.
+        """
+        popped, self._popped = self._popped, set()
+        changes, self._set = self._set, {}
+        if popped or changes:
+            self.cache.apply(changes, popped)
+        self.cache.flush()
+
+    def rollback(self):
+        """
+        Discard buffered changes.
+        """
+        self._set = {}
+        self._popped = set()
+
+    def __contains__(self, key):
+        return self.get(key, _missing) is not _missing
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
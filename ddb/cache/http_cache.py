@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+import email.utils
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from typing import Dict, Optional
+
+from .cache import Cache
+from ..context import context
+
+_max_age_re = re.compile(r"(?:^|[\s,])max-age\s*=\s*\"?(\d+)")
+_chunk_size = 64 * 1024
+_charset_re = re.compile(r"charset\s*=\s*\"?([\w.:-]+)", re.IGNORECASE)
+
+# Response headers updated from a 304 Not Modified response.
+_revalidated_headers = ("cache-control", "content-location", "date", "etag", "expires", "last-modified", "vary")
+
+
+class HttpCacheResponse:
+    """
+    A successful response of a GET request, with body stored in HTTP cache directory.
+    """
+
+    def __init__(self, url: str, headers: Dict[str, str], filename: str, from_cache: bool):
+        self.url = url
+        self.headers = headers
+        self.filename = filename
+        self.from_cache = from_cache
+
+    @property
+    def content(self) -> bytes:
+        """
+        Body of the response, as bytes.
+        """
+        with open(self.filename, "rb") as body:
+            return body.read()
+
+    @property
+    def encoding(self) -> str:
+        """
+        Encoding of the response body, from content-type header.
+        """
+        match = _charset_re.search(self.headers.get("content-type", ""))
+        return match.group(1) if match else "utf-8"
+
+    @property
+    def text(self) -> str:
+        """
+        Body of the response, as text.
+        """
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self):
+        """
+        Body of the response, parsed as json.
+        """
+        return json.loads(self.text)
+
+
+class HttpCache:
+    """
+    A cache for GET requests, storing response headers in given cache and bodies as files in given directory.
+
+    Cached responses are used as long as they are fresh according to cache-control and expires headers, and are
+    revalidated with etag and last-modified headers otherwise. Bodies are streamed to disk, and the least recently
+    used ones are evicted when total size exceeds max_size.
+    """
+
+    def __init__(self, cache: Cache, directory: str, max_size: Optional[int] = None):
+        self.cache = cache
+        self.directory = directory
+        self.max_size = max_size
+        os.makedirs(directory, exist_ok=True)
+
+    def get(self, url: str, **kwargs) -> HttpCacheResponse:
+        """
+        Perform a GET request, or get the response from cache.
+
+        Keyword arguments are given to requests.get.
+        """
+        import requests  # pylint:disable=import-outside-toplevel
+
+        filename = self._get_body_filename(url)
+        entry = self._get_entry(url, filename)
+        if entry and self._is_fresh(entry):
+            return self._use_entry(url, entry, filename)
+
+        headers = dict(kwargs.pop("headers", None) or {})
+        if entry:
+            if "etag" in entry["headers"]:
+                headers["If-None-Match"] = entry["headers"]["etag"]
+            if "last-modified" in entry["headers"]:
+                headers["If-Modified-Since"] = entry["headers"]["last-modified"]
+
+        try:
+            with requests.get(url, headers=headers, stream=True, allow_redirects=True, **kwargs) as response:
+                if entry and response.status_code == 304:
+                    for header in _revalidated_headers:
+                        if header in response.headers:
+                            entry["headers"][header] = response.headers[header]
+                    entry["stored"] = time.time()
+                    return self._use_entry(url, entry, filename)
+
+                response.raise_for_status()
+                self._download(response, filename)
+                entry = {"headers": {key.lower(): value for key, value in response.headers.items()},
+                         "size": os.path.getsize(filename),
+                         "stored": time.time(),
+                         "accessed": time.time()}
+        except (requests.ConnectionError, requests.Timeout) as error:
+            if not entry:
+                raise
+            context.log.warning("Using cached response of %s (%s)", url, error)
+            return self._use_entry(url, entry, filename)
+
+        self.cache.set(url, entry)
+        self._evict(url)
+        return HttpCacheResponse(url, entry["headers"], filename, False)
+
+    def _get_body_filename(self, url: str) -> str:
+        return os.path.join(self.directory, hashlib.sha1(url.encode("utf-8")).hexdigest())
+
+    def _get_entry(self, url: str, filename: str) -> Optional[Dict]:
+        try:
+            entry = self.cache.get(url)
+        except Exception:  # pylint:disable=broad-except
+            entry = None
+        if not isinstance(entry, dict) or not os.path.exists(filename):
+            # Entries stored before the HTTP cache were whole pickled responses.
+            return None
+        return entry
+
+    def _use_entry(self, url: str, entry: Dict, filename: str) -> HttpCacheResponse:
+        entry["accessed"] = time.time()
+        self.cache.set(url, entry)
+        return HttpCacheResponse(url, entry["headers"], filename, True)
+
+    @staticmethod
+    def _is_fresh(entry: Dict) -> bool:
+        headers = entry["headers"]
+        cache_control = headers.get("cache-control", "").lower()
+        if "no-cache" in cache_control or "no-store" in cache_control:
+            return False
+        match = _max_age_re.search(cache_control)
+        if match:
+            return time.time() - entry["stored"] < int(match.group(1))
+        if "expires" in headers:
+            try:
+                return time.time() < email.utils.parsedate_to_datetime(headers["expires"]).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def _download(self, response, filename: str):
+        """
+        Stream response body to a temporary file, then move it to filename.
+        """
+        with tempfile.NamedTemporaryFile(dir=self.directory, prefix=".download-", delete=False) as tmp:
+            try:
+                for chunk in response.iter_content(_chunk_size):
+                    tmp.write(chunk)
+            except BaseException:
+                tmp.close()
+                os.remove(tmp.name)
+                raise
+        os.replace(tmp.name, filename)
+
+    def _evict(self, url: str):
+        """
+        Remove least recently used responses until total size of bodies fits in max_size.
+        """
+        if not self.max_size:
+            return
+        entries = []
+        total_size = 0
+        for key in self.cache.keys():
+            entry = self._get_entry(key, self._get_body_filename(key))
+            if entry:
+                entries.append((entry["accessed"], key, entry["size"]))
+                total_size += entry["size"]
+            else:
+                self.cache.pop_many([key])
+        entries.sort()
+        for _, key, size in entries:
+            if total_size <= self.max_size:
+                break
+            if key == url:
+                continue
+            self.cache.pop_many([key])
+            try:
+                os.remove(self._get_body_filename(key))
+            except FileNotFoundError:
+                pass
+            total_size -= size
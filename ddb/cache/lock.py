@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+import os
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:  # pragma: no cover
+    fcntl = None
+    import msvcrt  # pylint:disable=import-error
+
+
+class FileLock:
+    """
+    A reader/writer lock shared between processes, relying on a lock file.
+
+    Many readers can hold the shared lock at once, and the exclusive lock is held by a single writer.
+    On platforms without fcntl, the shared lock is exclusive too.
+    Threads of a same process are serialized, as file locks are held by process.
+    """
+
+    def __init__(self, filename: str):
+        self.filename = filename
+        self._file = None
+        self._thread_lock = threading.Lock()
+
+    def _get_file(self):
+        if self._file is None:
+            self._file = open(self.filename, "a+b")  # pylint:disable=consider-using-with
+        return self._file
+
+    @contextmanager
+    def acquire(self, exclusive=False):
+        """
+        Acquire the lock, shared by default, or exclusive.
+        """
+        with self._thread_lock:
+            fileno = self._get_file().fileno()
+            if fcntl:
+                fcntl.flock(fileno, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            else:  # pragma: no cover
+                os.lseek(fileno, 0, os.SEEK_SET)
+                msvcrt.locking(fileno, msvcrt.LK_LOCK, 1)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(fileno, fcntl.LOCK_UN)
+                else:  # pragma: no cover
+                    os.lseek(fileno, 0, os.SEEK_SET)
+                    msvcrt.locking(fileno, msvcrt.LK_UNLCK, 1)
+
+    def shared(self):
+        """
+        Acquire the shared lock, for readers.
+        """
+        return self.acquire(False)
+
+    def exclusive(self):
+        """
+        Acquire the exclusive lock, for writers.
+        """
+        return self.acquire(True)
+
+    def close(self):
+        """
+        Close the lock file.
+        """
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -2,9 +2,11 @@
 import dbm
 import os
 import shelve
-import tempfile
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Mapping, Optional
 
-from .cache import Cache
+from .cache import Cache, get_cache_directory
+from .lock import FileLock
 from ..config import config
 
 # Easy fix for https://github.com/inetum-orleans/docker-devbox-ddb/issues/49
@@ -16,83 +18,238 @@ if 'dbm.dumb' in _dbm_names:
     _dbm_names.insert(0, 'dbm.dumb')
     dbm._names = _dbm_names
 
+_missing = object()
+_deleted = object()
+
+
+def shelve_files(basename: str) -> List[str]:
+    """
+    Existing files of a shelve stored with given basename.
+    """
+    return [filename for filename in (basename, f"{basename}.dat", f"{basename}.dir", f"{basename}.bak")
+            if os.path.isfile(filename)]
+
 
 class ShelveCache(Cache):
     """
     A cache implementation relying of shelve module.
+
+    When a store is given, shelve files are prefixed with the store name.
+
+    As shelve doesn't support concurrent access, changes are kept in memory and written on flush and close, holding
+    an exclusive lock on the shelve. Readers hold a shared lock, and reopen the shelve when another process has written
+    to it. Use get_many to read many entries while acquiring the lock once.
     """
 
-    def __init__(self, namespace: str, eternal=False):
+    def __init__(self, namespace: str, eternal=False, store: Optional[str] = None):
         super().__init__(namespace)
 
         clear_cache = config.clear_cache and not eternal
 
-        if config.paths.home:
-            path = os.path.join(config.paths.home, "cache")
-        else:
-            path = os.path.join(tempfile.gettempdir(), "ddb", "cache")
-        os.makedirs(path, exist_ok=True)
-
-        self.basename = os.path.join(path, self._namespace)
-        if clear_cache:
-            self._delete_files(self.basename)
-        try:
-            self._shelf = shelve.open(self.basename)
-        except Exception as open_error:  # pylint:disable=broad-except
-            if self._delete_files(self.basename):
-                try:
-                    self._shelf = shelve.open(self.basename)
-                except Exception as fallback_error:  # pylint:disable=broad-except
-                    raise open_error from fallback_error
-            else:
-                raise open_error
-        if clear_cache:
-            self._shelf.clear()
+        path = get_cache_directory()
+
+        self.basename = os.path.join(path, '.'.join((store, namespace)) if store else namespace)
+        self._lock = FileLock(self.basename + ".lock")
+        self._shelf = None  # type: Optional[shelve.Shelf]
+        self._signature = None
+        self._changes = {}  # type: Dict[str, Any]
+        self._cleared = False
+        self._closed = False
+
+        with self._lock.exclusive():
+            if clear_cache:
+                self._delete_files(self.basename)
+            try:
+                self._open_shelf()
+            except Exception as open_error:  # pylint:disable=broad-except
+                if self._delete_files(self.basename):
+                    try:
+                        self._open_shelf()
+                    except Exception as fallback_error:  # pylint:disable=broad-except
+                        raise open_error from fallback_error
+                else:
+                    raise open_error
 
     @staticmethod
     def _delete_files(basename):
         deleted = False
-        for filename in (basename, f"{basename}.dat", f"{basename}.dir"):
-            if os.path.exists(filename):
-                os.remove(filename)
-                deleted = True
+        for filename in shelve_files(basename):
+            os.remove(filename)
+            deleted = True
         return deleted
 
+    def _get_signature(self):
+        """
+        Signature of shelve files, changing each time the shelve is written.
+        """
+        for filename in (f"{self.basename}.dir", self.basename):
+            try:
+                stat = os.stat(filename)
+            except OSError:
+                continue
+            return stat.st_ino, stat.st_mtime_ns, stat.st_size
+        return None
+
+    def _open_shelf(self):
+        """
+        Open the shelve, creating it if it doesn't exist yet.
+        """
+        self._close_shelf()
+        self._signature = self._get_signature()
+        self._shelf = shelve.open(self.basename)
+        if self._signature is None:
+            self._sync_shelf()
+
+    def _sync_shelf(self):
+        """
+        Write the shelve index, and update signature.
+        """
+        self._shelf.sync()
+        # dbm.dumb writes it's index again on close once modified, even if it has been synced. Reset this flag, so
+        # closing an outdated shelve never overwrites the index written by another process.
+        if hasattr(self._shelf.dict, "_modified"):
+            self._shelf.dict._modified = False  # pylint:disable=protected-access
+        self._signature = self._get_signature()
+
+    @contextmanager
+    def _reading(self):
+        """
+        Hold the shared lock, with the shelve opened and up to date.
+        """
+        if self._closed:
+            raise ValueError("invalid operation on closed cache")
+        with self._lock.shared():
+            if self._shelf is None or self._get_signature() != self._signature:
+                self._open_shelf()
+            yield self._shelf
+
+    def _close_shelf(self):
+        if self._shelf is not None:
+            self._shelf.close()
+            self._shelf = None
+
+    def _read(self, key: str, default=None):
+        with self._reading() as shelf:
+            try:
+                return shelf.get(key, default)
+            except AttributeError:
+                # This can occur when class definition hash change.
+                self._changes[key] = _deleted
+                raise
+
     def close(self):
-        self._shelf.close()
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._closed = True
+            self._close_shelf()
+            self._lock.close()
+
+    def __del__(self):
+        # Pending changes are written when the cache is garbage collected, like shelve does.
+        if getattr(self, "_closed", True) is False:
+            self.close()
 
     def flush(self):
-        self._shelf.sync()
+        if self._closed:
+            raise ValueError("invalid operation on closed cache")
+        if not self._changes and not self._cleared:
+            return
+        with self._lock.exclusive():
+            if self._shelf is None or self._get_signature() != self._signature:
+                self._open_shelf()
+            try:
+                if self._cleared:
+                    self._shelf.clear()
+                for key, data in self._changes.items():
+                    if data is not _deleted:
+                        self._shelf[key] = data
+                    elif key in self._shelf:
+                        del self._shelf[key]
+            finally:
+                self._sync_shelf()
+        self._changes = {}
+        self._cleared = False
 
     def get(self, key: str, default=None):
-        try:
-            return self._shelf.get(key, default)
-        except AttributeError:
-            # This can occur when class definition hash change.
-            self._delete_files(self.basename)
-            raise
+        if self._closed:
+            raise ValueError("invalid operation on closed cache")
+        data = self._changes.get(key, _missing)
+        if data is _deleted:
+            return default
+        if data is not _missing:
+            return data
+        if self._cleared:
+            return default
+        return self._read(key, default)
+
+    def get_many(self, keys: Iterable[str], default=None) -> Dict[str, Any]:
+        if self._closed:
+            raise ValueError("invalid operation on closed cache")
+        values = {}
+        missing = []
+        for key in keys:
+            data = self._changes.get(key, _missing)
+            if data is _deleted or (data is _missing and self._cleared):
+                values[key] = default
+            elif data is _missing:
+                missing.append(key)
+            else:
+                values[key] = data
+        if missing:
+            with self._reading() as shelf:
+                for key in missing:
+                    try:
+                        values[key] = shelf.get(key, default)
+                    except AttributeError:
+                        # This can occur when class definition hash change.
+                        self._changes[key] = _deleted
+                        values[key] = default
+        return values
 
     def keys(self):
-        return self._shelf.keys()
+        if self._cleared:
+            keys = set()
+        else:
+            with self._reading() as shelf:
+                keys = set(shelf.keys())
+        for key, data in self._changes.items():
+            if data is _deleted:
+                keys.discard(key)
+            else:
+                keys.add(key)
+        return list(keys)
 
     def set(self, key: str, data):
-        self._shelf[key] = data
+        if self._closed:
+            raise ValueError("invalid operation on closed cache")
+        self._changes[key] = data
+
+    def set_many(self, items: Mapping[str, Any]):
+        if self._closed:
+            raise ValueError("invalid operation on closed cache")
+        self._changes.update(items)
+
+    def pop_many(self, keys: Iterable[str]):
+        if self._closed:
+            raise ValueError("invalid operation on closed cache")
+        for key in keys:
+            self._changes[key] = _deleted
 
     def pop(self, key: str):
-        try:
-            return self._shelf.pop(key)
-        except AttributeError:
-            # This can occur when class definition hash change.
-            self._delete_files(self.basename)
-            raise
+        data = self.get(key, _missing)
+        if data is _missing:
+            raise KeyError(key)
+        self._changes[key] = _deleted
+        return data
 
     def clear(self):
-        try:
-            self._shelf.clear()
-        except AttributeError:
-            # This can occur when class definition hash change.
-            self._delete_files(self.basename)
-            raise
+        if self._closed:
+            raise ValueError("invalid operation on closed cache")
+        self._changes = {}
+        self._cleared = True
 
     def __contains__(self, key):
-        return self._shelf.__contains__(key)
+        return self.get(key, _missing) is not _missing
@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+import os
+import pickle
+import shelve
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+from .cache import Cache, get_cache_directory
+from .shelve_cache import shelve_files
+from ..config import config
+
+_missing = object()
+
+# Time to wait for another process to release the write lock, in seconds.
+_timeout = 30.0
+
+# Number of keys read in a single query, below sqlite default limit of 999 variables.
+_batch_size = 500
+
+
+class _SharedConnection:
+    """
+    A connection shared by caches opened on the same file in current process.
+    """
+
+    def __init__(self, connection: sqlite3.Connection):
+        self.connection = connection
+        self.references = 1
+        self.lock = threading.RLock()
+        self.pid = os.getpid()
+
+
+_connections = {}  # type: Dict[str, _SharedConnection]
+
+
+class SqliteCache(Cache):
+    """
+    A cache implementation relying on a sqlite database in WAL mode, stored in a single file.
+
+    Entries are pickled like shelve does, and indexed by key, so writing an entry doesn't rewrite the whole index.
+
+    Each change is written in it's own short transaction, so concurrent ddb processes never wait long for the write
+    lock, and readers never wait for writers as they read the last committed state from the WAL.
+
+    When a store is given, the cache is a namespace inside the store file, shared by all caches of this store.
+    """
+
+    def __init__(self, namespace: str, eternal=False, store: Optional[str] = None):
+        super().__init__(namespace)
+
+        clear_cache = config.clear_cache and not eternal
+
+        path = get_cache_directory()
+
+        self.basename = os.path.join(path, '.'.join((store, namespace)) if store else namespace)
+        self.filename = os.path.join(path, store if store else namespace) + ".sqlite"
+
+        if clear_cache:
+            self._delete_shelve_files()
+
+        shared = _connections.get(self.filename)
+        if shared and shared.pid == os.getpid():
+            shared.references += 1
+        else:
+            try:
+                connection = self._connect(self.filename)
+            except sqlite3.DatabaseError as open_error:
+                if self._delete_files(self.filename):
+                    connection = self._connect(self.filename)
+                else:
+                    raise open_error
+            shared = _SharedConnection(connection)
+            _connections[self.filename] = shared
+        self._shared = shared  # type: Optional[_SharedConnection]
+        self._connection = shared.connection  # type: Optional[sqlite3.Connection]
+
+        if clear_cache:
+            self.clear()
+        elif shelve_files(self.basename):
+            self._migrate_from_shelve()
+
+    @staticmethod
+    def _connect(filename: str) -> sqlite3.Connection:
+        connection = sqlite3.connect(filename, timeout=_timeout, isolation_level=None, check_same_thread=False)
+        try:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute("CREATE TABLE IF NOT EXISTS entries "
+                               "(namespace TEXT NOT NULL, key TEXT NOT NULL, value BLOB NOT NULL, "
+                               "PRIMARY KEY (namespace, key))")
+        except sqlite3.DatabaseError:
+            connection.close()
+            raise
+        return connection
+
+    def _migrate_from_shelve(self):
+        """
+        Import entries from the shelve files previously used for this namespace, then remove those files.
+        """
+        items = {}
+        try:
+            with shelve.open(self.basename, flag="r") as shelf:
+                for key in shelf.keys():  # pylint:disable=consider-using-dict-items
+                    try:
+                        items[key] = shelf[key]
+                    except Exception:  # pylint:disable=broad-except
+                        continue
+        except Exception:  # pylint:disable=broad-except
+            pass
+        self.set_many(items)
+        self._delete_shelve_files()
+
+    def _delete_shelve_files(self):
+        for filename in shelve_files(self.basename):
+            try:
+                os.remove(filename)
+            except FileNotFoundError:
+                # Another process has removed it.
+                pass
+
+    @staticmethod
+    def _delete_files(filename):
+        deleted = False
+        for candidate in (filename, f"{filename}-wal", f"{filename}-shm"):
+            if os.path.exists(candidate):
+                os.remove(candidate)
+                deleted = True
+        return deleted
+
+    def _execute(self, sql: str, parameters=()):
+        if self._connection is None:
+            raise ValueError("invalid operation on closed cache")
+        return self._connection.execute(sql, parameters)
+
+    def _executemany(self, sql: str, parameters: Iterable):
+        with self._transaction():
+            return self._connection.executemany(sql, parameters)
+
+    @contextmanager
+    def _transaction(self):
+        """
+        Run statements in a single transaction, acquiring the write lock immediately.
+        """
+        if self._connection is None:
+            raise ValueError("invalid operation on closed cache")
+        with self._shared.lock:
+            if self._connection.in_transaction:
+                yield
+                return
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def close(self):
+        if self._connection is None:
+            return
+        shared, self._shared, self._connection = self._shared, None, None
+        shared.references -= 1
+        if shared.references > 0:
+            return
+        if _connections.get(self.filename) is shared:
+            _connections.pop(self.filename)
+        if shared.pid == os.getpid():
+            shared.connection.close()
+
+    def __del__(self):
+        # Release the shared connection when the cache is garbage collected, like shelve does.
+        if getattr(self, "_connection", None) is not None:
+            self.close()
+
+    def flush(self):
+        if self._connection is None:
+            raise ValueError("invalid operation on closed cache")
+
+    def get(self, key: str, default=None):
+        row = self._execute("SELECT value FROM entries WHERE namespace = ? AND key = ?",
+                            (self._namespace, key)).fetchone()
+        if row is None:
+            return default
+        try:
+            return pickle.loads(row[0])
+        except AttributeError:
+            # This can occur when class definition hash change.
+            self._execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (self._namespace, key))
+            raise
+
+    def get_many(self, keys: Iterable[str], default=None) -> Dict[str, Any]:
+        keys = list(keys)
+        values = dict.fromkeys(keys, default)
+        for offset in range(0, len(keys), _batch_size):
+            batch = keys[offset:offset + _batch_size]
+            rows = self._execute("SELECT key, value FROM entries WHERE namespace = ? AND key IN (%s)" %
+                                 ", ".join("?" * len(batch)), (self._namespace, *batch))
+            for key, value in rows.fetchall():
+                try:
+                    values[key] = pickle.loads(value)
+                except AttributeError:
+                    # This can occur when class definition hash change.
+                    self._execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (self._namespace, key))
+        return values
+
+    def keys(self):
+        return [row[0] for row in self._execute("SELECT key FROM entries WHERE namespace = ?", (self._namespace,))]
+
+    def set(self, key: str, data):
+        self._execute("INSERT OR REPLACE INTO entries (namespace, key, value) VALUES (?, ?, ?)",
+                      (self._namespace, key, pickle.dumps(data, protocol=pickle.DEFAULT_PROTOCOL)))
+
+    def set_many(self, items: Mapping[str, Any]):
+        self._executemany("INSERT OR REPLACE INTO entries (namespace, key, value) VALUES (?, ?, ?)",
+                          [(self._namespace, key, pickle.dumps(data, protocol=pickle.DEFAULT_PROTOCOL))
+                           for key, data in items.items()])
+
+    def pop_many(self, keys: Iterable[str]):
+        self._executemany("DELETE FROM entries WHERE namespace = ? AND key = ?",
+                          [(self._namespace, key) for key in keys])
+
+    def apply(self, items: Mapping[str, Any], popped_keys: Iterable[str]):
+        with self._transaction():
+            self.pop_many(popped_keys)
+            self.set_many(items)
+
+    def pop(self, key: str):
+        with self._transaction():
+            value = self.get(key, _missing)
+            if value is _missing:
+                raise KeyError(key)
+            self._execute("DELETE FROM entries WHERE namespace = ? AND key = ?", (self._namespace, key))
+        return value
+
+    def clear(self):
+        self._execute("DELETE FROM entries WHERE namespace = ?", (self._namespace,))
+
+    def __contains__(self, key):
+        return self._execute("SELECT 1 FROM entries WHERE namespace = ? AND key = ?",
+                             (self._namespace, key)).fetchone() is not None
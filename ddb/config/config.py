@@ -5,7 +5,7 @@ from collections import namedtuple
 from copy import deepcopy
 from os.path import exists
 from pathlib import Path
-from typing import Union, Iterable, Dict
+from typing import Union, Iterable, Dict, Tuple, Set
 
 import yaml
 
@@ -59,7 +59,7 @@ class Config:  # pylint:disable=too-many-instance-attributes
     """
     # Static default/overrides values for configuration, can be modified from code mainly for tests purpose
     defaults = None
-    overrides = lambda config: config
+    overrides = None
 
     def __init__(self,
                  paths: Union[ConfigPaths, None] = None,
@@ -75,6 +75,7 @@ class Config:  # pylint:disable=too-many-instance-attributes
         self.filenames = filenames
         self.extensions = extensions
         self.env_additions = {}
+        self.cached_defaults = set()
         self.data = MigrationsDotty()
         self.paths = paths if paths else get_default_config_paths(env_prefix, filenames, extensions)
         self.cwd = cwd
@@ -94,6 +95,7 @@ class Config:  # pylint:disable=too-many-instance-attributes
         """
         self.data.clear()
         self.env_additions.clear()
+        self.cached_defaults.clear()
 
     @property
     def project_configuration_file(self):
@@ -192,7 +194,7 @@ class Config:  # pylint:disable=too-many-instance-attributes
         """
         Load configuration data from files. Variable in 'env_key' key will be placed loaded as environment variables.
         """
-        defaults_to_apply = {} if Config.defaults is None else dict(Config.defaults)
+        defaults_to_apply = {} if Config.defaults is None else deepcopy(Config.defaults)
         if defaults:
             # Config.defaults should have the priority over given defaults.
             defaults_to_apply = config_merger.merge(defaults, defaults_to_apply)
@@ -207,7 +209,29 @@ class Config:  # pylint:disable=too-many-instance-attributes
             prefix = self.env_override_prefix
         prefix = prefix.upper()
 
-        environ_value = os.environ.get(prefix)
+        environ, prefixes = self._get_environ_overrides(prefix)
+        if not environ:
+            return data
+
+        return self._apply_environ_overrides(data, prefix, environ, prefixes)
+
+    @staticmethod
+    def _get_environ_overrides(prefix: str) -> Tuple[Dict[str, str], Set[str]]:
+        """
+        Get environment variables starting with given prefix, and all prefixes of those variable names. Configuration
+        tree is browsed only where a variable name starts with the current key.
+        """
+        environ = {name: value for name, value in os.environ.items() if name.startswith(prefix)}
+
+        prefixes = set()
+        for name in environ:
+            for i in range(len(prefix), len(name) + 1):
+                prefixes.add(name[:i])
+
+        return environ, prefixes
+
+    def _apply_environ_overrides(self, data, prefix: str, environ: Dict[str, str], prefixes: Set[str]):
+        environ_value = environ.get(prefix)
         if environ_value:
             if environ_value.lower() == str(True):
                 environ_value = True
@@ -224,16 +248,17 @@ class Config:  # pylint:disable=too-many-instance-attributes
                 key_prefix = prefix + "_" + name
                 key_prefix = key_prefix.upper()
 
-                data[name] = self.apply_environ_overrides(value, key_prefix)
+                if key_prefix in prefixes:
+                    data[name] = self._apply_environ_overrides(value, key_prefix, environ, prefixes)
         if isinstance(data, list):
             i = 0
             for value in data:
                 replace_prefix = prefix + "[" + str(i) + "]"
                 replace_prefix = replace_prefix.upper()
 
-                environ_value = os.environ.get(replace_prefix)
+                environ_value = environ.get(replace_prefix)
                 if environ_value:
-                    data[i] = self.apply_environ_overrides(value, replace_prefix)
+                    data[i] = self._apply_environ_overrides(value, replace_prefix, environ, prefixes)
 
                 i += 1
 
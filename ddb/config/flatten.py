@@ -1,4 +1,5 @@
-from typing import Iterable, Union, TYPE_CHECKING
+from functools import lru_cache
+from typing import Iterable, Union, TYPE_CHECKING, Tuple, Type
 
 from dotty_dict import Dotty
 from marshmallow import Schema
@@ -21,14 +22,22 @@ def _get_stop_fields_from_schema(schema: Schema, stack, ret):
 
 
 def _get_stop_fields(features: Iterable['Feature']):
+    return _get_stop_fields_from_schemas(tuple((feature.name, feature.schema) for feature in features))
+
+
+@lru_cache(maxsize=None)
+def _get_stop_fields_from_schemas(schemas: Tuple[Tuple[str, Type[Schema]], ...]):
+    """
+    Stop fields only depends on features schemas, so they are computed once for each set of features.
+    """
     ret = []
     stack = []
-    for feature in features:
-        stack.append(feature.name)
-        _get_stop_fields_from_schema(feature.schema(), stack, ret)
+    for name, schema in schemas:
+        stack.append(name)
+        _get_stop_fields_from_schema(schema(), stack, ret)
         stack.pop()
 
-    return ret
+    return tuple(ret)
 
 
 def to_environ(data: Union[Dotty, dict], env_prefix) -> dict:
@@ -47,7 +56,7 @@ def flatten(data: Union[Dotty, dict], prefix=None, sep=".", array_index_format="
     """
     Export configuration to a flat dict.
     """
-    stop_for = tuple(map(sep.join, _get_stop_fields(stop_for_features))) if stop_for_features is not None else ()
+    stop_for = frozenset(map(sep.join, _get_stop_fields(stop_for_features))) if stop_for_features is not None else ()
 
     return _flatten(prefix, sep, array_index_format,
                     key_transformer, value_transformer,
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Set
+from typing import Optional, Set, FrozenSet
 
 from dotty_dict import Dotty
 
@@ -170,7 +170,9 @@ class MigrationsDotty(Dotty):
         super().__init__(dictionary)
 
     def _build_deprecation_dict(self, item):
-        migrations = get_migrations_from_old_config_key_startswith(item + ".")
+        migrations = get_migrations_from_old_config_key_parent(item)
+        if not migrations:
+            return {}
         deprecation_dict = Dotty({})
 
         for migration in migrations:
@@ -299,6 +301,7 @@ _default_history = (
 _history = None
 _history_from_old_config_key_dict = None
 _history_from_new_config_key_dict = None
+_history_from_old_config_key_parent_dict = None
 
 
 def get_history():
@@ -314,7 +317,9 @@ def set_history(history=_default_history):
     """
     Set migrations history.
     """
-    global _history, _history_from_old_config_key_dict, _history_from_new_config_key_dict  # pylint:disable=global-statement
+    # pylint:disable=global-statement
+    global _history, _history_from_old_config_key_dict, _history_from_new_config_key_dict, \
+        _history_from_old_config_key_parent_dict
     _history = history
 
     _history_from_old_config_key_dict = {
@@ -326,6 +331,17 @@ def set_history(history=_default_history):
         migration.new_config_key: migration for migration in history
         if isinstance(migration, AbstractPropertyMigration) and migration.new_config_key
     }
+
+    # Index migrations by each parent of their old config key ("a" and "a.b" for "a.b.c"), so deprecated values can
+    # be found for any configuration subtree with a single dict lookup.
+    parent_dict = {}
+    for migration in history:
+        if isinstance(migration, AbstractPropertyMigration) and migration.old_config_key:
+            for i, char in enumerate(migration.old_config_key):
+                if char == ".":
+                    parent_dict.setdefault(migration.old_config_key[:i], set()).add(migration)
+    _history_from_old_config_key_parent_dict = {parent: frozenset(migrations)
+                                                for parent, migrations in parent_dict.items()}
     _warns.clear()
 
 
@@ -346,10 +362,19 @@ def get_migration_from_new_config_key(new_config_key: str) -> Optional[AbstractP
     return _history_from_new_config_key_dict.get(new_config_key)
 
 
+def get_migrations_from_old_config_key_parent(parent: str) -> FrozenSet[AbstractPropertyMigration]:
+    """
+    Get all migrations where old_config_key is a child of given config key.
+    """
+    return _history_from_old_config_key_parent_dict.get(parent, frozenset())
+
+
 def get_migrations_from_old_config_key_startswith(old_config_key_start: str) -> Set[AbstractPropertyMigration]:
     """
     Get all migrations where old_config_key starts with given value
     """
+    if old_config_key_start.endswith("."):
+        return set(get_migrations_from_old_config_key_parent(old_config_key_start[:-1]))
     ret = set()
     for migration in get_history():
         if isinstance(migration, AbstractPropertyMigration) and \
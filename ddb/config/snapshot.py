@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sys
+from copy import deepcopy
+from typing import Optional, Dict, Iterable, List
+
+from ddb.__version__ import __version__
+from ddb.cache.sqlite_cache import SqliteCache
+from ddb.config import config, Config
+from ddb.config.migrations import MigrationsDotty
+from ddb.feature.feature import Feature
+
+
+class ConfigSnapshot:
+    """
+    Snapshot of the validated configuration, stored in cache and restored on next runs as long as configuration files,
+    environment variables, available features and context are unchanged.
+    """
+
+    def __init__(self, available_features: Iterable[Feature] = ()):
+        available_features = list(available_features)
+        self._environ = dict(os.environ)
+        self._features = sorted((feature.name, type(feature).__module__, type(feature).__qualname__)
+                                for feature in available_features)
+        self._features_files = self._get_features_files(available_features)
+        self._context = self._get_context()
+        self._data = self._read() if self.enabled else None
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Snapshot is disabled when there's no project configuration file, or when configuration is overridden from code.
+        """
+        return bool(config.project_configuration_file) and not Config.overrides
+
+    @property
+    def valid(self) -> bool:
+        """
+        Check if a valid snapshot is available.
+        """
+        return self._data is not None
+
+    def discard(self):
+        """
+        Discard the snapshot, forcing configuration to be loaded from files.
+        """
+        self._data = None
+
+    def restore(self):
+        """
+        Restore configuration from snapshot.
+        """
+        config.data = MigrationsDotty(deepcopy(self._data["data"]))
+        config.filenames = self._data["filenames"]
+        config.path = self._data["path"]
+        config.env_additions = dict(self._data["env_additions"])
+        os.environ.update(self._data["environ"])
+
+    def get_raw(self, name: str):
+        """
+        Get configuration of a feature, as it was before validation.
+        """
+        return deepcopy(self._data["raw"].get(name))
+
+    def save(self, raw: Dict[str, object]):
+        """
+        Save current configuration to snapshot, with configuration of given features as it was before validation.
+        """
+        if not self.enabled:
+            return
+
+        self._data = {"context": self._context,
+                      "files": self._get_files_digests(list(config.files) + self._features_files),
+                      "data": config.data.to_dict(),
+                      "raw": raw,
+                      "filenames": config.filenames,
+                      "path": getattr(config, "path", None),
+                      "env_additions": dict(config.env_additions),
+                      "environ": {name: value for name, value in os.environ.items()
+                                  if self._environ.get(name) != value}}
+        cache = self._get_cache()
+        try:
+            cache.set("snapshot", self._data)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            cache.clear()
+        finally:
+            cache.close()
+
+    def _read(self) -> Optional[Dict]:
+        cache = self._get_cache()
+        try:
+            data = cache.get("snapshot")
+        except Exception:  # pylint:disable=broad-except
+            return None
+        finally:
+            cache.close()
+
+        if not data or data.get("context") != self._context:
+            return None
+
+        if data.get("files") != self._get_files_digests(data.get("files", {}).keys()):
+            return None
+
+        return data
+
+    @staticmethod
+    def _get_cache():
+        digest = hashlib.sha1(str(config.paths.project_home).encode("utf-8")).hexdigest()[:16]
+        return SqliteCache("config-snapshot." + digest)
+
+    def _get_context(self) -> str:
+        """
+        Values that configuration may depend on, beside configuration files.
+        """
+        prefix = config.env_prefix + "_"
+        environ = {name: value for name, value in self._environ.items() if name.startswith(prefix)}
+        for name in ("SHELL", "COMSPEC"):
+            environ[name] = self._environ.get(name)
+
+        return json.dumps([__version__,
+                           config.env_prefix,
+                           config.env_override_prefix,
+                           config.filenames,
+                           config.extensions,
+                           config.paths,
+                           Config.defaults,
+                           self._features,
+                           os.name,
+                           sys.platform,
+                           os.getuid() if hasattr(os, "getuid") else None,  # pylint:disable=no-member
+                           os.getgid() if hasattr(os, "getgid") else None,  # pylint:disable=no-member
+                           environ], sort_keys=True, default=str)
+
+    @staticmethod
+    def _get_features_files(available_features: Iterable[Feature]) -> List[str]:
+        """
+        Source files of features provided by plugins and entrypoints, with their schema, as they may change defaults.
+        """
+        files = set()
+        for feature in available_features:
+            for clazz in (type(feature), feature.schema):
+                if clazz.__module__.split(".", 1)[0] == "ddb":
+                    continue
+                try:
+                    files.add(inspect.getsourcefile(clazz))
+                except TypeError:
+                    continue
+        return sorted(file for file in files if file)
+
+    @staticmethod
+    def _get_files_digests(files: Iterable[str]) -> Dict[str, Optional[str]]:
+        digests = {}
+        for file in files:
+            try:
+                with open(file, "rb") as stream:
+                    digests[file] = hashlib.sha1(stream.read()).hexdigest()
+            except OSError:
+                digests[file] = None
+        return digests
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+from collections.abc import Mapping
+from copy import deepcopy
+from typing import Optional, Dict, Any, Iterator
+
+from dotty_dict import Dotty
+
+
+class ConfigView(Mapping):
+    """
+    Read-only view over configuration data, with a copy-on-write overlay.
+
+    Values written to the view are stored in the overlay, and configuration data is never modified. When a nested key
+    is written in an existing root key, only this root value is copied to the overlay.
+
+    Root values read from configuration data are memoized, so the view should be used only while configuration data is
+    unchanged, like for rendering templates.
+    """
+
+    def __init__(self, data: Dotty, overlay: Optional[Dict[str, Any]] = None):
+        self._data = data
+        self._overlay = {}  # type: Dict[str, Any]
+        self._memo = {}
+        if overlay:
+            for key, value in overlay.items():
+                self[key] = value
+
+    def _get_root(self, key: str):
+        if key in self._overlay:
+            return self._overlay[key]
+        try:
+            return self._memo[key]
+        except KeyError:
+            value = self._data[key]
+            self._memo[key] = value
+            return value
+
+    def __getitem__(self, key: str):
+        root_key, _, path = key.partition(self._data.separator)
+        value = self._get_root(root_key)
+        if not path:
+            return value
+        try:
+            return Dotty({root_key: value}, separator=self._data.separator)[key]
+        except TypeError as error:
+            raise KeyError(key) from error
+
+    def __setitem__(self, key: str, value):
+        root_key, _, path = key.partition(self._data.separator)
+        if not path:
+            self._overlay[root_key] = value
+            return
+        if root_key not in self._overlay and root_key in self._data:
+            self._overlay[root_key] = deepcopy(self._get_root(root_key))
+        Dotty(self._overlay, separator=self._data.separator)[key] = value
+
+    def __contains__(self, key):
+        try:
+            self[key]  # pylint:disable=pointless-statement
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._overlay
+        for key in self._data.keys():
+            if key not in self._overlay:
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+import sys
+
+from ddb.config import config
+from ddb.utils.daemon import run_with_daemon
+from ddb.utils.importtime import is_profile_import_enabled, profile_import
+
+# This module is the console script entrypoint. It forwards the command line to the daemon serving the project before
+# features are imported, so it should only import lightweight modules.
+
+
+def console_script():  # pragma: no cover
+    """
+    Console script entrypoint
+    """
+    args = sys.argv[1:]
+    if is_profile_import_enabled(args, config.env_prefix):
+        sys.exit(profile_import(args, config.env_prefix))
+
+    exit_code = run_with_daemon(args, config.paths.project_home, config.env_prefix)
+    if exit_code is not None:
+        sys.exit(exit_code)
+
+    from ddb.__main__ import console_script as main_console_script  # pylint:disable=import-outside-toplevel
+    main_console_script()
+
+
+if __name__ == '__main__':  # pragma: no cover
+    console_script()
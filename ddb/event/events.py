@@ -33,6 +33,18 @@ class File:
         :param target:
         """
 
+    @event("file:before-found-events")
+    def before_found_events(self):
+        """
+        Before found events are emitted for all files of the project.
+        """
+
+    @event("file:after-found-events")
+    def after_found_events(self):
+        """
+        After found events have been emitted for all files of the project.
+        """
+
 
 class Certs:
     """
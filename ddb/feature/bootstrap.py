@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
-from typing import Iterable
+from importlib.metadata import entry_points
+from typing import Iterable, List, Optional
 
-import pkg_resources
 from toposort import toposort_flatten
 
 from . import features
@@ -9,6 +9,7 @@ from .certs import CertsFeature
 from .cookiecutter import CookiecutterFeature
 from .copy import CopyFeature
 from .core import CoreFeature
+from .daemon import DaemonFeature
 from .docker import DockerFeature
 from .feature import Feature
 from .file import FileFeature
@@ -27,11 +28,13 @@ from .version import VersionFeature
 from .ytt import YttFeature
 from ..config import config
 from ..config import migrations
+from ..config.snapshot import ConfigSnapshot
 
 _default_available_features = [CertsFeature(),
                                CopyFeature(),
                                CookiecutterFeature(),
                                CoreFeature(),
+                               DaemonFeature(),
                                DockerFeature(),
                                FileFeature(),
                                FixuidFeature(),
@@ -51,19 +54,37 @@ _default_available_features = [CertsFeature(),
 _available_features = list(_default_available_features)
 
 
+def _get_entry_points(group: str):
+    """
+    Get entry points of given group from installed distributions.
+    """
+    all_entry_points = entry_points()
+    if hasattr(all_entry_points, "select"):
+        return all_entry_points.select(group=group)
+    return all_entry_points.get(group, ())  # python < 3.10
+
+
+def get_available_features() -> List[Feature]:
+    """
+    Get available features, with default features, plugins features and entrypoint 'ddb_features'.
+    """
+    available_features = {f.name: f for f in _available_features}
+    for entry_point in _get_entry_points('ddb_features'):
+        feature = entry_point.load()()
+        available_features[feature.name] = feature
+    return list(available_features.values())
+
+
 def get_sorted_features(available_features: Iterable[Feature] = None):
     """
-    Register default features and setuptools entrypoint 'ddb_features' inside features registry.
+    Register available features inside features registry.
     Features are registered in order for their dependency to be registered first with a topological sort.
     Withing a command phase, actions are executed in the order of their feature registration.
     """
     if available_features is None:
-        available_features = _available_features
+        available_features = get_available_features()
 
     entrypoint_features = {f.name: f for f in available_features}
-    for entry_point in pkg_resources.iter_entry_points('ddb_features'):
-        feature = entry_point.load()()
-        entrypoint_features[feature.name] = feature
 
     required_dependencies, toposort_data = _prepare_dependencies_data(entrypoint_features)
     _check_missing_dependencies(entrypoint_features, required_dependencies)
@@ -131,14 +152,18 @@ def append_available_feature(feature):
     _available_features.append(feature)
 
 
-def bootstrap_register_features():
+def bootstrap_register_features(config_snapshot: Optional[ConfigSnapshot] = None,
+                                available_features: Iterable[Feature] = None):
     """
     Register all features in order.
     :return:
     """
-    config.load()
+    if config_snapshot and config_snapshot.valid:
+        config_snapshot.restore()
+    else:
+        config.load()
     features.clear()
-    for feature in get_sorted_features():
+    for feature in get_sorted_features(available_features):
         features.register(feature)
     config.clear()
 
@@ -160,10 +185,13 @@ def bootstrap_features_configuration():
         config.filenames, config.extensions = filenames, extensions
 
 
-def load_bootstrap_config():
+def load_bootstrap_config(config_snapshot: Optional[ConfigSnapshot] = None):
     """
     Load bootstrap configuration.
     """
+    if config_snapshot and config_snapshot.valid:
+        config_snapshot.restore()
+        return
     bootstrap_features_configuration()
     config.load(config.data)
     migrations.migrate(config.data)
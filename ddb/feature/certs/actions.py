@@ -1,8 +1,6 @@
 # -*- coding: utf-8 -*-
 import os
 
-import cfssl as cfssl_client
-
 from .cfssl import checksums, writer
 from ...action import Action
 from ...config import config
@@ -43,6 +41,7 @@ class GenerateCertAction(Action):
         if not os.path.exists(certificate_path) or not os.path.exists(private_key_path):
             client_config = config.data.get('certs.cfssl.server')
 
+            import cfssl as cfssl_client  # pylint:disable=import-outside-toplevel
             client = cfssl_client.CFSSL(**client_config)
 
             certificate_request = cfssl_client.CertificateRequest()
@@ -155,6 +154,7 @@ class GenerateSignerCertificateAction(Action):
         if not os.path.exists(certificate_path):
             client_config = config.data.get('certs.cfssl.server')
 
+            import cfssl as cfssl_client  # pylint:disable=import-outside-toplevel
             client = cfssl_client.CFSSL(**client_config)
             response = client.info('')
 
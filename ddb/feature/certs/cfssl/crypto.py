@@ -3,10 +3,6 @@
 Crypto module
 """
 
-from cryptography import x509
-from cryptography.hazmat.backends import default_backend
-from cryptography.hazmat.primitives import serialization
-
 
 class CryptoException(Exception):
     """
@@ -24,6 +20,11 @@ def convert_pem_to_der(part, content):
     :return: DER Encoded object
     :rtype: byte[]
     """
+    # pylint:disable=import-outside-toplevel
+    from cryptography import x509
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives import serialization
+
     if part == 'certificate':
         cert = x509.load_pem_x509_certificate(content, default_backend())
         return cert.public_bytes(serialization.Encoding.DER)
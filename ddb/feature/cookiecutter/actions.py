@@ -1,9 +1,5 @@
 # -*- coding: utf-8 -*-
 import os
-import patch
-
-from cookiecutter.config import DEFAULT_CONFIG
-from cookiecutter.main import cookiecutter
 
 from ddb.action import Action
 from ddb.config import config
@@ -28,6 +24,8 @@ class CookiecutterAction(Action):
         """
         Execute action
         """
+        from cookiecutter.config import DEFAULT_CONFIG  # pylint:disable=import-outside-toplevel
+
         config_parameters = 'cookiecutters_dir', 'replay_dir', 'default_context'
 
         defaults = {}
@@ -58,11 +56,14 @@ class CookiecutterAction(Action):
 
         kwargs = {k: v for k, v in template.items() if v is not None}
 
+        from cookiecutter.main import cookiecutter  # pylint:disable=import-outside-toplevel
         ret = cookiecutter(**kwargs)
         output_dir = os.path.relpath(ret, '.')
 
         context.log.success(f"{template['template']} -> {output_dir}")
 
+        import patch  # pylint:disable=import-outside-toplevel
+
         for patch_file in os.listdir(output_dir):
             if patch_file.endswith('.patch'):
                 patch_file = os.path.join(output_dir, patch_file)
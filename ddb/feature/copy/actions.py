@@ -3,10 +3,8 @@ import glob
 import os
 import re
 
-import requests
-
 from ddb.action import Action
-from ddb.cache import caches, requests_cache_name
+from ddb.cache import http_cache
 from ddb.config import config
 from ddb.event import events
 from ddb.utils.file import write_if_different, copy_if_different
@@ -16,12 +14,7 @@ def copy_from_url(source, destination, filename=None):
     """
     Copy from an URL source.
     """
-    cache = caches.get(requests_cache_name)
-    response = cache.get(source)
-    if not response:
-        response = requests.get(source, allow_redirects=True)
-        response.raise_for_status()
-        cache.set(source, response)
+    response = http_cache().get(source)
     if not filename:
         content_disposition = response.headers['content-disposition']
         filename = re.findall("filename=(.+)", content_disposition)[0]
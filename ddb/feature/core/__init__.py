@@ -74,6 +74,8 @@ class CoreFeature(Feature):
                                 help="Eject the project using the current configuration")
             parser.add_argument("--autofix", action="store_true",
                                 help="Autofix supported deprecated warnings by modifying template sources.")
+            parser.add_argument("--full", action="store_true",
+                                help="Render all templates, even those with unchanged inputs since last run.")
 
         def config_parser(parser: ArgumentParser):
             parser.add_argument("property", nargs='?',
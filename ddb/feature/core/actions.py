@@ -7,9 +7,7 @@ from datetime import date
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from typing import Optional
-from urllib.error import HTTPError
 
-import requests
 import yaml
 from dotty_dict import Dotty
 from progress.bar import IncrementalBar
@@ -17,7 +15,7 @@ from semver import VersionInfo
 
 from ddb import __version__
 from ddb.action import Action, InitializableAction
-from ddb.cache import caches, register_global_cache
+from ddb.cache import caches, register_global_cache, http_cache
 from ddb.config import config
 from ddb.event import events
 from ddb.utils.file import force_remove
@@ -36,15 +34,15 @@ def get_latest_release(github_repository: str):
     :param github_repository github repository to check
     :return: Version from tag_name retrieved from GitHub API
     """
-    response = requests.get('https://api.github.com/repos/{}/releases/latest'.format(github_repository))
+    import requests  # pylint:disable=import-outside-toplevel
     try:
-        response.raise_for_status()
+        response = http_cache().get('https://api.github.com/repos/{}/releases/latest'.format(github_repository))
         tag_name = response.json().get('tag_name')
         version = tag_name
         if version and version.startswith('v'):
             version = version[1:]
         return version, tag_name
-    except HTTPError:  # pylint:disable=bare-except
+    except requests.HTTPError:
         return None, None
 
 
@@ -367,7 +365,17 @@ class ConfigAction(Action):
         else:
             flat = flatten(Dotty(configuration), keep_primitive_list=True)
             for key in sorted(flat.keys()):
-                print(f"{key}: {flat[key]}")
+                if ConfigAction._is_cached_default(key):
+                    print(f"{key}: {flat[key]}  # cached")
+                else:
+                    print(f"{key}: {flat[key]}")
+
+    @staticmethod
+    def _is_cached_default(key: str):
+        for cached_key in config.cached_defaults:
+            if key == cached_key or key.startswith(cached_key + ".") or key.startswith(cached_key + "["):
+                return True
+        return False
 
     @staticmethod
     def _print_config_value(configuration, prop):
@@ -674,6 +682,9 @@ class SelfUpdateAction(Action):
         url = 'https://github.com/{}/releases/download/{}/{}'.format(github_repository, tag_name, release_asset_name)
         context.log.debug('Downloading ddb asset: %s', url)
 
+        # Release assets are never modified, so they are downloaded without HTTP cache.
+        import requests  # pylint:disable=import-outside-toplevel
+
         progress_bar = None
         with requests.get(url, stream=True) as response:
             response.raise_for_status()
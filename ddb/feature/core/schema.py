@@ -1,8 +1,9 @@
 # -*- coding: utf-8 -*-
 import os
 
-from marshmallow import fields, Schema
+from marshmallow import fields, Schema, validate
 
+from ddb.cache import cache_backends, default_cache_backend, default_http_cache_max_size
 from ddb.feature.schema import FeatureSchema
 
 
@@ -70,5 +71,10 @@ class CoreFeatureSchema(FeatureSchema):
     github_repository = fields.String(required=True, dump_default="inetum-orleans/docker-devbox-ddb")
     check_updates = fields.Boolean(required=True, dump_default=True)
     required_version = fields.String(required=False, allow_none=True, dump_default=None)
+    parallelism = fields.Integer(required=False, dump_default=1)
+    autodetect_ttl = fields.Integer(required=False, dump_default=3600)
+    cache_backend = fields.String(required=False, dump_default=default_cache_backend,
+                                  validate=validate.OneOf(list(cache_backends)))
+    http_cache_max_size = fields.Integer(required=False, dump_default=default_http_cache_max_size)
     release_asset_name = fields.String(required=False, allow_none=True,
                                        dump_default=None)  # default is set in feature _configure_defaults
@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+from typing import Iterable, ClassVar
+
+from .actions import DaemonAction
+from .schema import DaemonSchema
+from ..feature import Feature
+from ..schema import FeatureSchema
+from ...action import Action
+from ...command import LifecycleCommand, Command
+from ...phase import Phase, DefaultPhase
+
+
+class DaemonFeature(Feature):
+    """
+    Per-project background process serving commands with features and configuration already loaded.
+    """
+
+    @property
+    def name(self) -> str:
+        return "daemon"
+
+    @property
+    def dependencies(self) -> Iterable[str]:
+        return ["core", "binary", "shell"]
+
+    @property
+    def schema(self) -> ClassVar[FeatureSchema]:
+        return DaemonSchema
+
+    @property
+    def phases(self) -> Iterable[Phase]:
+        return (
+            DefaultPhase("daemon", "Serve run and activate commands from a background process"),
+        )
+
+    @property
+    def commands(self) -> Iterable[Command]:
+        return (
+            LifecycleCommand("daemon", "Serve run and activate commands from a background process",
+                             "daemon", avoid_stdout=True),
+        )
+
+    @property
+    def actions(self) -> Iterable[Action]:
+        return (
+            DaemonAction(),
+        )
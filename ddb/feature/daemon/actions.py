@@ -0,0 +1,247 @@
+# -*- coding: utf-8 -*-
+import glob
+import io
+import logging
+import os
+import socket
+import threading
+from contextlib import redirect_stdout, redirect_stderr
+from typing import Optional, Tuple
+
+from ddb import __version__
+from ...utils.daemon import get_socket_path, send_message, receive_message, is_private
+from ...action import Action
+from ...action.runner import ExpectedError
+from ...cache import caches, project_binary_cache_name
+from ...command.command import execute_command
+from ...config import config
+from ...context import context
+
+
+class DaemonAlreadyRunningError(ExpectedError):
+    """
+    Error raised when another daemon is already serving the project.
+    """
+
+    def __init__(self, socket_path: str):
+        super().__init__("A daemon is already running for this project (%s)" % socket_path)
+
+
+class DaemonServer:  # pylint:disable=too-many-instance-attributes
+    """
+    Unix socket server executing forwarded command lines inside the current process.
+
+    Requests are handled one at a time, as registries and configuration are global. The server stops serving when a
+    configuration file or the binaries cache is modified, so that next invocations fall back to a fresh process.
+    """
+
+    poll_interval = 1
+
+    def __init__(self, socket_path: str, allowed_commands=("run", "activate"), idle_timeout: Optional[int] = None):
+        self.socket_path = socket_path
+        self.allowed_commands = tuple(allowed_commands)
+        self.idle_timeout = idle_timeout
+        self.log_level = logging.getLogger("ddb").level
+        self.overrides_signature = self._overrides_signature(os.environ)
+        self.files_signature = self._files_signature()
+        self._stop_event = threading.Event()
+        self._started_event = threading.Event()
+
+    @staticmethod
+    def _overrides_signature(environ) -> Tuple:
+        """
+        Environment variables that are used to compute the configuration.
+        """
+        prefixes = (config.env_override_prefix,
+                    config.env_prefix + "_HOME",
+                    config.env_prefix + "_USER_HOME",
+                    config.env_prefix + "_DDB_HOME")
+        return tuple(sorted((key, value) for key, value in environ.items() if key.startswith(prefixes)))
+
+    @staticmethod
+    def _watched_files():
+        files = list(config.files)
+        if caches.has(project_binary_cache_name):
+            basename = getattr(caches.get(project_binary_cache_name), "basename", None)
+            if basename:
+                files.extend(sorted(glob.glob(glob.escape(basename) + "*")))
+        return files
+
+    def _files_signature(self) -> Tuple:
+        signature = []
+        for file in self._watched_files():
+            try:
+                stat = os.stat(file)
+                signature.append((file, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append((file, None, None))
+        return tuple(signature)
+
+    def is_stale(self) -> bool:
+        """
+        Check if loaded configuration doesn't match configuration files anymore.
+        """
+        return self._files_signature() != self.files_signature
+
+    def wait_started(self, timeout: Optional[float] = None):
+        """
+        Wait for the server to accept connections.
+        """
+        return self._started_event.wait(timeout)
+
+    def stop(self):
+        """
+        Stop serving.
+        """
+        self._stop_event.set()
+
+    def serve(self):
+        """
+        Serve requests until the server is stopped, idle for too long or stale.
+        """
+        socket_directory = os.path.dirname(self.socket_path)
+        os.makedirs(socket_directory, mode=0o700, exist_ok=True)
+        if not is_private(socket_directory):
+            raise ExpectedError("Daemon socket directory should be owned by current user and not writable by "
+                                "others (%s)" % socket_directory)
+        self._check_not_running()
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:  # pylint:disable=no-member
+            server.bind(self.socket_path)
+            try:
+                os.chmod(self.socket_path, 0o600)
+                server.listen()
+                server.settimeout(self.poll_interval)
+                self._started_event.set()
+                context.log.info("Daemon is listening on %s", self.socket_path)
+                idle = 0
+                while not self._stop_event.is_set():
+                    try:
+                        connection, _ = server.accept()
+                    except socket.timeout:
+                        idle += self.poll_interval
+                        if self.idle_timeout and idle >= self.idle_timeout:
+                            context.log.info("Daemon has been idle for %s seconds", idle)
+                            break
+                        continue
+                    idle = 0
+                    with connection:
+                        connection.settimeout(None)
+                        if not self._handle(connection):
+                            break
+            finally:
+                if os.path.exists(self.socket_path):
+                    os.remove(self.socket_path)
+                context.log.info("Daemon has stopped")
+
+    def _check_not_running(self):
+        if not os.path.exists(self.socket_path):
+            return
+        try:
+            with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:  # pylint:disable=no-member
+                sock.connect(self.socket_path)
+        except OSError:
+            os.remove(self.socket_path)
+            return
+        raise DaemonAlreadyRunningError(self.socket_path)
+
+    def _handle(self, connection: socket.socket) -> bool:
+        """
+        Handle a single request. Returns False if the server should stop.
+        """
+        request = receive_message(connection)
+        if not request:
+            return True
+
+        if self.is_stale():
+            context.log.info("Configuration has changed, daemon is now stale")
+            send_message(connection, {"status": "stale"})
+            return False
+
+        if request.get("version") != __version__:
+            send_message(connection, {"status": "rejected", "reason": "version"})
+            return True
+
+        if self._overrides_signature(request.get("environ", {})) != self.overrides_signature:
+            send_message(connection, {"status": "rejected", "reason": "environ"})
+            return True
+
+        args = request.get("args", [])
+        if not args or args[0] not in self.allowed_commands:
+            send_message(connection, {"status": "rejected", "reason": "command"})
+            return True
+
+        send_message(connection, self._execute(args, request.get("cwd"), request.get("environ", {})))
+        return True
+
+    def _execute(self, args, cwd, environ) -> dict:  # pylint:disable=too-many-locals
+        # Inline import because __main__ module depends on all features
+        from ddb.__main__ import parse_command_line, configure_logging, \
+            ParseCommandLineException  # pylint:disable=import-outside-toplevel,cyclic-import
+
+        saved_environ = dict(os.environ)
+        saved_cwd, saved_args, saved_unknown_args = config.cwd, config.args, config.unknown_args
+
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        exit_code = 0
+        try:
+            os.environ.clear()
+            os.environ.update(environ)
+            config.cwd = cwd
+            context.reset()
+            with redirect_stdout(stdout), redirect_stderr(stderr):
+                try:
+                    command, config.args, config.unknown_args = parse_command_line(args)
+                    execute_command(command)
+                    if context.exceptions:
+                        exit_code = 1
+                except ParseCommandLineException:
+                    exit_code = 1
+                except SystemExit as exc:
+                    exit_code = exc.code if isinstance(exc.code, int) else 1
+                except Exception:  # pylint:disable=broad-except
+                    logging.getLogger("ddb").exception("An unexpected error has occured in daemon")
+                    exit_code = 1
+        finally:
+            os.environ.clear()
+            os.environ.update(saved_environ)
+            config.cwd, config.args, config.unknown_args = saved_cwd, saved_args, saved_unknown_args
+            context.reset()
+            configure_logging(self.log_level)
+
+        return {"status": "ok", "exit_code": exit_code, "stdout": stdout.getvalue(), "stderr": stderr.getvalue()}
+
+
+class DaemonAction(Action):
+    """
+    Serve run and activate commands through a unix socket, keeping features and configuration loaded.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.server = None  # type: Optional[DaemonServer]
+
+    @property
+    def name(self) -> str:
+        return "daemon:serve"
+
+    @property
+    def event_bindings(self):
+        return "phase:daemon"
+
+    def execute(self):
+        """
+        Execute action
+        """
+        if not hasattr(socket, "AF_UNIX"):
+            context.log.error("Daemon is not supported on this platform")
+            return
+
+        self.server = DaemonServer(get_socket_path(config.paths.project_home),
+                                   config.data.get("daemon.commands"),
+                                   config.data.get("daemon.idle_timeout"))
+        try:
+            self.server.serve()
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,12 @@
+# -*- coding: utf-8 -*-
+from marshmallow import fields
+
+from ddb.feature.schema import FeatureSchema
+
+
+class DaemonSchema(FeatureSchema):
+    """
+    Daemon schema.
+    """
+    idle_timeout = fields.Integer(required=False, allow_none=True, dump_default=3600)
+    commands = fields.List(fields.String(), required=False, dump_default=["run", "activate"])
@@ -9,9 +9,11 @@ from dotty_dict import Dotty
 from .actions import EmitDockerComposeConfigAction, DockerComposeBinaryAction, LocalVolumesAction, \
     DockerDisplayInfoAction
 from .schema import DockerSchema
+from .utils import get_user_ids, get_group_id
 from ..feature import Feature, FeatureConfigurationAutoConfigureError
 from ..schema import FeatureSchema
 from ...action import Action
+from ...cache.autodetect import autodetect
 from ...config import config
 from ...utils.compat import path_as_posix_fast
 
@@ -29,6 +31,10 @@ class DockerFeature(Feature):
     def dependencies(self) -> Iterable[str]:
         return ["core"]
 
+    @property
+    def volatile(self) -> bool:
+        return True
+
     @property
     def schema(self) -> ClassVar[FeatureSchema]:
         return DockerSchema
@@ -61,7 +67,7 @@ class DockerFeature(Feature):
             if not ip_address:
                 interface = feature_config.get('interface')
                 try:
-                    docker_if = netifaces.ifaddresses(interface)
+                    docker_if = autodetect('docker.ip', lambda: netifaces.ifaddresses(interface), interface)
                 except ValueError as err:
                     raise FeatureConfigurationAutoConfigureError(self, 'ip',
                                                                  "Invalid network interface: " + interface) from err
@@ -86,13 +92,13 @@ class DockerFeature(Feature):
             name = feature_config.get('user.name')
             if name:
                 try:
-                    import pwd  # pylint:disable=import-outside-toplevel
-                    struct_passwd = pwd.getpwnam(name)
+                    pw_uid, pw_gid = autodetect(('docker.user.uid', 'docker.user.gid'),
+                                                lambda: get_user_ids(name), name)
                     if uid is None:
-                        uid = struct_passwd.pw_uid
+                        uid = pw_uid
                         feature_config['user.uid'] = uid
                     if gid is None:
-                        gid = struct_passwd.pw_gid
+                        gid = pw_gid
                         feature_config['user.gid'] = gid
                 except ImportError:
                     pass
@@ -102,9 +108,7 @@ class DockerFeature(Feature):
             group = feature_config.get('user.group')
             if group:
                 try:
-                    import grp  # pylint:disable=import-outside-toplevel
-                    struct_group = grp.getgrnam(group)
-                    gid = struct_group.gr_id
+                    gid = autodetect('docker.user.gid', lambda: get_group_id(group), group)
                     feature_config['user.gid'] = gid
                 except ImportError:
                     pass
@@ -5,7 +5,6 @@ import re
 from pathlib import PurePosixPath, Path
 from typing import Union, Iterable, List, Dict, Set
 
-import yaml
 from dotty_dict import Dotty
 
 from ddb.feature import features
@@ -34,7 +33,7 @@ class EmitDockerComposeConfigAction(Action):
 
     def __init__(self):
         super().__init__()
-        self.current_yaml_output = None
+        self.current_digest = None
         self.key_re = re.compile(r"^\s*ddb\.emit\.(.+?)(?:\[(.+?)\])?(?:\((.+?)\))?\s*$")
         self.eval_re = re.compile(r"^\s*eval\((.*)\)\s*$")
         self._cert_domains_cache = register_project_cache("docker.cert-domains")
@@ -61,13 +60,13 @@ class EmitDockerComposeConfigAction(Action):
             return
 
         control = DockerComposeControl()
-        yaml_output = control.config(parse=False)
+        digest, compose_config = control.cached_config()
 
-        if self.current_yaml_output == yaml_output:
+        if self.current_digest == digest:
             return
-        self.current_yaml_output = yaml_output
+        self.current_digest = digest
 
-        docker_compose_config = Dotty(yaml.load(yaml_output, yaml.SafeLoader))
+        docker_compose_config = Dotty(compose_config)
         events.docker.docker_compose_config(docker_compose_config=docker_compose_config)
 
         services = docker_compose_config.get('services')
@@ -413,7 +412,7 @@ class DockerDisplayInfoAction(Action):
 
     def __init__(self):
         super().__init__()
-        self.current_yaml_output = None
+        self.current_digest = None
 
     @property
     def event_bindings(self):
@@ -433,13 +432,13 @@ class DockerDisplayInfoAction(Action):
             return
 
         control = DockerComposeControl()
-        yaml_output = control.config(parse=False)
+        digest, compose_config = control.cached_config()
 
-        if self.current_yaml_output == yaml_output:
+        if self.current_digest == digest:
             return
-        self.current_yaml_output = yaml_output
+        self.current_digest = digest
 
-        docker_compose_config = Dotty(yaml.load(yaml_output, yaml.SafeLoader))
+        docker_compose_config = Dotty(compose_config)
         services = docker_compose_config.get('services')
         if not services:
             return
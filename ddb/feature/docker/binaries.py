@@ -3,7 +3,7 @@ import posixpath
 import shlex
 from typing import Optional, Iterable
 
-from ddb.binary.binary import AbstractBinary
+from ddb.binary.binary import AbstractBinary, PrecompiledCommand
 from ddb.config import config
 from ddb.feature.docker.lib.compose.config.errors import ConfigurationError
 from ddb.feature.docker.utils import get_mapped_path, DockerComposeControl
@@ -97,6 +97,28 @@ class DockerBinary(AbstractBinary):  # pylint:disable=too-many-instance-attribut
         command = effective_command(*shlex.split(docker_compose_command), *params)
         return command
 
+    def precompiled_command(self) -> Optional[PrecompiledCommand]:
+        if self.condition or self.options_condition or self.exe or self.global_:
+            return None
+
+        docker_compose_command = config.data.get('docker.docker_compose_command')
+        if not docker_compose_command:
+            return None
+
+        prefix = ["-f", os.path.join(config.paths.project_home, "docker-compose.yml"), "run", "--rm"]
+
+        suffix = []
+        if self.entrypoint:
+            suffix.append(f"--entrypoint={self.entrypoint}")
+        self.add_options_to_params(suffix, self.options, None)
+        suffix.append(self.docker_compose_service)
+        if self.args:
+            suffix.extend(shlex.split(self.args))
+
+        command = effective_command(*shlex.split(docker_compose_command), *prefix, *suffix)
+        split_index = next(i for i in range(len(command)) if command[i:i + len(prefix)] == prefix) + len(prefix)
+        return PrecompiledCommand(command[:split_index], self.workdir, command[split_index:])
+
     def add_options_to_params(self, params, options, condition, *args):
         """
         Add options to params if condition is fulfilled
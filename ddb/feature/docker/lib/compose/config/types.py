@@ -1,7 +1,6 @@
 from collections import namedtuple
 
 from .errors import ConfigurationError
-from docker.utils.ports import build_port_bindings
 
 
 class ServicePort(namedtuple('_ServicePort', 'target published protocol mode external_ip')):
@@ -34,6 +33,9 @@ class ServicePort(namedtuple('_ServicePort', 'target published protocol mode ext
             return [spec]
 
         if not isinstance(spec, dict):
+            # docker package imports the whole docker SDK, so it's only imported when needed.
+            from docker.utils.ports import build_port_bindings
+
             result = []
             try:
                 for k, v in build_port_bindings([spec]).items():
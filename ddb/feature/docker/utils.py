@@ -1,13 +1,24 @@
+import hashlib
 import os
+import re
 import shlex
+from collections import deque
 from subprocess import CalledProcessError
+from typing import List, Tuple, Dict, Optional
 
 import yaml
 
+from ddb.cache import caches, register_project_cache, Cache
 from ddb.config import config
 from ddb.feature.docker.lib.compose.config.errors import ConfigurationError
+from ddb.utils.file import get_file_signature
 from ddb.utils.process import run
 
+compose_config_cache_name = "docker.compose-config"
+
+_variable_re = re.compile(r"\$\{?([A-Za-z_][A-Za-z0-9_]*)")
+_environ_prefixes = ("COMPOSE_", "DOCKER_")
+
 
 def get_mapped_path(path: str):
     """
@@ -27,6 +38,45 @@ def get_mapped_path(path: str):
     return fixed_path if fixed_path else path
 
 
+def get_user_ids(name: str) -> Tuple[int, int]:
+    """
+    Get uid and gid of a user from it's name.
+    :raise KeyError: when user doesn't exist
+    :raise ImportError: when users database is not available
+    """
+    import pwd  # pylint:disable=import-outside-toplevel
+    struct_passwd = pwd.getpwnam(name)
+    return struct_passwd.pw_uid, struct_passwd.pw_gid
+
+
+def get_group_id(group: str) -> int:
+    """
+    Get gid of a group from it's name.
+    :raise KeyError: when group doesn't exist
+    :raise ImportError: when groups database is not available
+    """
+    import grp  # pylint:disable=import-outside-toplevel
+    return grp.getgrnam(group).gr_gid
+
+
+def get_users() -> List[Tuple[str, int, int]]:
+    """
+    Get name, uid and gid of all users.
+    :raise ImportError: when users database is not available
+    """
+    import pwd  # pylint:disable=import-outside-toplevel
+    return [(struct_passwd.pw_name, struct_passwd.pw_uid, struct_passwd.pw_gid) for struct_passwd in pwd.getpwall()]
+
+
+def get_groups() -> List[Tuple[str, int]]:
+    """
+    Get name and gid of all groups.
+    :raise ImportError: when groups database is not available
+    """
+    import grp  # pylint:disable=import-outside-toplevel
+    return [(struct_group.gr_name, struct_group.gr_gid) for struct_group in grp.getgrall()]
+
+
 class DockerComposeControl:
     """
     A set of tools to manipulate docker using docker and docker-compose system commands
@@ -129,6 +179,133 @@ class DockerComposeControl:
             return yaml.load(compose_config, yaml.SafeLoader)
         return compose_config
 
+    def cached_config(self) -> Tuple[str, dict]:
+        """
+        Get the parsed docker-compose.yml configuration, with the digest of its inputs.
+
+        Configuration is stored in a project cache, and docker compose is invoked only when compose files, files they
+        extend or include, .env file, env_file of services or relevant environment variables have changed.
+        :raise DockerComposeYamlMissingException: in case of missing docker-compose.yml
+        :return:
+        """
+        if not os.path.exists("docker-compose.yml"):
+            raise DockerComposeYamlMissingException
+
+        digest = self._get_config_digest()
+        cache = _get_compose_config_cache()
+
+        cached = cache.get("config")
+        if cached and cached.get("digest") == digest and \
+                all(get_file_signature(env_file) == signature
+                    for env_file, signature in cached.get("env_files", {}).items()):
+            return digest, cached["config"]
+
+        compose_config = self.config()
+        cache.set("config", {"digest": digest,
+                             "env_files": {env_file: get_file_signature(env_file)
+                                           for env_file in _get_env_files(compose_config)},
+                             "config": compose_config})
+        cache.flush()
+        return digest, compose_config
+
+    def _get_config_digest(self) -> str:
+        """
+        Compute a digest of docker compose command, compose files, files they pull in through extends and include,
+        .env file and relevant environment variables.
+        """
+        sha1 = hashlib.sha1()
+        sha1.update(repr(self.docker_compose_command).encode("utf-8"))
+
+        variables = set()
+        files = get_compose_files() + [".env"]
+        pending = deque(files)
+        while pending:
+            file = pending.popleft()
+            try:
+                with open(file, "rb") as stream:
+                    content = stream.read()
+            except OSError:
+                content = None
+            sha1.update(repr((file, content)).encode("utf-8"))
+            if content:
+                variables.update(_variable_re.findall(content.decode("utf-8", errors="replace")))
+                for referenced_file in _get_referenced_files(file, content):
+                    if referenced_file not in files:
+                        files.append(referenced_file)
+                        pending.append(referenced_file)
+
+        for name in sorted(os.environ):
+            if name in variables or name.startswith(_environ_prefixes):
+                sha1.update(repr((name, os.environ[name])).encode("utf-8"))
+
+        return sha1.hexdigest()
+
+
+def get_compose_files() -> List[str]:
+    """
+    Get docker compose files used for current project, from COMPOSE_FILE environment variable or default filenames.
+    """
+    compose_file = os.environ.get("COMPOSE_FILE")
+    if compose_file:
+        return compose_file.split(os.environ.get("COMPOSE_PATH_SEPARATOR", os.pathsep))
+    return [file for file in ("docker-compose.yml", "docker-compose.override.yml") if os.path.exists(file)]
+
+
+def _get_referenced_files(file: str, content: bytes) -> List[str]:
+    """
+    Get files pulled in by a compose file through extends of services and top-level include.
+    """
+    if b"extends" not in content and b"include" not in content:
+        return []
+    try:
+        compose_config = yaml.load(content, yaml.SafeLoader)
+    except yaml.YAMLError:
+        return []
+    if not isinstance(compose_config, dict):
+        return []
+
+    references = []
+    for service in (compose_config.get("services") or {}).values():
+        extends = service.get("extends") if isinstance(service, dict) else None
+        if isinstance(extends, dict):
+            references.append(extends.get("file"))
+    for include in compose_config.get("include") or []:
+        if isinstance(include, dict):
+            for key in ("path", "env_file"):
+                value = include.get(key)
+                references.extend(value if isinstance(value, list) else [value])
+        else:
+            references.append(include)
+
+    directory = os.path.dirname(file)
+    return [os.path.normpath(os.path.join(directory, reference))
+            for reference in references if reference and isinstance(reference, str)]
+
+
+def _get_env_files(compose_config: Optional[Dict]) -> List[str]:
+    """
+    Get env_file of all services from a parsed docker compose configuration.
+    """
+    env_files = []
+    if not compose_config:
+        return env_files
+    for service in (compose_config.get("services") or {}).values():
+        service_env_files = service.get("env_file") or []
+        if not isinstance(service_env_files, list):
+            service_env_files = [service_env_files]
+        for env_file in service_env_files:
+            if isinstance(env_file, dict):
+                env_file = env_file.get("path")
+            if env_file and env_file not in env_files:
+                env_files.append(env_file)
+    return env_files
+
+
+def _get_compose_config_cache() -> Cache:
+    if caches.has(compose_config_cache_name):
+        return caches.get(compose_config_cache_name)
+    return register_project_cache(compose_config_cache_name)
+
 
 class DockerComposeYamlMissingException(Exception):
     """
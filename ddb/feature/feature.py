@@ -124,6 +124,15 @@ class Feature(RegistryObject, ABC):  # pylint:disable=abstract-method
         """
         return config.data.get(self.name + '.disabled')
 
+    @property
+    def volatile(self) -> bool:
+        """
+        Volatile features have configuration defaults depending on state that is not part of configuration files, like
+        VCS or network interfaces. Their configuration, and configuration of features depending on them, is never
+        restored from configuration snapshot.
+        """
+        return False
+
 
 class FeatureConfigurationError(Exception):
     """
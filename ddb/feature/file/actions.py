@@ -1,10 +1,9 @@
 # -*- coding: utf-8 -*-
 import logging
 import os
+from typing import TYPE_CHECKING
 
 from watchdog.events import FileSystemEventHandler
-from watchdog.observers import Observer
-from watchdog.utils.delayed_queue import DelayedQueue
 
 from ddb.action import InitializableAction
 from ddb.action.action import WatchSupport
@@ -12,7 +11,11 @@ from ddb.cache import caches, register_project_cache
 from ddb.config import config
 from ddb.context import context
 from ddb.event import events
-from ddb.utils.file import FileWalker
+from ddb.utils.file import FileWalker, get_file_signature
+
+if TYPE_CHECKING:
+    from watchdog.observers import Observer
+    from watchdog.utils.delayed_queue import DelayedQueue
 
 
 class FileWalkAction(InitializableAction, WatchSupport):
@@ -52,27 +55,35 @@ class FileWalkAction(InitializableAction, WatchSupport):
         Execute action
         """
         cache = caches.get("file")
-        found_files = set()
 
         context.log.debug('Walk through all existing files')
-        for file in self.file_walker.items:
-            cache.set(file, None)
-            found_files.add(file)
-        context.log.debug('%s files found', len(found_files))
+        files = list(self.file_walker.items)
+        found_files = set(files)
+        changed = {}
+        cached_signatures = cache.get_many(files)
+        for file in files:
+            signature = get_file_signature(file)
+            if cached_signatures[file] != signature:
+                changed[file] = signature
+        cache.set_many(changed)
+        context.log.debug('%s files found (%s new or modified)', len(found_files), len(changed))
 
         context.log.debug('Emit events for removed files using cache from previous run')
-        for cached_file in cache.keys():
-            if cached_file not in found_files:
-                cache.pop(cached_file)
-                events.file.deleted(cached_file)
+        removed_files = [cached_file for cached_file in cache.keys() if cached_file not in found_files]
+        cache.pop_many(removed_files)
+        for removed_file in removed_files:
+            events.file.deleted(removed_file)
 
         context.log.debug('Generate found events for all actual files')
-        for file in self.file_walker.items:
+        events.file.before_found_events()
+        for file in files:
             events.file.found(file)
+        events.file.after_found_events()
 
         cache.flush()
 
     def start_watching(self):
+        from watchdog.observers import Observer  # pylint:disable=import-outside-toplevel
         self.observer = Observer()
         self.observer.schedule(ObserverHandler(self), str(self.file_walker.rootpath), self.file_walker.recursive)
         self.observer.start()
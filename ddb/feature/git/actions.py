@@ -1,7 +1,6 @@
 # -*- coding: utf-8 -*-
 import os
-
-from git import Repo, InvalidGitRepositoryError
+from typing import TYPE_CHECKING
 
 from ddb.action import Action
 from ddb.config import config
@@ -9,6 +8,9 @@ from ddb.context import context
 from ddb.event import events
 from ddb.utils.file import chmod
 
+if TYPE_CHECKING:
+    from git import Repo
+
 
 class FixFilePermissionsAction(Action):
     """
@@ -32,13 +34,15 @@ class FixFilePermissionsAction(Action):
         Execute the action
         :return:
         """
+        from git import Repo, InvalidGitRepositoryError  # pylint:disable=import-outside-toplevel
+
         try:
             repo = Repo(config.paths.project_home)
             self.process_repository(repo)
         except InvalidGitRepositoryError:
             pass
 
-    def process_repository(self, repo: Repo):
+    def process_repository(self, repo: 'Repo'):
         """
         Process a repository
         :param repo: the repository to process
@@ -2,15 +2,17 @@
 import os
 import re
 from pathlib import Path
-from typing import Union, Iterable, Tuple, Optional, Set
-
-from jinja2 import Environment, FileSystemLoader, StrictUndefined
+from typing import Union, Iterable, Tuple, Optional, Set, TYPE_CHECKING
 
 from ddb.config import config, migrations
 from ddb.utils.file import TemplateFinder, SingleTemporaryFile, get_single_temporary_file_directory
 from . import filters, tests
 from ...action.action import AbstractTemplateAction
 from ...config.migrations import AbstractPropertyMigration
+from ...config.view import ConfigView
+
+if TYPE_CHECKING:
+    from jinja2 import Environment
 
 custom_filters = vars(filters)
 for k in tuple(custom_filters.keys()):
@@ -31,7 +33,7 @@ class JinjaAction(AbstractTemplateAction):
     def __init__(self):
         super().__init__()
         self.env = None  # type: Environment
-        self.context = None  # type: dict
+        self.context = None  # type: ConfigView
         self._rootpath = None  # type: str
         self._migrationpath = None  # type: str
 
@@ -39,6 +41,10 @@ class JinjaAction(AbstractTemplateAction):
     def name(self) -> str:
         return "jinja:render"
 
+    @property
+    def _parallel_rendering(self) -> bool:
+        return True
+
     def _build_template_finder(self):
         return TemplateFinder([],
                               [],
@@ -47,6 +53,8 @@ class JinjaAction(AbstractTemplateAction):
                               config.data.get("jinja.suffixes"))
 
     def initialize(self):
+        from jinja2 import Environment, FileSystemLoader, StrictUndefined  # pylint:disable=import-outside-toplevel
+
         super().initialize()
 
         self._rootpath = self.template_finder.rootpath
@@ -67,13 +75,11 @@ class JinjaAction(AbstractTemplateAction):
         self.env.filters.update(custom_filters)
         self.env.tests.update(custom_tests)
 
-        self.context = config.data.copy()
-        self.context['_config'] = {}
-        self.context['_config.eject'] = config.eject
-        self.context['_config.args'] = vars(config.args)
-        self.context['_config.unknown_args'] = config.unknown_args
+        self.context = ConfigView(config.data.raw(), {'_config': {'eject': config.eject,
+                                                                  'args': vars(config.args),
+                                                                  'unknown_args': config.unknown_args}})
 
-    def _render_template(self, template: str, target: str) -> Iterable[Tuple[Union[str, bytes, bool], str]]:
+    def _get_template_name(self, template: str):
         if template.startswith(self._migrationpath):
             template_name = os.path.relpath(os.path.normpath(template),
                                             os.path.normpath(str(self._migrationpath)))
@@ -82,10 +88,37 @@ class JinjaAction(AbstractTemplateAction):
             template_name = os.path.relpath(os.path.normpath(template),
                                             os.path.normpath(str(self._rootpath)))
 
-        template_name = Path(template_name).as_posix()
-        jinja = self.env.get_template(template_name)
+        return Path(template_name).as_posix()
+
+    def _render_template(self, template: str, target: str) -> Iterable[Tuple[Union[str, bytes, bool], str]]:
+        jinja = self.env.get_template(self._get_template_name(template))
         yield jinja.render(**self.context), target
 
+    def _render_dependencies(self, template: str) -> Optional[Iterable[str]]:
+        """
+        Templates included, imported or extended by the template, recursively.
+        """
+        from jinja2 import TemplateNotFound, meta  # pylint:disable=import-outside-toplevel
+
+        dependencies = set()
+        pending = [self._get_template_name(template)]
+        visited = set(pending)
+        while pending:
+            try:
+                source, filename, _ = self.env.loader.get_source(self.env, pending.pop())
+            except TemplateNotFound:
+                return None
+            if filename and os.path.normpath(filename) != os.path.normpath(template):
+                dependencies.add(filename)
+            for referenced in meta.find_referenced_templates(self.env.parse(source)):
+                if referenced is None:
+                    # Dynamic template name can't be resolved statically.
+                    return None
+                if referenced not in visited:
+                    visited.add(referenced)
+                    pending.append(referenced)
+        return dependencies
+
     def _autofix_render_error(self,
                               template: str,
                               target: str,
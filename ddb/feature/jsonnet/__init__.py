@@ -11,6 +11,8 @@ from ddb.action import Action
 from ddb.feature import Feature
 from .actions import JsonnetAction
 from .schema import JsonnetSchema
+from ..docker.utils import get_user_ids, get_group_id, get_users, get_groups
+from ...cache.autodetect import autodetect
 from ...config import config
 from ...utils.compat import path_as_posix_fast
 from ...utils.file import TemplateFinder
@@ -71,13 +73,13 @@ class JsonnetFeature(Feature):
             name = feature_config.get('docker.user.name')
             if name:
                 try:
-                    import pwd  # pylint:disable=import-outside-toplevel
-                    struct_passwd = pwd.getpwnam(name)
+                    pw_uid, pw_gid = autodetect(('jsonnet.docker.user.uid', 'jsonnet.docker.user.gid'),
+                                                lambda: get_user_ids(name), name)
                     if uid is None:
-                        uid = struct_passwd.pw_uid
+                        uid = pw_uid
                         feature_config['docker.user.uid'] = uid
                     if gid is None:
-                        gid = struct_passwd.pw_gid
+                        gid = pw_gid
                         feature_config['docker.user.gid'] = gid
                 except ImportError:
                     pass
@@ -87,9 +89,7 @@ class JsonnetFeature(Feature):
             group = feature_config.get('docker.user.group')
             if group:
                 try:
-                    import grp  # pylint:disable=import-outside-toplevel
-                    struct_group = grp.getgrnam(group)
-                    gid = struct_group.gr_id
+                    gid = autodetect('jsonnet.docker.user.gid', lambda: get_group_id(group), group)
                     feature_config['docker.user.gid'] = gid
                 except ImportError:
                     pass
@@ -102,21 +102,18 @@ class JsonnetFeature(Feature):
         group_to_gid = feature_config.get('docker.user.group_to_gid')
 
         try:
-            import pwd  # pylint:disable=import-outside-toplevel
-            struct_passwds = pwd.getpwall()
-            for struct_passwd in struct_passwds:
-                name_to_uid[struct_passwd.pw_name] = struct_passwd.pw_uid
-                group_to_gid[struct_passwd.pw_name] = struct_passwd.pw_gid
+            users = autodetect(('jsonnet.docker.user.name_to_uid', 'jsonnet.docker.user.group_to_gid'), get_users)
+            for pw_name, pw_uid, pw_gid in users:
+                name_to_uid[pw_name] = pw_uid
+                group_to_gid[pw_name] = pw_gid
             feature_config['docker.user.name_to_uid'] = name_to_uid
             feature_config['docker.user.group_to_gid'] = group_to_gid
         except ImportError:
             pass
 
         try:
-            import grp  # pylint:disable=import-outside-toplevel
-            struct_groups = grp.getgrall()
-            for struct_group in struct_groups:
-                group_to_gid[struct_group.gr_name] = struct_group.gr_gid
+            for gr_name, gr_gid in autodetect('jsonnet.docker.user.group_to_gid', get_groups):
+                group_to_gid[gr_name] = gr_gid
             feature_config['docker.user.group_to_gid'] = group_to_gid
         except ImportError:
             pass
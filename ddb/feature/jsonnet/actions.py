@@ -2,15 +2,19 @@
 import json
 import os
 import re
+import stat
+import time
 from importlib import import_module
-from typing import Tuple, Union, Iterable, Optional
+from typing import Tuple, Union, Iterable, Optional, Set, Dict
 
 import yaml
 from _jsonnet import evaluate_file  # pylint: disable=no-name-in-module
 
-from ddb.action.action import AbstractTemplateAction
+from ddb.action.action import AbstractTemplateAction, EventBinding
 from ddb.config import config, migrations
 from ddb.config.flatten import flatten
+from ddb.context import context
+from ddb.event import events
 from ddb.feature import features
 from ddb.utils.file import TemplateFinder, SingleTemporaryFile
 
@@ -20,10 +24,33 @@ class JsonnetAction(AbstractTemplateAction):
     Render jsonnet files based on filename suffixes.
     """
 
+    def __init__(self):
+        super().__init__()
+        self._imported_files = set()  # type: Set[str]
+        self._ext = None  # type: Optional[Tuple[Dict[str, str], Dict[str, str]]]
+        self._imports_cache = {}  # type: Dict[str, Tuple[int, str]]
+        self._imports_cache_hits = 0
+
     @property
     def name(self) -> str:
         return "jsonnet:render"
 
+    @property
+    def _parallel_rendering(self) -> bool:
+        return True
+
+    @property
+    def event_bindings(self):
+        return super().event_bindings + (EventBinding(events.config.reloaded, call=self._clear_ext),)
+
+    def initialize(self):
+        super().initialize()
+        self._clear_ext()
+        self._imports_cache = {}
+
+    def _clear_ext(self):
+        self._ext = None
+
     def _build_template_finder(self) -> TemplateFinder:
         return TemplateFinder([],
                               [],
@@ -110,22 +137,75 @@ class JsonnetAction(AbstractTemplateAction):
 
         return None
 
-    @staticmethod
-    def _evaluate_jsonnet(template_path):
-        data = config.data.copy()
-
-        vars_config = flatten(data, stop_for_features=features.all())
-        codes_config = flatten(data, keep_primitive_list=True, stop_for_features=features.all())
-        codes_config['_config.eject'] = config.eject
-        codes_config['_config.args'] = vars(config.args)
-        codes_config['_config.unknown_args'] = config.unknown_args
-        ext_vars = {k: v for (k, v) in vars_config.items() if isinstance(v, str)}
-        ext_codes = {k: str(v).lower() if isinstance(v, bool) else str(v) if v is not None else "null"
-                     for (k, v) in codes_config.items() if not isinstance(v, str)}
+    def _render_dependencies(self, template: str) -> Optional[Iterable[str]]:
+        return set(self._imported_files)
+
+    def _import_callback(self, directory: str, rel: str) -> Tuple[str, str]:
+        """
+        Resolve imports the same way jsonnet does, keeping track of imported files.
+        """
+        for base_directory in (directory, self._jpathdir):
+            path = os.path.join(base_directory, rel)
+            content = self._read_import(path)
+            if content is not None:
+                self._imported_files.add(path)
+                return path, content
+        raise RuntimeError("file not found")
+
+    def _read_import(self, path: str) -> Optional[str]:
+        """
+        Read an imported file, using contents cached from previous templates while file modification time is the same.
+        """
+        try:
+            file_stat = os.stat(path)
+        except OSError:
+            return None
+        if not stat.S_ISREG(file_stat.st_mode):
+            return None
+        cached = self._imports_cache.get(path)
+        if cached and cached[0] == file_stat.st_mtime_ns:
+            self._imports_cache_hits += 1
+            return cached[1]
+        with open(path, "r", encoding="utf-8") as imported_file:
+            content = imported_file.read()
+        self._imports_cache[path] = (file_stat.st_mtime_ns, content)
+        return content
+
+    @property
+    def _jpathdir(self):
+        return os.path.join(os.path.dirname(__file__), "lib")
+
+    def _get_ext(self) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        External variables and codes, computed once until configuration is reloaded.
+        """
+        if self._ext is None:
+            data = config.data.raw()
+            vars_config = flatten(data, stop_for_features=features.all())
+            codes_config = flatten(data, keep_primitive_list=True, stop_for_features=features.all())
+            codes_config['_config.eject'] = config.eject
+            codes_config['_config.args'] = vars(config.args)
+            codes_config['_config.unknown_args'] = config.unknown_args
+            ext_vars = {k: v for (k, v) in vars_config.items() if isinstance(v, str)}
+            ext_codes = {k: str(v).lower() if isinstance(v, bool) else str(v) if v is not None else "null"
+                         for (k, v) in codes_config.items() if not isinstance(v, str)}
+            self._ext = ext_vars, ext_codes
+        return self._ext
+
+    def _evaluate_jsonnet(self, template_path):
+        self._imported_files = set()
+        self._imports_cache_hits = 0
+        ext_vars, ext_codes = self._get_ext()
+        start = time.perf_counter()
         evaluated = evaluate_file(template_path,
                                   ext_vars=ext_vars,
                                   ext_codes=ext_codes,
-                                  jpathdir=os.path.join(os.path.dirname(__file__), "lib"))
+                                  import_callback=self._import_callback)
+        context.log.debug("%s evaluated in %.1f ms (%i imports, %i from cache)",
+                          template_path,
+                          (time.perf_counter() - start) * 1000,
+                          len(self._imported_files),
+                          self._imports_cache_hits)
         return evaluated
 
     @staticmethod
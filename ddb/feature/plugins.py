@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from ddb.__version__ import __version__
+from ddb.cache.sqlite_cache import SqliteCache
+from ddb.config import config
+
+# Directories modified less than this delay before the scan are not trusted, as a change in the same filesystem
+# timestamp granularity would be missed.
+_racy_delay_ns = 2 * 10 ** 9
+
+
+class PluginsManifest:
+    """
+    Plugin modules discovered in .ddb directories, stored in cache and reused on next runs as long as those
+    directories are unchanged.
+    """
+
+    def __init__(self):
+        self._cache = None  # type: Optional[SqliteCache]
+        self._entries = None  # type: Optional[Dict[str, Dict]]
+        self._dirty = False
+
+    def get_modules(self, extension_directory: str) -> List[str]:
+        """
+        Get plugin module names available in given extension directory, scanning it only if it has changed.
+        """
+        entries = self._get_entries()
+        entry = entries.get(extension_directory)
+        if entry and self._is_fresh(entry["directories"]):
+            return list(entry["modules"])
+
+        modules, directories = scan_plugins_modules(extension_directory)
+        if self._is_racy(directories):
+            entries.pop(extension_directory, None)
+        else:
+            entries[extension_directory] = {"modules": modules, "directories": directories}
+        self._dirty = True
+        return modules
+
+    def save(self):
+        """
+        Save the manifest if it has changed, and release the cache.
+        """
+        if self._cache is None:
+            return
+        try:
+            if self._dirty:
+                self._cache.set("manifest", {"version": __version__, "entries": self._entries})
+        finally:
+            self._cache.close()
+            self._cache = None
+
+    def _get_entries(self) -> Dict[str, Dict]:
+        if self._entries is None:
+            self._cache = self._get_cache()
+            try:
+                manifest = self._cache.get("manifest")
+            except Exception:  # pylint:disable=broad-except
+                manifest = None
+            if manifest and manifest.get("version") == __version__:
+                self._entries = manifest["entries"]
+            else:
+                self._entries = {}
+        return self._entries
+
+    @staticmethod
+    def _get_cache():
+        digest = hashlib.sha1(str(config.paths).encode("utf-8")).hexdigest()[:16]
+        return SqliteCache("plugins." + digest)
+
+    @staticmethod
+    def _is_fresh(directories: Dict[str, int]) -> bool:
+        for directory, mtime in directories.items():
+            try:
+                if os.stat(directory).st_mtime_ns != mtime:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    @staticmethod
+    def _is_racy(directories: Dict[str, int]) -> bool:
+        now = time.time_ns()
+        return any(now - mtime < _racy_delay_ns for mtime in directories.values())
+
+
+def scan_plugins_modules(extension_directory: str) -> Tuple[List[str], Dict[str, int]]:
+    """
+    Walk an extension directory to find plugin module names, with mtimes of walked directories.
+    """
+    modules = []
+    directories = {}
+    for dirpath, dirnames, files in os.walk(extension_directory):
+        dirnames[:] = [dirname for dirname in dirnames if dirname != "__pycache__"]
+        directories[dirpath] = os.stat(dirpath).st_mtime_ns
+
+        module_name = os.path.relpath(dirpath, extension_directory).replace(os.sep, ".")
+        if module_name == '.':
+            module_name = None
+
+        for file in files:
+            if file == "__init__.py":
+                if module_name:
+                    modules.append(module_name)
+            elif file.endswith("py"):
+                file_module_name = os.path.splitext(file)[0]
+                modules.append(file_module_name if not module_name else '.'.join((module_name, file_module_name)))
+    return modules, directories
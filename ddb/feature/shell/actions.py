@@ -160,13 +160,28 @@ class CreateBinaryShim(Action):
             removed = self.shell.remove_binary_shim(directories[0], binary.name)
             if removed:
                 events.file.deleted(removed)
+        elif config.data.get('shell.precompiled_shims'):
+            # Remaining binary may now be precompiled
+            self.execute(next(iter(binaries.get(binary.name))))
+
+    @staticmethod
+    def _get_precompiled_command(binary: Binary):
+        """
+        Get the precompiled command for this binary, if enabled and if this binary is the only one for its name.
+        """
+        if not config.data.get('shell.precompiled_shims'):
+            return None
+        if not binaries.has(binary.name) or len(binaries.get(binary.name)) != 1:
+            return None
+        return binary.precompiled_command()
 
     def execute(self, binary: Binary):
         """
         Create binary shim
         """
         shims_path = get_shims_path(binary.global_)
-        written, shim = self.shell.create_binary_shim(shims_path, binary.name, binary.global_)
+        written, shim = self.shell.create_binary_shim(shims_path, binary.name, binary.global_,
+                                                      self._get_precompiled_command(binary))
         if written:
             context.log.success("Shim created: %s", shim)
         else:
@@ -7,6 +7,7 @@ from typing import Tuple, Iterable, Dict, Any, Optional
 from slugify import slugify
 
 from ddb.binary import Binary
+from ddb.binary.binary import PrecompiledCommand
 from ddb.config import config
 from ddb.utils.file import force_remove, write_if_different, chmod
 
@@ -46,9 +47,11 @@ class ShellIntegration(ABC):
         """
 
     @abstractmethod
-    def create_binary_shim(self, shims_path: str, name: str, global_: bool) -> Tuple[bool, str]:
+    def create_binary_shim(self, shims_path: str, name: str, global_: bool,
+                           precompiled: Optional[PrecompiledCommand] = None) -> Tuple[bool, str]:
         """
-        Add a binary shim for this shell.
+        Add a binary shim for this shell. If precompiled command is given and supported by the shell, the shim may run
+        it directly instead of invoking ddb.
         :return created filepath
         """
 
@@ -137,8 +140,12 @@ class BashShellIntegration(ShellIntegration):
         force_remove(shim)
         return shim
 
-    def create_binary_shim(self, shims_path: str, name: str, global_: bool):
+    def create_binary_shim(self, shims_path: str, name: str, global_: bool,
+                           precompiled: Optional[PrecompiledCommand] = None):
         command = []
+        if precompiled and not global_:
+            command.extend(self._precompiled_command_lines(precompiled))
+
         if global_:
             ddb_project_home_variable = next(
                 self.set_environment_variable(config.env_prefix + "_PROJECT_HOME", config.paths.project_home)
@@ -164,6 +171,34 @@ class BashShellIntegration(ShellIntegration):
 
         return self._write_shim(shims_path, name, 'binary', command)
 
+    @staticmethod
+    def _precompiled_command_lines(precompiled: PrecompiledCommand) -> Iterable[str]:
+        """
+        Run the precompiled command without invoking ddb, when working directory is inside project home.
+        """
+        command = ' '.join(shlex.quote(arg) for arg in precompiled.prefix)
+        if precompiled.workdir:
+            command += ' --workdir=' + shlex.quote(precompiled.workdir.rstrip('/')) + '/"${relpath:-.}"'
+        command += ' ' + ' '.join(shlex.quote(arg) for arg in precompiled.suffix) + ' "$@"'
+
+        project_homes = [config.paths.project_home]
+        real_project_home = os.path.realpath(config.paths.project_home)
+        if real_project_home != config.paths.project_home:
+            project_homes.append(real_project_home)
+
+        # DockerBinary always reads DDB_RUN_OPTS, whatever the env_prefix.
+        yield 'if [ -z "$DDB_RUN_OPTS" ]; then'
+        yield '  for project_home in ' + ' '.join(shlex.quote(project_home) for project_home in project_homes) + '; do'
+        yield '    case "$PWD/" in'
+        yield '      "$project_home"/*)'
+        yield '        relpath="${PWD#"$project_home"}"'
+        yield '        relpath="${relpath#/}"'
+        yield '        exec ' + command
+        yield '        ;;'
+        yield '    esac'
+        yield '  done'
+        yield 'fi'
+
     def create_alias_binary_shim(self, shims_path: str, binary: Binary) -> Tuple[bool, str]:
         return self._write_shim(shims_path, binary.name, 'alias', [' '.join(binary.command()) + ' "$@"'])
 
@@ -233,7 +268,9 @@ class CmdShellIntegration(ShellIntegration):
         force_remove(shim)
         return shim
 
-    def create_binary_shim(self, shims_path: str, name: str, global_: bool):
+    def create_binary_shim(self, shims_path: str, name: str, global_: bool,
+                           precompiled: Optional[PrecompiledCommand] = None):
+        # Precompiled commands are not supported, as cmd.exe can't resolve working directory relative to project home.
         commands = []
         if global_:
             commands.extend(
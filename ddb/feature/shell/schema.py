@@ -42,3 +42,4 @@ class ShellSchema(FeatureSchema):
     ])
     aliases = fields.Dict(required=False, dump_default={})
     global_aliases = fields.List(fields.String(), required=False, dump_default=[])
+    precompiled_shims = fields.Boolean(required=False, dump_default=False)
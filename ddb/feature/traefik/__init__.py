@@ -26,6 +26,10 @@ class TraefikFeature(Feature):
     def dependencies(self) -> Iterable[str]:
         return ["core", "certs[optional]"]
 
+    @property
+    def volatile(self) -> bool:
+        return True
+
     @property
     def schema(self) -> ClassVar[FeatureSchema]:
         return TraefikSchema
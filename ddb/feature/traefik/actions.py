@@ -1,28 +1,36 @@
 # -*- coding: utf-8 -*-
 import os
 import re
-from typing import Dict
-
-from jinja2 import Template
+from typing import Dict, TYPE_CHECKING
 
 from ddb.config import config
 from ddb.feature.traefik.schema import ExtraServiceSchema
 from ...action import Action, InitializableAction
+from ...action.runner import ExpectedError
 from ...cache.removal import RemovalCacheSupport
-from ...config.migrations import MigrationsDotty
+from ...config.view import ConfigView
 from ...context import context
 from ...event import events
 from ...utils.file import write_if_different, copy_if_different, force_remove, FileUtils
 
+if TYPE_CHECKING:
+    from jinja2 import Template
+
 
-def get_template(template: str) -> Template:
+def get_template(template: str) -> 'Template':
     """
     Retrieve the template object base on the input template string
     :param template: the template
     :return:
     """
+    from jinja2 import Template  # pylint:disable=import-outside-toplevel
+
     if re.compile('^(https?|file)://').match(template):
-        return Template(FileUtils.get_file_content(template))
+        import requests  # pylint:disable=import-outside-toplevel
+        try:
+            return Template(FileUtils.get_file_content(template))
+        except requests.HTTPError as error:
+            raise ExpectedError("Unable to download template from %s (%s)" % (template, error)) from error
     return Template(template)
 
 
@@ -56,11 +64,10 @@ class TraefikInstalllCertsAction(Action):
         certificate_filename_target = os.path.join(certs_directory, certificate_filename)
         copy_if_different(certificate, certificate_filename_target, log=True)
 
-        config_data = dict(config.data)
-        config_data['_local'] = {
+        config_data = ConfigView(config.data, {'_local': {
             'certFile': '/'.join([mapped_certs_directory, certificate_filename]),
             'keyFile': '/'.join([mapped_certs_directory, private_key_filename])
-        }
+        }})
 
         ssl_config = get_template(config.data.get('traefik.ssl_config_template')).render(config_data)
 
@@ -188,10 +195,10 @@ class TraefikExtraServicesAction(InitializableAction):
 
     @staticmethod
     def _prepare_extra_service_data(extra_service, id_):
-        data = MigrationsDotty(dict(config.data))
         extra_service_data = dict(extra_service)
         extra_service_data['id'] = id_
-        data['_local'] = extra_service_data
+        data = ConfigView(config.data, {'_local': extra_service_data})
+        from jinja2 import Template  # pylint:disable=import-outside-toplevel
         if extra_service_data.get('domain'):
             extra_service_data['domain'] = Template(extra_service_data.get('domain')).render(data)
         if extra_service_data.get('rule'):
@@ -1,117 +1,144 @@
 # -*- coding: utf-8 -*-
+import re
 from subprocess import CalledProcessError
-from typing import ClassVar, Iterable
+from typing import ClassVar, Iterable, Dict, Optional, Tuple
 
 from dotty_dict import Dotty
 
 from ddb.feature import Feature
+from .git import find_git_dir, GitRepository
 from .schema import VersionSchema
+from ...cache import caches, register_global_cache, Cache
 from ...utils.process import run
 
 
+vcs_cache_name = "version.vcs"
+
+_describe_re = re.compile(r"^(.*)-(\d+)-g([0-9a-f]+)$")
+
+
 def is_git_repository():
     """
-    Check if git command line is available, and if a git repository index is available in current directory
+    Check if a git repository is available in current directory
     """
-    try:
-        run("git", "rev-parse", "--git-dir")
-        return True
-    except CalledProcessError:
-        return False
+    return find_git_dir() is not None
 
 
-def get_tag_from_vcs():
+def get_vcs_info() -> Dict[str, Optional[str]]:
     """
-    Get last tag from git index
+    Get branch, version, tag, hash and short_hash of current git repository.
+
+    HEAD and refs are read from git directory. Values are cached against HEAD and refs state, so git is invoked only
+    once after a change of this state to describe HEAD.
+    """
+    git_dir = find_git_dir()
+    if not git_dir:
+        return dict.fromkeys(("branch", "version", "tag", "hash", "short_hash"))
+
+    repository = GitRepository(git_dir)
+    signature = repository.signature()
+
+    cache = _get_vcs_cache()
+    cached = cache.get(git_dir)
+    if cached and cached.get("signature") == signature:
+        return cached["info"]
+
+    info = _read_vcs_info(repository)
+    cache.set(git_dir, {"signature": signature, "info": info})
+    cache.flush()
+    return info
+
+
+def _read_vcs_info(repository: GitRepository) -> Dict[str, Optional[str]]:
+    hash_value = repository.resolve("HEAD")
+    if not hash_value:
+        return dict.fromkeys(("branch", "version", "tag", "hash", "short_hash"))
+
+    tag, version, short_hash = _describe()
+    return {"branch": _get_branch(repository),
+            "version": version,
+            "tag": tag,
+            "hash": hash_value,
+            "short_hash": short_hash}
+
+
+def _get_branch(repository: GitRepository) -> Optional[str]:
+    head = repository.head()
+    if head:
+        return head[len("refs/heads/"):] if head.startswith("refs/heads/") else head[len("refs/"):]
+
+    # CI checkout a commit hash, making the HEAD detached.
+    refs = repository.refs("refs/heads/")
+    if refs:
+        return refs[0][len("refs/heads/"):]
+
+    # CI may not checkout branches locally, so try with remote origin
+    remote = 'origin'
+    refs = [ref for ref in repository.refs("refs/remotes/" + remote + "/") if ref != "refs/remotes/origin/HEAD"]
+    if refs:
+        return refs[0][len("refs/remotes/" + remote + "/"):]
+
+    return "HEAD"
+
+
+def _describe() -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """
+    Get last tag, version and short hash of HEAD with a single git describe.
     """
     try:
-        return run("git", "describe", "--tags", "--abbrev=0").decode("utf-8").strip()
+        output = run("git", "describe", "--tags", "--long", "--always").decode("utf-8").strip()
     except CalledProcessError as exc:
         if exc.returncode == 128:
-            return None
+            return None, None, None
         raise
 
+    match = _describe_re.match(output)
+    if not match:
+        return None, None, output or None
+
+    tag, distance, short_hash = match.groups()
+    return tag, tag if distance == "0" else output, short_hash
+
+
+def _get_vcs_cache() -> Cache:
+    if caches.has(vcs_cache_name):
+        return caches.get(vcs_cache_name)
+    return register_global_cache(vcs_cache_name)
+
+
+def get_tag_from_vcs():
+    """
+    Get last tag from git index
+    """
+    return get_vcs_info()["tag"]
+
 
 def get_branch_from_vcs():
     """
     Get branch name from git index
     """
-    try:
-        branch = run("git", "rev-parse", "--abbrev-ref", "HEAD").decode("utf-8").strip()
-    except CalledProcessError as exc:
-        if exc.returncode == 128:
-            return None
-        raise
-
-    if branch == "HEAD":
-        # CI checkout a commit hash, making the HEAD detached.
-        try:
-            refs = run("git", "for-each-ref", "--format=%(refname:short)", "refs/heads") \
-                .decode("utf-8").strip()
-
-            if refs:
-                refs_split = refs.splitlines()
-                if refs_split:
-                    return refs_split[0]
-        except CalledProcessError as exc:
-            if exc.returncode == 128:
-                return branch
-            raise
-
-        # CI may not checkout branches locally, so try with remote origin
-        try:
-            remote = 'origin'
-            refs = run("git", "for-each-ref", "--format=%(refname:short)", "refs/remotes/" + remote) \
-                .decode("utf-8").strip()
-
-            if refs:
-                refs_split = refs.splitlines()
-                if refs_split:
-                    value = refs_split[0]
-                    if value.startswith(remote + '/'):
-                        return value[len(remote + 'origin/'):]
-        except CalledProcessError as exc:
-            if exc.returncode == 128:
-                return branch
-            raise
-
-    return branch
+    return get_vcs_info()["branch"]
 
 
 def get_version_from_vcs():
     """
     Get version from git index
     """
-    try:
-        return run("git", "describe", "--tags").decode("utf-8").strip()
-    except CalledProcessError as exc:
-        if exc.returncode == 128:
-            return None
-        raise
+    return get_vcs_info()["version"]
 
 
 def get_hash_from_vcs():
     """
     Get commit hash from git index
     """
-    try:
-        return run("git", "rev-parse", "HEAD").decode("utf-8").strip()
-    except CalledProcessError as exc:
-        if exc.returncode == 128:
-            return None
-        raise
+    return get_vcs_info()["hash"]
 
 
 def get_short_hash_from_vcs():
     """
     Get commit short hash from git index
     """
-    try:
-        return run("git", "log", "--pretty=format:%h", "-n", "1").decode("utf-8").strip()
-    except CalledProcessError as exc:
-        if exc.returncode == 128:
-            return None
-        raise
+    return get_vcs_info()["short_hash"]
 
 
 class VersionFeature(Feature):
@@ -127,6 +154,10 @@ class VersionFeature(Feature):
     def dependencies(self) -> Iterable[str]:
         return ["core"]
 
+    @property
+    def volatile(self) -> bool:
+        return True
+
     @property
     def schema(self) -> ClassVar[VersionSchema]:
         return VersionSchema
@@ -135,27 +166,9 @@ class VersionFeature(Feature):
         if not is_git_repository():
             return
 
-        branch = feature_config.get("branch")
-        if branch is None:
-            branch = get_branch_from_vcs()
-            feature_config["branch"] = branch
-
-        version = feature_config.get("version")
-        if version is None:
-            version = get_version_from_vcs()
-            feature_config["version"] = version
-
-        tag = feature_config.get("tag")
-        if tag is None:
-            tag = get_tag_from_vcs()
-            feature_config["tag"] = tag
-
-        hash_value = feature_config.get("hash")
-        if hash_value is None:
-            hash_value = get_hash_from_vcs()
-            feature_config["hash"] = hash_value
-
-        short_hash = feature_config.get("short_hash")
-        if short_hash is None:
-            short_hash = get_short_hash_from_vcs()
-            feature_config["short_hash"] = short_hash
+        vcs_info = None
+        for key in ("branch", "version", "tag", "hash", "short_hash"):
+            if feature_config.get(key) is None:
+                if vcs_info is None:
+                    vcs_info = get_vcs_info()
+                feature_config[key] = vcs_info[key]
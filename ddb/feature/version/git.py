@@ -0,0 +1,153 @@
+# -*- coding: utf-8 -*-
+import os
+from typing import Optional, Dict, List, Tuple
+
+
+def find_git_dir(path: Optional[str] = None) -> Optional[str]:
+    """
+    Find the git directory of the repository containing given path, or current working directory.
+    """
+    git_dir = os.environ.get("GIT_DIR")
+    if git_dir:
+        git_dir = os.path.abspath(git_dir)
+        return git_dir if os.path.isfile(os.path.join(git_dir, "HEAD")) else None
+
+    path = os.path.abspath(path if path else os.getcwd())
+    while True:
+        dot_git = os.path.join(path, ".git")
+        if os.path.isfile(os.path.join(dot_git, "HEAD")):
+            return dot_git
+        if os.path.isfile(dot_git):
+            git_dir = _read_gitdir_file(dot_git)
+            if git_dir:
+                return git_dir
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+def _read_gitdir_file(dot_git: str) -> Optional[str]:
+    """
+    Read a .git file, used by worktrees and submodules to link the working tree to it's git directory.
+    """
+    try:
+        with open(dot_git, "r", encoding="utf-8") as dot_git_file:
+            content = dot_git_file.read().strip()
+    except OSError:
+        return None
+    if not content.startswith("gitdir:"):
+        return None
+    git_dir = os.path.join(os.path.dirname(dot_git), content[len("gitdir:"):].strip())
+    return os.path.normpath(git_dir) if os.path.isfile(os.path.join(git_dir, "HEAD")) else None
+
+
+class GitRepository:
+    """
+    Read HEAD and refs of a git repository directly from git directory, without running git.
+    """
+
+    def __init__(self, git_dir: str):
+        self.git_dir = git_dir
+        self.common_dir = git_dir
+        commondir_file = os.path.join(git_dir, "commondir")
+        if os.path.isfile(commondir_file):
+            with open(commondir_file, "r", encoding="utf-8") as commondir:
+                self.common_dir = os.path.normpath(os.path.join(git_dir, commondir.read().strip()))
+        self._packed_refs = None
+
+    def signature(self) -> Tuple:
+        """
+        Signature of HEAD and refs state. It changes when HEAD moves, or when a ref is created, updated or removed,
+        as git writes refs through a lock file renamed in it's parent directory.
+        """
+        signature = []
+        for filepath in (os.path.join(self.git_dir, "HEAD"),
+                         os.path.join(self.common_dir, "packed-refs"),
+                         os.path.join(self.common_dir, "shallow")):
+            signature.append(self._stat(filepath))
+
+        head = self.read_ref_file(os.path.join(self.git_dir, "HEAD"))
+        if head and head.startswith("ref: "):
+            signature.append(self._stat(os.path.join(self.common_dir, head[len("ref: "):])))
+
+        for dirpath, _, _ in os.walk(os.path.join(self.common_dir, "refs")):
+            signature.append(self._stat(dirpath))
+
+        return tuple(signature)
+
+    @staticmethod
+    def _stat(filepath: str):
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return filepath, None
+        return filepath, stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def read_ref_file(filepath: str) -> Optional[str]:
+        """
+        Read content of a ref file, or None if it doesn't exist.
+        """
+        try:
+            with open(filepath, "r", encoding="utf-8") as ref_file:
+                return ref_file.read().strip()
+        except OSError:
+            return None
+
+    @property
+    def packed_refs(self) -> Dict[str, str]:
+        """
+        Refs stored in packed-refs file, by ref name.
+        """
+        if self._packed_refs is None:
+            self._packed_refs = {}
+            content = self.read_ref_file(os.path.join(self.common_dir, "packed-refs"))
+            if content:
+                for line in content.splitlines():
+                    if not line or line.startswith("#") or line.startswith("^"):
+                        continue
+                    value, _, name = line.partition(" ")
+                    self._packed_refs[name.strip()] = value
+        return self._packed_refs
+
+    def head(self) -> Optional[str]:
+        """
+        Ref name HEAD is pointing to, or None if HEAD is detached.
+        """
+        head = self.read_ref_file(os.path.join(self.git_dir, "HEAD"))
+        if head and head.startswith("ref: "):
+            return head[len("ref: "):].strip()
+        return None
+
+    def resolve(self, ref: str) -> Optional[str]:
+        """
+        Resolve a ref name to a commit hash, following symbolic refs.
+        """
+        for _ in range(10):
+            if ref == "HEAD":
+                value = self.read_ref_file(os.path.join(self.git_dir, "HEAD"))
+            else:
+                value = self.read_ref_file(os.path.join(self.common_dir, ref))
+                if value is None:
+                    value = self.packed_refs.get(ref)
+            if not value:
+                return None
+            if not value.startswith("ref: "):
+                return value
+            ref = value[len("ref: "):].strip()
+        return None
+
+    def refs(self, prefix: str) -> List[str]:
+        """
+        Sorted ref names starting with given prefix, from both loose refs and packed-refs.
+        """
+        names = {name for name in self.packed_refs if name.startswith(prefix)}
+        refs_dir = os.path.join(self.common_dir, *prefix.rstrip("/").split("/"))
+        for dirpath, _, filenames in os.walk(refs_dir):
+            for filename in filenames:
+                if filename.endswith(".lock"):
+                    continue
+                filepath = os.path.join(dirpath, filename)
+                names.add("/".join(os.path.relpath(filepath, self.common_dir).split(os.sep)))
+        return sorted(names)
@@ -1,14 +1,17 @@
 # -*- coding: utf-8 -*-
 import os
 import re
+import shutil
 import tempfile
-from typing import Union, Iterable, Tuple, Optional
+from collections import OrderedDict
+from typing import Union, Iterable, Tuple, Optional, List
 
 import yaml
 
 from ddb.action.action import AbstractTemplateAction
 from ddb.config import config, migrations
 from ddb.config.migrations import AbstractPropertyMigration
+from ddb.context import context
 from ddb.utils.file import TemplateFinder, SingleTemporaryFile
 from ddb.utils.process import run
 
@@ -18,10 +21,19 @@ class YttAction(AbstractTemplateAction):
     Render ytt files based on filename suffixes.
     """
 
+    def __init__(self):
+        super().__init__()
+        self._depends_files = []  # type: List[str]
+        self._depends_directory = os.curdir
+
     @property
     def name(self) -> str:
         return "ytt:render"
 
+    @property
+    def _parallel_rendering(self) -> bool:
+        return True
+
     def _build_template_finder(self):
         return TemplateFinder([],
                               [],
@@ -49,9 +61,8 @@ class YttAction(AbstractTemplateAction):
             new['_config']['unknown_args'] = list(config.unknown_args)
         return new
 
-    def _render_template(self, template: str, target: str) -> Iterable[Tuple[Union[str, bytes, bool], str]]:
-        yaml_config = yaml.safe_dump(YttAction._escape_config(config.data.raw()))
-
+    @staticmethod
+    def _find_depends_files(target: str) -> List[str]:
         includes = TemplateFinder.build_default_includes_from_suffixes(
             config.data["ytt.depends_suffixes"],
             config.data["ytt.extensions"]
@@ -67,31 +78,110 @@ class YttAction(AbstractTemplateAction):
         depends_files = [template[0] for template in template_finder.items]
         if target in depends_files:
             depends_files.remove(target)
+        return depends_files
+
+    @staticmethod
+    def _write_data_values_file() -> str:
+        """
+        Write configuration to a temporary ytt data values file.
+        """
+        yaml_config = yaml.safe_dump(YttAction._escape_config(config.data.raw()))
 
-        input_files_args = []
         # pylint:disable=consider-using-with
         yaml_config_file = tempfile.NamedTemporaryFile("w", suffix=".yml", encoding="utf-8", delete=False)
+        try:
+            yaml_config_file.write("#@data/values")
+            yaml_config_file.write(os.linesep)
+            yaml_config_file.write("---")
+            yaml_config_file.write(os.linesep)
+            yaml_config_file.write(yaml_config)
+            yaml_config_file.flush()
+        finally:
+            yaml_config_file.close()
+        return yaml_config_file.name
+
+    def _render_template(self, template: str, target: str) -> Iterable[Tuple[Union[str, bytes, bool], str]]:
+        depends_files = self._find_depends_files(target)
+        self._depends_files = depends_files
+        self._depends_directory = os.path.dirname(target) or os.curdir
 
+        yaml_config_file = self._write_data_values_file()
         try:
-            try:
-                input_files = [template, yaml_config_file.name] + depends_files
-                for input_file in input_files:
-                    input_files_args += ["-f", input_file]
-
-                yaml_config_file.write("#@data/values")
-                yaml_config_file.write(os.linesep)
-                yaml_config_file.write("---")
-                yaml_config_file.write(os.linesep)
-                yaml_config_file.write(yaml_config)
-                yaml_config_file.flush()
-            finally:
-                yaml_config_file.close()
+            input_files_args = []
+            input_files = [template, yaml_config_file] + depends_files
+            for input_file in input_files:
+                input_files_args += ["-f", input_file]
 
             rendered = run("ytt", *input_files_args, *config.data["ytt.args"])
 
             yield rendered, target
         finally:
-            os.unlink(yaml_config_file.name)
+            os.unlink(yaml_config_file)
+
+    @property
+    def _batch_enabled(self) -> bool:
+        return config.data.get("ytt.batch") or super()._batch_enabled
+
+    def _render_batch_items(self, batch: List[Tuple[str, str]]) -> List[Optional[Tuple[list, Optional[list]]]]:
+        if not config.data.get("ytt.batch"):
+            return super()._render_batch_items(batch)
+
+        groups = OrderedDict()
+        for index, (template, target) in enumerate(batch):
+            groups.setdefault((os.path.dirname(template), os.path.dirname(target)), []).append(index)
+
+        results = [None] * len(batch)
+        yaml_config_file = self._write_data_values_file()
+        try:
+            for indexes in groups.values():
+                group = [batch[index] for index in indexes]
+                for index, result in zip(indexes, self._render_group(group, yaml_config_file)):
+                    results[index] = result
+        finally:
+            os.unlink(yaml_config_file)
+        return results
+
+    def _render_group(self, group: List[Tuple[str, str]], yaml_config_file: str) \
+            -> List[Optional[Tuple[list, Optional[list]]]]:
+        """
+        Render templates from the same directory with a single ytt invocation, each template being written to its
+        own file in a temporary output directory.
+        """
+        target = group[0][1]
+        depends_files = self._find_depends_files(target)
+        for _, group_target in group:
+            if group_target in depends_files:
+                depends_files.remove(group_target)
+        dependencies = depends_files + [os.path.dirname(target) or os.curdir]
+
+        input_files_args = []
+        for input_file in [template for template, _ in group] + [yaml_config_file] + depends_files:
+            input_files_args += ["-f", input_file]
+
+        output_directory = tempfile.mkdtemp(prefix="ddb-ytt-")
+        try:
+            try:
+                run("ytt", *input_files_args, *config.data["ytt.args"], "--output-files", output_directory)
+            except Exception as error:  # pylint:disable=broad-except
+                context.log.warning("ytt batch rendering has failed, templates will be rendered one by one: %s", error)
+                return [None] * len(group)
+
+            results = []
+            for template, group_target in group:
+                output_file = os.path.join(output_directory, os.path.basename(template))
+                if not os.path.isfile(output_file):
+                    context.log.warning("ytt batch output of %s is missing, template will be rendered alone", template)
+                    results.append(None)
+                    continue
+                with open(output_file, "rb") as rendered_file:
+                    results.append(([(rendered_file.read(), group_target)], dependencies))
+            return results
+        finally:
+            shutil.rmtree(output_directory, ignore_errors=True)
+
+    def _render_dependencies(self, template: str) -> Optional[Iterable[str]]:
+        # Target directory is a dependency too, as its modification time changes when a depends file is added.
+        return self._depends_files + [self._depends_directory]
 
     def _autofix_render_error(self,
                               template: str,
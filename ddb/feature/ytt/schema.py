@@ -22,3 +22,4 @@ class YttSchema(FeatureSchema):
     args = fields.List(fields.String(), dump_default=["--ignore-unknown-comments"])
     keywords = fields.List(fields.String(), dump_default=keywords + reserved)
     keywords_escape_format = fields.String(dump_default="%s_")
+    batch = fields.Boolean(dump_default=False)
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+import hashlib
+import json
+import os
+import socket
+import stat
+import sys
+import tempfile
+from typing import Optional, Sequence
+
+from ddb.__version__ import __version__
+
+# This module is imported before features are loaded, so it should only rely on the standard library.
+
+
+def get_socket_directory() -> str:
+    """
+    Get the directory containing daemon sockets, private to current user.
+
+    It's inside the user runtime directory if available, or directly inside temporary directory otherwise, so that
+    another user can't rename it.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isabs(runtime_dir):
+        return os.path.join(runtime_dir, "ddb")
+    user = str(os.getuid()) if hasattr(os, "getuid") else "default"  # pylint:disable=no-member
+    return os.path.join(tempfile.gettempdir(), "ddb-daemon-" + user)
+
+
+def get_socket_path(project_home: str) -> str:
+    """
+    Get the unix socket path of the daemon serving given project.
+    """
+    digest = hashlib.sha1(os.path.abspath(project_home).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(get_socket_directory(), digest + ".sock")
+
+
+def is_private(path: str) -> bool:
+    """
+    Check if path is owned by current user, and not writable by group or others.
+    """
+    if not hasattr(os, "getuid"):
+        return False
+    try:
+        path_stat = os.lstat(path)
+    except OSError:
+        return False
+    return path_stat.st_uid == os.getuid() and \
+        not path_stat.st_mode & (stat.S_IWGRP | stat.S_IWOTH)  # pylint:disable=no-member
+
+
+def send_message(sock: socket.socket, message: dict):
+    """
+    Send a json message through the socket.
+    """
+    sock.sendall(json.dumps(message).encode("utf-8") + b"\n")
+
+
+def receive_message(sock: socket.socket) -> Optional[dict]:
+    """
+    Receive a json message from the socket.
+    """
+    with sock.makefile("rb") as stream:
+        line = stream.readline()
+    if not line:
+        return None
+    return json.loads(line.decode("utf-8"))
+
+
+def run_with_daemon(args: Sequence[str], project_home: Optional[str],  # pylint:disable=too-many-return-statements
+                    env_prefix="DDB") -> Optional[int]:
+    """
+    Forward the command line to the daemon serving the project, if any.
+
+    Returns the exit code of the command, or None if the command should be handled by the current process.
+    """
+    if not args or not project_home or not hasattr(socket, "AF_UNIX"):
+        return None
+
+    if args[0].startswith("-"):
+        # Global options like --clear-cache or --watch are not supported by the daemon.
+        return None
+
+    if os.environ.get(env_prefix + "_DAEMON", "").lower() in ("0", "false"):
+        return None
+
+    socket_path = get_socket_path(project_home)
+    if not os.path.exists(socket_path):
+        return None
+
+    if not is_private(os.path.dirname(socket_path)) or not is_private(socket_path):
+        # Output of the daemon is evaluated by shims, so it should not be served by another user.
+        return None
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:  # pylint:disable=no-member
+            sock.connect(socket_path)
+            send_message(sock, {"version": __version__,
+                                "args": list(args),
+                                "cwd": os.getcwd(),
+                                "environ": dict(os.environ)})
+            response = receive_message(sock)
+    except ConnectionRefusedError:
+        # Daemon has been killed without removing its socket.
+        try:
+            os.remove(socket_path)
+        except OSError:
+            pass
+        return None
+    except (OSError, ValueError):
+        return None
+
+    if not response or response.get("status") != "ok":
+        return None
+
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stdout.flush()
+    sys.stderr.write(response.get("stderr", ""))
+    sys.stderr.flush()
+    return response.get("exit_code", 0)
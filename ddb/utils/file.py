@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 import fnmatch
+import hashlib
 import os
+import posixpath
 import re
 import shutil
 from pathlib import Path
@@ -8,7 +10,6 @@ from tempfile import gettempdir, NamedTemporaryFile
 from typing import List, Union, Optional, Tuple
 
 import chmod_monkey
-import requests
 from braceexpand import braceexpand
 
 from ddb.config import config
@@ -28,22 +29,19 @@ def has_same_content(filename1: str, filename2: str, read_mode='rb') -> bool:
 def write_if_different(file, data, read_mode='r', write_mode='w', log_source=None, readonly=True, **kwargs) -> bool:
     """
     Write the file if existing data is different than given data.
+
+    Existing data is compared with bytes that would be written, so the file is not read when its size is different.
+    read_mode is kept for compatibility.
     """
+    # pylint:disable=unused-argument
     try:
-        read_encoding = "utf-8" if 'b' not in read_mode else None  # TODO: make default encoding configurable
-        write_encoding = "utf-8" if 'b' not in write_mode else None
+        write_encoding = "utf-8" if 'b' not in write_mode else None  # TODO: make default encoding configurable
+        expected = encode_content(data, 'b' in write_mode, kwargs.get('newline'))
 
-        if os.path.exists(file):
-            try:
-                with open(file, mode=read_mode, encoding=read_encoding, **kwargs) as read_file:
-                    existing_data = read_file.read()
-            except OSError:
-                shutil.rmtree(file)
-                existing_data = None
-        else:
-            existing_data = None
+        if os.path.isdir(file):
+            shutil.rmtree(file)
 
-        if existing_data == data:
+        if is_content_equal(file, expected):
             context.log.notice("%s -> %s", log_source if log_source else "", file)
             return False
 
@@ -60,6 +58,56 @@ def write_if_different(file, data, read_mode='r', write_mode='w', log_source=Non
             chmod(file, '+r', logging=False)
 
 
+def encode_content(data: Union[str, bytes], binary: bool, newline: Optional[str] = None) -> bytes:
+    """
+    Bytes written in a file opened with given binary flag and newline, for given data.
+    """
+    if binary:
+        return bytes(data)
+    if newline is None:
+        newline = os.linesep
+    if newline not in ('', '\n'):
+        data = data.replace('\n', newline)
+    return data.encode("utf-8")
+
+
+def is_content_equal(file: str, content: bytes) -> bool:
+    """
+    Check if file content is equal to given content, without reading the file when its size is different.
+    """
+    try:
+        if os.path.getsize(file) != len(content):
+            return False
+        with open(file, mode='rb') as read_file:
+            return read_file.read() == content
+    except OSError:
+        return False
+
+
+def get_content_digest(content: bytes) -> Tuple[int, str]:
+    """
+    Get size and digest of given content.
+    """
+    return len(content), hashlib.blake2b(content, digest_size=16).hexdigest()
+
+
+def is_content_digest_equal(file: str, content_digest: Tuple[int, str]) -> bool:
+    """
+    Check if file content match given size and digest, without reading the file when its size is different.
+    """
+    size, digest = content_digest
+    try:
+        if os.path.getsize(file) != size:
+            return False
+        file_hash = hashlib.blake2b(digest_size=16)
+        with open(file, mode='rb') as read_file:
+            for chunk in iter(lambda: read_file.read(65536), b''):
+                file_hash.update(chunk)
+        return file_hash.hexdigest() == digest
+    except OSError:
+        return False
+
+
 def copy_if_different(source, target, read_mode='r', write_mode='w', log=False, readonly=True, **kwargs) -> bool:
     """
     Copy source to target if existing source data is different than target data.
@@ -114,6 +162,17 @@ def force_remove(file: str, silent=False):
             context.log.warning("%s can't be removed because it's already absent", file)
 
 
+def get_file_signature(file: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Get the stat signature of a file, as a (mtime_ns, size, inode) tuple. Returns None if file doesn't exist.
+    """
+    try:
+        stat = os.stat(file)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size, stat.st_ino
+
+
 def chmod(file: str, mode: str, logging=True):
     """
     Apply given mode to file
@@ -139,10 +198,12 @@ class FileUtils:
         Get the content of the file
         :param url: the path to the file (https? or file)
         :return:
+        :raises requests.HTTPError: if the server responds with an error status
         """
         if url.startswith('file://'):
             return FileUtils._get_local_file_content(url)
-        return requests.get(url).text
+        from ddb.cache import http_cache  # pylint:disable=import-outside-toplevel
+        return http_cache().get(url).text
 
     @staticmethod
     def _get_local_file_content(file_path: str) -> str:
@@ -158,6 +219,85 @@ class FileUtils:
             return file.read().decode("utf-8")
 
 
+class PathMatcher:
+    """
+    Match paths against a list of glob patterns.
+
+    Patterns are split into buckets, so most checks are set lookups or plain string comparisons: literal patterns,
+    literal prefixes (`dir/*`), literal suffixes (`**/.git`), literal contents (`*/_*`), and other glob patterns. Those
+    last ones are compiled to regular expressions, grouped by their literal prefix.
+
+    Like fnmatch, `*` also matches `/`. Candidates are matched both with and without a leading `./`.
+    """
+
+    _wildcards = ('*', '?', '[')
+
+    def __init__(self, patterns: Optional[List[str]]):
+        self.patterns = list(patterns) if patterns else []
+        self.literals = set()
+        prefixes = []
+        suffixes = []
+        self.contains = []
+        globs = {}
+        for pattern in self.patterns:
+            leading = len(pattern) - len(pattern.lstrip('*'))
+            literal = pattern[leading:].rstrip('*')
+            trailing = len(pattern) - leading - len(literal)
+            if not literal and (leading or trailing):
+                self.contains.append('')
+            elif any(wildcard in literal for wildcard in self._wildcards):
+                prefix = pattern[:min(pattern.find(wildcard) for wildcard in self._wildcards
+                                      if wildcard in pattern)]
+                globs.setdefault(prefix, []).append(fnmatch.translate(pattern))
+            elif leading and trailing:
+                self.contains.append(literal)
+            elif leading:
+                suffixes.append(literal)
+            elif trailing:
+                prefixes.append(literal)
+            else:
+                self.literals.add(literal)
+        self.prefixes = tuple(prefixes)
+        self.suffixes = tuple(suffixes)
+        self.globs = [(prefix, re.compile(build_or_pattern(translated))) for prefix, translated in globs.items()]
+
+    def __bool__(self):
+        return bool(self.patterns)
+
+    @staticmethod
+    def normalize(candidate: str) -> Tuple[str, str]:
+        """
+        Normalize a path candidate into alternatives to match, with and without a leading `./`.
+        """
+        candidate = candidate.replace('\\', '/')
+        if candidate[0:2] == './':
+            return candidate[2:], candidate
+        return candidate, './' + candidate
+
+    def match(self, candidate: str) -> bool:
+        """
+        Check if a path candidate matches at least one pattern.
+        """
+        return self.match_normalized(PathMatcher.normalize(candidate))
+
+    def match_normalized(self, alternatives: Tuple[str, str]) -> bool:
+        """
+        Check if normalized alternatives of a path candidate match at least one pattern.
+        """
+        for alternative in alternatives:
+            if alternative in self.literals or \
+                    (self.prefixes and alternative.startswith(self.prefixes)) or \
+                    (self.suffixes and alternative.endswith(self.suffixes)):
+                return True
+            for literal in self.contains:
+                if literal in alternative:
+                    return True
+            for prefix, pattern in self.globs:
+                if alternative.startswith(prefix) and pattern.match(alternative):
+                    return True
+        return False
+
+
 # pylint:disable=too-many-instance-attributes
 class FileWalker:
     """
@@ -184,18 +324,10 @@ class FileWalker:
             include_files = []
         if exclude_files is None:
             exclude_files = []
-        includes = self._braceexpand(includes)
-        excludes = self._braceexpand(excludes)
-        include_files = self._braceexpand(include_files)
-        exclude_files = self._braceexpand(exclude_files)
-        self.includes = [FileWalker.re_compile_patterns(includes)] if includes else []
-        self.excludes = [
-            re.compile(
-                build_or_pattern([fnmatch.translate(x) for x in excludes]))] if excludes else []
-        self.include_files = [
-            re.compile(build_or_pattern([fnmatch.translate(x) for x in include_files]))] if include_files else []
-        self.exclude_files = [
-            re.compile(build_or_pattern([fnmatch.translate(x) for x in exclude_files]))] if exclude_files else []
+        self.includes = PathMatcher(self._braceexpand(includes))
+        self.excludes = PathMatcher(self._braceexpand(excludes))
+        self.include_files = PathMatcher(self._braceexpand(include_files))
+        self.exclude_files = PathMatcher(self._braceexpand(exclude_files))
         self.suffixes = suffixes if suffixes is not None else []
         if not rootpath:
             rootpath = os.path.relpath(config.paths.project_home)
@@ -203,6 +335,7 @@ class FileWalker:
         self.recursive = recursive
         self.skip_processed_sources = skip_processed_sources
         self.skip_processed_targets = skip_processed_targets
+        self._excluded_directories = {}
 
     @property
     def items(self):
@@ -221,8 +354,7 @@ class FileWalker:
             context.log.debug('%s', root)
             for dirs_item in list(dirs):
                 dirpath = FileWalker._join(root, dirs_item)
-                if self._is_included(dirpath, *self.includes) and \
-                        not self._is_excluded(dirpath, *self.excludes):
+                if self._is_accepted(dirpath, self.includes, self.excludes):
                     yield dirpath
                 else:
                     context.log.debug('%s [ignored]', dirpath)
@@ -230,8 +362,7 @@ class FileWalker:
 
             for files_item in list(files):
                 filepath = FileWalker._join(root, files_item)
-                if self._is_included(filepath, *self.include_files) and \
-                        not self._is_excluded(filepath, *self.exclude_files):
+                if self._is_accepted(filepath, self.include_files, self.exclude_files):
                     yield filepath
 
             if not recursive:
@@ -241,9 +372,8 @@ class FileWalker:
         """
         Check if a source path is filtered out by includes/excludes
         """
-        return not self._is_included(candidate, *self.include_files) or \
-               self._is_excluded(candidate, *self.exclude_files) or \
-               self._has_ancestor_excluded(Path(candidate), *self.excludes)
+        return not self._is_accepted(candidate, self.include_files, self.exclude_files) or \
+               self._has_ancestor_excluded(FileWalker._normalize_path(candidate))
 
     @staticmethod
     def _braceexpand(expressions):
@@ -254,40 +384,38 @@ class FileWalker:
         return expanded_expressions
 
     @staticmethod
-    def _is_excluded(candidate: str, *excludes: re.Pattern) -> bool:
-        if not excludes:
+    def _is_accepted(candidate: str, includes: PathMatcher, excludes: PathMatcher) -> bool:
+        if not includes and not excludes:
+            return True
+        alternatives = PathMatcher.normalize(candidate)
+        if includes and not includes.match_normalized(alternatives):
             return False
-        return FileWalker.match_any_pattern(candidate, *excludes)
+        return not excludes or not excludes.match_normalized(alternatives)
 
     @staticmethod
-    def _is_included(candidate: str, *includes: re.Pattern) -> bool:
-        if not includes:
+    def _normalize_path(candidate: str) -> str:
+        # Path instantiation is costly, so it's only used when candidate needs to be normalized.
+        if not candidate or candidate.startswith('./') or candidate.endswith(('/', '/.')) or \
+                any(part in candidate for part in ('\\', '//', '/./')):
+            return Path(candidate).as_posix()
+        return candidate
+
+    def _has_ancestor_excluded(self, candidate: str) -> bool:
+        """
+        Check if the candidate or one of its parent directories is excluded. Directory verdicts are memoized.
+        """
+        if not self.excludes:
+            return False
+        if self.excludes.match(candidate):
             return True
-        return FileWalker.match_any_pattern(candidate, *includes)
-
-    @staticmethod
-    def _has_ancestor_excluded(candidate_path: Path, *excludes: re.Pattern) -> bool:
-        while True:
-            if FileWalker._is_excluded(str(candidate_path), *excludes):
-                return True
-            candidate_path_parent = candidate_path.parent
-            if not candidate_path_parent or candidate_path_parent == candidate_path:
-                break
-            candidate_path = candidate_path_parent
-        return False
-
-    @staticmethod
-    def _path_alternatives_for_pattern_match(path: str):
-        if path[0:2] == './':
-            yield path[2:]
-            yield path
-        else:
-            yield path
-            yield './' + path
-
-    @staticmethod
-    def _as_posix_fast(path: str):
-        return path.replace('\\', '/')
+        parent = posixpath.dirname(candidate) or '.'
+        if parent == candidate:
+            return False
+        excluded = self._excluded_directories.get(parent)
+        if excluded is None:
+            excluded = self._has_ancestor_excluded(parent)
+            self._excluded_directories[parent] = excluded
+        return excluded
 
     @staticmethod
     def _join(parent: str, child: str):
@@ -305,9 +433,9 @@ class FileWalker:
         """
         Check if a string match at least one of provided compiled pattern
         """
-        candidate = FileWalker._as_posix_fast(candidate)
+        alternatives = PathMatcher.normalize(candidate)
         for pattern in patterns:
-            for candidate_alternative in FileWalker._path_alternatives_for_pattern_match(candidate):
+            for candidate_alternative in alternatives:
                 if pattern.match(candidate_alternative):
                     return True
         return False
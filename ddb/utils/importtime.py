@@ -0,0 +1,85 @@
+import os
+import re
+import subprocess
+import sys
+from typing import Iterable, List, NamedTuple, Optional, Sequence, TextIO
+
+profile_import_arg = "--profile-import"
+
+_importtime_re = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S.*)$")
+
+
+class ImportTime(NamedTuple):
+    """
+    Import cost of a module, in microseconds.
+    """
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def is_profile_import_enabled(args: Sequence[str], env_prefix: str = "DDB") -> bool:
+    """
+    Check if import profiling is enabled, from command line arguments or environment variable.
+    """
+    return profile_import_arg in args or os.environ.get(env_prefix + "_PROFILE_IMPORT", "") not in ("", "0")
+
+
+def parse_importtime(lines: Iterable[str]) -> List[ImportTime]:
+    """
+    Parse output of python -X importtime.
+    """
+    import_times = []
+    for line in lines:
+        match = _importtime_re.match(line.rstrip("\r\n"))
+        if match:
+            import_times.append(ImportTime(match.group(4),
+                                           int(match.group(1)),
+                                           int(match.group(2)),
+                                           len(match.group(3)) // 2))
+    return import_times
+
+
+def format_importtime(import_times: List[ImportTime], limit: Optional[int] = 30) -> str:
+    """
+    Format import times as a table, most expensive modules first.
+    """
+    total = sum(import_time.self_us for import_time in import_times)
+    ranked = sorted(import_times, key=lambda import_time: import_time.self_us, reverse=True)
+    if limit:
+        ranked = ranked[:limit]
+
+    lines = ["%10s  %10s  %s" % ("self (ms)", "cumul (ms)", "module")]
+    for import_time in ranked:
+        lines.append("%10.1f  %10.1f  %s" % (import_time.self_us / 1000,
+                                             import_time.cumulative_us / 1000,
+                                             import_time.module))
+    lines.append("%10.1f  %10s  %s" % (total / 1000, "", "total (%i modules)" % len(import_times)))
+    return "\n".join(lines)
+
+
+def profile_import(args: Sequence[str], env_prefix: str = "DDB", output: TextIO = sys.stderr) -> int:
+    """
+    Run ddb console script again in a python subprocess with -X importtime, and print per-module import cost on exit.
+    """
+    if getattr(sys, "frozen", False):
+        print("%s is not available in standalone binary" % profile_import_arg, file=output)
+        return 1
+
+    env = dict(os.environ)
+    env.pop(env_prefix + "_PROFILE_IMPORT", None)
+    command = [sys.executable, "-X", "importtime", "-m", "ddb.console"]
+    command.extend(arg for arg in args if arg != profile_import_arg)
+
+    with subprocess.Popen(command, env=env, stderr=subprocess.PIPE, universal_newlines=True) as process:
+        import_lines = []
+        for line in process.stderr:
+            if line.startswith("import time:"):
+                import_lines.append(line)
+            else:
+                output.write(line)
+        returncode = process.wait()
+
+    print(format_importtime(parse_importtime(import_lines)), file=output)
+    return returncode
@@ -86,7 +86,7 @@ package_data = []
 
 entry_points = {
     'console_scripts': [
-        'ddb = ddb.__main__:console_script'
+        'ddb = ddb.console:console_script'
     ],
     "pytest11": [
         "docker_compose=pytest_docker_compose:plugin",
@@ -0,0 +1,8 @@
+import pytest
+
+from ddb.config import config
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "paths", config.paths._replace(home=str(tmp_path)))
@@ -0,0 +1,116 @@
+import pytest
+from _pytest.fixtures import FixtureRequest
+
+from ddb.cache.cache import Cache
+from ddb.cache.shelve_cache import ShelveCache
+from ddb.cache.sqlite_cache import SqliteCache
+
+
+@pytest.mark.parametrize("cache_class", [ShelveCache, SqliteCache])
+class TestCache:
+    def test_set_many_pop_many(self, request: FixtureRequest, cache_class):
+        cache = cache_class(request.node.name)
+        cache.set_many({"foo": "bar", "baz": 1337, "other": None})
+        cache.pop_many(["baz", "missing"])
+        cache.close()
+
+        cache = cache_class(request.node.name)
+        assert sorted(cache.keys()) == ["foo", "other"]
+        assert cache.get("foo") == "bar"
+        assert "other" in cache
+        cache.close()
+
+    def test_get_many(self, request: FixtureRequest, cache_class):
+        cache = cache_class(request.node.name)
+        cache.set_many({"foo": "bar", "baz": 1337})
+        cache.flush()
+        cache.set("pending", "value")
+        cache.pop_many(["baz"])
+
+        assert cache.get_many(["foo", "baz", "pending", "missing"], "default") == {
+            "foo": "bar", "baz": "default", "pending": "value", "missing": "default"}
+
+        with cache.transaction() as transaction:
+            transaction.set("new", "value")
+            transaction.pop("foo")
+            assert transaction.get_many(["foo", "new", "pending"]) == {"foo": None, "new": "value", "pending": "value"}
+        cache.close()
+
+    def test_transaction_commit(self, request: FixtureRequest, cache_class):
+        cache = cache_class(request.node.name)
+        cache.set("foo", "bar")
+        cache.set("baz", 1337)
+
+        with cache.transaction() as transaction:
+            transaction.set("new", "value")
+            assert transaction.pop("baz") == 1337
+            transaction.set("foo", "updated")
+
+            assert transaction.get("new") == "value"
+            assert transaction.get("baz") is None
+            assert "baz" not in transaction
+            assert sorted(transaction.keys()) == ["foo", "new"]
+            with pytest.raises(KeyError):
+                transaction.pop("baz")
+
+            assert cache.get("new") is None
+            assert cache.get("baz") == 1337
+            assert cache.get("foo") == "bar"
+
+        cache.close()
+
+        cache = cache_class(request.node.name)
+        assert sorted(cache.keys()) == ["foo", "new"]
+        assert cache.get("foo") == "updated"
+        assert cache.get("new") == "value"
+        cache.close()
+
+    def test_transaction_rollback(self, request: FixtureRequest, cache_class):
+        cache = cache_class(request.node.name)
+        cache.set("foo", "bar")
+
+        with pytest.raises(RuntimeError):
+            with cache.transaction() as transaction:
+                transaction.set("foo", "updated")
+                transaction.set("new", "value")
+                raise RuntimeError()
+
+        assert cache.get("foo") == "bar"
+        assert "new" not in cache
+        cache.close()
+
+
+class DictCache(Cache):
+    def __init__(self):
+        super().__init__("dict")
+        self.data = {}
+
+    def get(self, key: str, default=None):
+        return self.data.get(key, default)
+
+    def keys(self):
+        return list(self.data)
+
+    def set(self, key: str, data):
+        self.data[key] = data
+
+    def pop(self, key: str):
+        return self.data.pop(key)
+
+    def clear(self):
+        self.data.clear()
+
+
+def test_default_implementations():
+    cache = DictCache()
+    cache.set_many({"foo": "bar", "baz": None})
+
+    assert "baz" in cache
+    assert "missing" not in cache
+
+    cache.pop_many(["baz", "missing"])
+    assert cache.get_many(["foo", "baz"]) == {"foo": "bar", "baz": None}
+    assert "baz" not in cache
+
+    cache.apply({"new": "value"}, ["foo"])
+    assert cache.data == {"new": "value"}
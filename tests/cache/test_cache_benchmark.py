@@ -0,0 +1,45 @@
+import pytest
+
+from ddb.cache.shelve_cache import ShelveCache
+from ddb.cache.sqlite_cache import SqliteCache
+
+files_count = 100000
+changed_count = 100
+
+
+def signature(index, run=0):
+    return {"mtime": 1600000000.0 + index + run, "size": index * 7}
+
+
+def populate(cache_class, namespace):
+    cache = cache_class(namespace)
+    for index in range(files_count):
+        cache.set("src/module%03d/file%06d.py" % (index % 1000, index), signature(index))
+    cache.flush()
+    cache.close()
+
+
+@pytest.mark.parametrize("cache_class", [ShelveCache, SqliteCache])
+def test_bench_file_cache_incremental_run(benchmark, request, cache_class):
+    """
+    Simulate a run of file:walk action on a large project with a few modified files.
+    """
+    namespace = request.node.name
+    populate(cache_class, namespace)
+
+    def incremental_run(run=[0]):  # pylint:disable=dangerous-default-value
+        run[0] += 1
+        cache = cache_class(namespace)
+        keys = ["src/module%03d/file%06d.py" % (index % 1000, index) for index in range(files_count)]
+        cached = cache.get_many(keys)
+        changed = {}
+        for index, key in enumerate(keys):
+            expected = signature(index, run[0]) if index < changed_count else signature(index)
+            if cached[key] != expected:
+                changed[key] = expected
+        cache.set_many(changed)
+        cache.flush()
+        cache.close()
+        return len(changed)
+
+    assert benchmark.pedantic(incremental_run, rounds=2, iterations=1) == changed_count
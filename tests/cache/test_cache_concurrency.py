@@ -0,0 +1,59 @@
+import multiprocessing
+
+import pytest
+
+from ddb.cache import cache_backends
+from ddb.config import config
+
+processes_count = 8
+iterations = 30
+
+
+def hammer(backend: str, home: str, worker: int):
+    """
+    Write, read and remove entries of a project cache, while other processes do the same.
+    """
+    config.paths = config.paths._replace(home=home)
+    cache_class = cache_backends[backend]
+
+    cache = cache_class("file", store="project")
+    for iteration in range(iterations):
+        cache.set(f"worker{worker}.{iteration}", iteration)
+        cache.set("shared", (worker, iteration))
+        cache.set_many({f"worker{worker}.{iteration}.{index}": index for index in range(10)})
+        cache.pop_many([f"worker{worker}.{iteration - 1}.{index}" for index in range(10)])
+        cache.flush()
+
+        assert cache.get(f"worker{worker}.{iteration}") == iteration
+        assert isinstance(cache.get("shared"), tuple)
+        for key in cache.keys():
+            cache.get(key)
+
+        if iteration % 10 == 9:
+            cache.close()
+            cache = cache_class("file", store="project")
+    cache.close()
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="fork is not available")
+@pytest.mark.parametrize("backend", ["shelve", "sqlite"])
+def test_concurrent_processes_share_project_cache(backend: str):
+    context = multiprocessing.get_context("fork")
+    processes = [context.Process(target=hammer, args=(backend, config.paths.home, worker))
+                 for worker in range(processes_count)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(120)
+
+    assert [process.exitcode for process in processes] == [0] * processes_count
+
+    cache = cache_backends[backend]("file", store="project")
+    for worker in range(processes_count):
+        for iteration in range(iterations):
+            assert cache.get(f"worker{worker}.{iteration}") == iteration
+        for index in range(10):
+            assert cache.get(f"worker{worker}.{iterations - 1}.{index}") == index
+            assert f"worker{worker}.{iterations - 2}.{index}" not in cache
+    assert cache.get("shared") in [(worker, iterations - 1) for worker in range(processes_count)]
+    cache.close()
@@ -0,0 +1,117 @@
+import os
+
+import pytest
+import requests
+import responses
+
+from ddb.cache.http_cache import HttpCache
+from ddb.cache.sqlite_cache import SqliteCache
+
+url = "https://example.com/file.txt"
+
+
+@pytest.fixture
+def http_cache(tmp_path):
+    cache = SqliteCache("requests")
+    yield HttpCache(cache, str(tmp_path / "requests"))
+    cache.close()
+
+
+class TestHttpCache:
+    @responses.activate
+    def test_should_store_body_on_disk(self, http_cache: HttpCache):
+        responses.add(responses.GET, url, body=b"payload", headers={"Content-Disposition": "filename=file.txt"})
+
+        response = http_cache.get(url)
+
+        assert not response.from_cache
+        assert response.content == b"payload"
+        assert response.text == "payload"
+        assert response.headers["content-disposition"] == "filename=file.txt"
+        assert os.path.dirname(response.filename) == http_cache.directory
+        assert http_cache.cache.get(url)["size"] == len(b"payload")
+        assert "payload" not in str(http_cache.cache.get(url))
+
+    @responses.activate
+    def test_should_use_fresh_response_without_request(self, http_cache: HttpCache):
+        responses.add(responses.GET, url, body=b"content", headers={"Cache-Control": "max-age=3600"})
+
+        http_cache.get(url)
+        response = http_cache.get(url)
+
+        assert response.from_cache
+        assert response.content == b"content"
+        assert len(responses.calls) == 1
+
+    @responses.activate
+    def test_should_revalidate_stale_response(self, http_cache: HttpCache):
+        responses.add(responses.GET, url, body=b"content",
+                      headers={"ETag": '"v1"', "Last-Modified": "Wed, 21 Oct 2015 07:28:00 GMT"})
+        responses.add(responses.GET, url, status=304)
+
+        http_cache.get(url)
+        response = http_cache.get(url)
+
+        assert response.from_cache
+        assert response.content == b"content"
+        assert len(responses.calls) == 2
+        assert responses.calls[1].request.headers["If-None-Match"] == '"v1"'
+        assert responses.calls[1].request.headers["If-Modified-Since"] == "Wed, 21 Oct 2015 07:28:00 GMT"
+
+    @responses.activate
+    def test_should_replace_modified_response(self, http_cache: HttpCache):
+        responses.add(responses.GET, url, body=b"content", headers={"ETag": '"v1"'})
+        responses.add(responses.GET, url, body=b"modified", headers={"ETag": '"v2"'})
+
+        http_cache.get(url)
+        response = http_cache.get(url)
+
+        assert not response.from_cache
+        assert response.content == b"modified"
+        assert http_cache.cache.get(url)["headers"]["etag"] == '"v2"'
+
+    @responses.activate
+    def test_should_use_cached_response_on_connection_error(self, http_cache: HttpCache):
+        responses.add(responses.GET, url, body=b"content", headers={"ETag": '"v1"'})
+        responses.add(responses.GET, url, body=requests.ConnectionError("offline"))
+
+        http_cache.get(url)
+        response = http_cache.get(url)
+
+        assert response.from_cache
+        assert response.content == b"content"
+
+    @responses.activate
+    def test_should_raise_http_error(self, http_cache: HttpCache):
+        responses.add(responses.GET, url, status=404)
+
+        with pytest.raises(requests.HTTPError):
+            http_cache.get(url)
+
+        assert http_cache.cache.get(url) is None
+        assert not os.listdir(http_cache.directory)
+
+    @responses.activate
+    def test_should_evict_least_recently_used(self, http_cache: HttpCache):
+        http_cache.max_size = 25
+        for name in ("a", "b", "c"):
+            responses.add(responses.GET, f"https://example.com/{name}", body=name.encode("utf-8") * 10,
+                          headers={"Cache-Control": "max-age=3600"})
+
+        http_cache.get("https://example.com/a")
+        http_cache.get("https://example.com/b")
+        http_cache.get("https://example.com/a")
+        http_cache.get("https://example.com/c")
+
+        assert sorted(http_cache.cache.keys()) == ["https://example.com/a", "https://example.com/c"]
+        assert len(os.listdir(http_cache.directory)) == 2
+
+    @responses.activate
+    def test_should_ignore_legacy_entries(self, http_cache: HttpCache):
+        http_cache.cache.set(url, ["not", "an", "entry"])
+        responses.add(responses.GET, url, body=b"content")
+
+        response = http_cache.get(url)
+
+        assert not response.from_cache
+        assert response.content == b"content"
@@ -1,5 +1,6 @@
+import ddb.cache
 from ddb.__main__ import register_default_caches
-from ddb.cache import global_cache, project_cache
+from ddb.cache import global_cache, project_cache, register_project_cache
 
 
 def test_global_cache():
@@ -10,3 +11,27 @@ def test_global_cache():
 def test_project_cache():
     register_default_caches()
     assert project_cache() is not None
+
+
+def test_project_caches_share_store(tmp_path, monkeypatch, mocker):
+    monkeypatch.setattr(ddb.cache.config, "paths", ddb.cache.config.paths._replace(home=str(tmp_path / "home"),
+                                                                                  project_home=str(tmp_path)))
+    open_cache = mocker.spy(ddb.cache, "open_cache")
+
+    file_cache = register_project_cache("file")
+    gitignore_cache = register_project_cache("gitignore")
+
+    assert [call.args[0] for call in open_cache.call_args_list] == ["project-cache-uuid", "file", "gitignore"]
+    assert file_cache.filename == gitignore_cache.filename
+
+    file_cache.set("foo", "file")
+    gitignore_cache.set("foo", "gitignore")
+    assert file_cache.get("foo") == "file"
+    assert gitignore_cache.get("foo") == "gitignore"
+
+    gitignore_cache.clear()
+    assert file_cache.get("foo") == "file"
+    assert gitignore_cache.keys() == []
+
+    register_project_cache("template.target.JinjaAction")
+    assert [call.args[0] for call in open_cache.call_args_list[3:]] == ["template.target.jinjaaction"]
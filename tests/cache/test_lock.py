@@ -0,0 +1,38 @@
+import pytest
+
+from ddb.cache.lock import FileLock
+
+fcntl = pytest.importorskip("fcntl")
+
+
+def is_locked(filename: str, exclusive: bool) -> bool:
+    with open(filename, "a+b") as file:
+        try:
+            fcntl.flock(file.fileno(), (fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH) | fcntl.LOCK_NB)
+        except BlockingIOError:
+            return True
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+        return False
+
+
+def test_shared_lock_allows_readers(tmp_path):
+    filename = str(tmp_path / "cache.lock")
+    lock = FileLock(filename)
+
+    with lock.shared():
+        assert not is_locked(filename, exclusive=False)
+        assert is_locked(filename, exclusive=True)
+
+    assert not is_locked(filename, exclusive=True)
+    lock.close()
+
+
+def test_exclusive_lock_blocks_readers(tmp_path):
+    filename = str(tmp_path / "cache.lock")
+    lock = FileLock(filename)
+
+    with lock.exclusive():
+        assert is_locked(filename, exclusive=False)
+
+    assert not is_locked(filename, exclusive=False)
+    lock.close()
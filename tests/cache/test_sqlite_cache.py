@@ -0,0 +1,135 @@
+import os
+import shelve
+
+import pytest
+from _pytest.fixtures import FixtureRequest
+
+from ddb.cache.shelve_cache import ShelveCache, shelve_files
+from ddb.cache.sqlite_cache import SqliteCache
+
+
+class TestSqliteCache:
+    def test_should_raise_value_error_set_after_close(self, request: FixtureRequest):
+        cache = SqliteCache(request.node.name)
+        cache.close()
+
+        with pytest.raises(ValueError):
+            cache.set("foo", "bar")
+
+    def test_should_set_value_properly(self, request: FixtureRequest):
+        cache = SqliteCache(request.node.name)
+        cache.set("foo", "bar")
+        cache.set("number", 1337)
+        cache.set("dict", {"foo": ["bar", 1337]})
+
+        cache.flush()
+        assert cache.get("foo") == "bar"
+
+        cache.close()
+
+        cache = SqliteCache(request.node.name)
+        assert cache.get("foo") == "bar"
+        assert cache.get("number") == 1337
+        assert cache.get("dict") == {"foo": ["bar", 1337]}
+        assert cache.get("missing") is None
+        assert cache.get("missing", "default") == "default"
+        cache.close()
+
+    def test_should_pop_and_clear_properly(self, request: FixtureRequest):
+        cache = SqliteCache(request.node.name)
+        cache.set("foo", "bar")
+        cache.set("baz", None)
+
+        assert "foo" in cache
+        assert "baz" in cache
+        assert "missing" not in cache
+        assert sorted(cache.keys()) == ["baz", "foo"]
+
+        assert cache.pop("baz") is None
+        assert "baz" not in cache
+        with pytest.raises(KeyError):
+            cache.pop("baz")
+
+        cache.clear()
+        cache.close()
+
+        cache = SqliteCache(request.node.name)
+        assert cache.get("foo") is None
+        assert not cache.keys()
+        cache.close()
+
+    def test_should_share_changes_with_other_instance(self, request: FixtureRequest):
+        cache = SqliteCache(request.node.name)
+        cache.set("foo", "bar")
+
+        other = SqliteCache(request.node.name)
+        assert other.get("foo") == "bar"
+        other.set("foo", "baz")
+        other.close()
+
+        with pytest.raises(ValueError):
+            other.get("foo")
+
+        assert cache.get("foo") == "baz"
+        cache.close()
+
+        cache = SqliteCache(request.node.name)
+        assert cache.get("foo") == "baz"
+        cache.close()
+
+    def test_should_migrate_shelve_files(self, request: FixtureRequest):
+        shelve_cache = ShelveCache(request.node.name)
+        shelve_cache.set("foo", "bar")
+        shelve_cache.set("dict", {"foo": ["bar", 1337]})
+        shelve_cache.close()
+        assert shelve_files(shelve_cache.basename)
+
+        cache = SqliteCache(request.node.name)
+        assert cache.get("foo") == "bar"
+        assert cache.get("dict") == {"foo": ["bar", 1337]}
+        cache.close()
+
+        assert not shelve_files(shelve_cache.basename)
+        assert os.path.exists(cache.filename)
+
+    def test_should_ignore_unreadable_shelve_files(self, request: FixtureRequest):
+        shelve_cache = ShelveCache(request.node.name)
+        shelve_cache.close()
+        for filename in shelve_files(shelve_cache.basename):
+            with open(filename, "w", encoding="utf-8") as file:
+                file.write("corrupted")
+        with pytest.raises(Exception):
+            shelve.open(shelve_cache.basename, flag="r")[""]  # pylint:disable=expression-not-assigned
+
+        cache = SqliteCache(request.node.name)
+        assert not cache.keys()
+        cache.close()
+
+        assert not shelve_files(shelve_cache.basename)
+
+    def test_should_migrate_shelve_files_to_store(self, request: FixtureRequest):
+        shelve_cache = ShelveCache("file", store="store")
+        shelve_cache.set("foo", "bar")
+        shelve_cache.close()
+
+        cache = SqliteCache("file", store="store")
+        other = SqliteCache("other", store="store")
+        assert cache.get("foo") == "bar"
+        assert other.get("foo") is None
+        assert cache.filename == other.filename
+        assert not shelve_files(shelve_cache.basename)
+        cache.close()
+        other.close()
+
+    def test_should_apply_transaction_atomically(self, request: FixtureRequest):
+        cache = SqliteCache(request.node.name)
+        cache.set("foo", "bar")
+
+        with pytest.raises(Exception):
+            with cache.transaction() as transaction:
+                transaction.pop("foo")
+                transaction.set("new", lambda: None)
+
+        assert cache.get("foo") == "bar"
+        assert "new" not in cache
+        cache.close()
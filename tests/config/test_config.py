@@ -56,6 +56,26 @@ def test_load_with_env_overrides(data_dir):
     assert config.data == expected
 
 
+def test_apply_environ_overrides_only_browse_overridden_keys():
+    class Untouchable(dict):
+        def items(self):
+            raise AssertionError("This configuration branch should not be browsed")
+
+    os.environ['DDB_OVERRIDE_SOME_DEEP_VALUE'] = "env"
+    os.environ['DDB_OVERRIDE_SOME_LIST[1]'] = "12"
+
+    config = Config()
+    data = {'some': {'deep': {'value': 'file', 'other': Untouchable()},
+                     'list': ['a', 'b'],
+                     'other': Untouchable()},
+            'another': Untouchable()}
+
+    data = config.apply_environ_overrides(data)
+
+    assert data['some']['deep']['value'] == 'env'
+    assert data['some']['list'] == ['a', 12]
+
+
 def test_load_env_variables(data_dir):
     env = os.path.join(data_dir, 'load', 'env')
 
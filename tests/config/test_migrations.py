@@ -112,3 +112,17 @@ class TestWarnDeprecatedDotty:
         assert re.match(
             r"WARNING .*\"some.namespace.old_property\" configuration property is deprecated and will be removed "
             r"in a future major release\. You should use \"another.namespace.new_property\" instead\.", logs)
+
+    def test_migrations_from_old_config_key_parent(self):
+        deep = PropertyMigration("some.namespace.old_property", "another.namespace.new_property")
+        other = PropertyMigration("some.other_property", "another.other_property")
+        similar = PropertyMigration("something.old_property", "another.something")
+
+        migrations.set_history((deep, other, similar))
+
+        assert migrations.get_migrations_from_old_config_key_parent("some") == {deep, other}
+        assert migrations.get_migrations_from_old_config_key_parent("some.namespace") == {deep}
+        assert not migrations.get_migrations_from_old_config_key_parent("some.namespace.old_property")
+        assert not migrations.get_migrations_from_old_config_key_parent("another")
+        assert migrations.get_migrations_from_old_config_key_startswith("some.") == {deep, other}
+        assert migrations.get_migrations_from_old_config_key_startswith("some") == {deep, other, similar}
@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from ddb.config.migrations import MigrationsDotty
+from ddb.config.view import ConfigView
+
+
+def test_view_reads_configuration():
+    data = MigrationsDotty({'core': {'project': {'name': 'test'}}, 'items': [1, {'value': 2}]})
+
+    view = ConfigView(data, {'_local': {'value': 'local'}})
+
+    assert view['core'] == {'project': {'name': 'test'}}
+    assert view['core.project.name'] == 'test'
+    assert view['items.1.value'] == 2
+    assert view['_local.value'] == 'local'
+    assert 'core.project' in view
+    assert 'core.project.name.invalid' not in view
+    assert 'missing' not in view
+    assert list(view) == ['_local', 'core', 'items']
+    assert dict(view) == {'_local': {'value': 'local'}, 'core': {'project': {'name': 'test'}}, 'items': [1, {'value': 2}]}
+
+
+def test_view_copy_on_write():
+    data = MigrationsDotty({'core': {'project': {'name': 'test'}}, 'app': {'value': 'app'}})
+
+    view = ConfigView(data)
+    view['_config.eject'] = True
+    view['core.project.name'] = 'overridden'
+
+    assert view['_config'] == {'eject': True}
+    assert view['core.project.name'] == 'overridden'
+    assert view['app'] is data['app']
+
+    assert data.to_dict() == {'core': {'project': {'name': 'test'}}, 'app': {'value': 'app'}}
+
+
+def test_view_overlay_is_not_copied():
+    data = MigrationsDotty({'core': {'project': {'name': 'test'}}})
+    local = {'binary': b'\x00', 'items': {1, 2}, 'date': datetime(2020, 1, 1)}
+
+    view = ConfigView(data, {'_local': local})
+    view['_config.date'] = datetime(2021, 1, 1)
+
+    assert view['_local'] is local
+    assert view['_local.binary'] == b'\x00'
+    assert view['_config.date'] == datetime(2021, 1, 1)
+    assert '_local.items' in view
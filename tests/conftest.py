@@ -69,6 +69,7 @@ def configure(mocker: MockerFixture):
         if not 'core' in config:
             config['core'] = {}
         config.get('core')['check_updates'] = False
+        config.get('core').setdefault('autodetect_ttl', 0)
 
     Config.overrides = overrides
 
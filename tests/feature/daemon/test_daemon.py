@@ -0,0 +1,130 @@
+import os
+import tempfile
+import threading
+import time
+
+from _pytest.capture import CaptureFixture
+
+from ddb.__main__ import load_registered_features, register_actions_in_event_bus, register_default_caches
+from ddb.binary import binaries
+from ddb.binary.binary import DefaultBinary
+from ddb.config import config
+from ddb.feature import features
+from ddb.feature.core import CoreFeature
+from ddb.feature.daemon import DaemonFeature
+from ddb.feature.daemon.actions import DaemonServer
+from ddb.utils.daemon import run_with_daemon, get_socket_path, is_private
+from ddb.feature.run import RunFeature
+from ddb.feature.shell import ShellFeature
+
+
+def _start_server(server: DaemonServer) -> threading.Thread:
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+    assert server.wait_started(10)
+    return thread
+
+
+class TestDaemonFeature:
+    def _load(self, project_loader):
+        project_loader("empty")
+
+        features.register(CoreFeature())
+        features.register(RunFeature())
+        features.register(ShellFeature())
+        features.register(DaemonFeature())
+        load_registered_features()
+        register_actions_in_event_bus(True)
+        register_default_caches()
+
+        binaries.register(DefaultBinary("test", ["some", "command"]))
+
+    def test_socket_path(self):
+        assert get_socket_path("/some/project") == get_socket_path("/some/project/")
+        assert get_socket_path("/some/project") != get_socket_path("/some/other")
+
+    def test_socket_directory(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
+        assert os.path.dirname(get_socket_path("/some/project")) == os.path.join(str(tmp_path), "ddb")
+
+        monkeypatch.delenv("XDG_RUNTIME_DIR")
+        assert os.path.dirname(os.path.dirname(get_socket_path("/some/project"))) == tempfile.gettempdir()
+
+    def test_refuse_unsafe_socket(self, project_loader, capsys: CaptureFixture):
+        self._load(project_loader)
+
+        socket_path = get_socket_path(config.paths.project_home)
+        server = DaemonServer(socket_path)
+        thread = _start_server(server)
+        try:
+            assert is_private(os.path.dirname(socket_path))
+            assert is_private(socket_path)
+
+            os.chmod(os.path.dirname(socket_path), 0o777)
+            capsys.readouterr()
+            assert run_with_daemon(["run", "test"], config.paths.project_home) is None
+            assert not capsys.readouterr().out
+
+            os.chmod(os.path.dirname(socket_path), 0o700)
+            os.chmod(socket_path, 0o666)
+            assert run_with_daemon(["run", "test"], config.paths.project_home) is None
+        finally:
+            os.chmod(os.path.dirname(socket_path), 0o700)
+            server.stop()
+            thread.join(10)
+
+    def test_no_daemon(self, project_loader):
+        self._load(project_loader)
+
+        assert run_with_daemon(["run", "test"], config.paths.project_home) is None
+
+    def test_run(self, project_loader, capsys: CaptureFixture):
+        self._load(project_loader)
+
+        server = DaemonServer(get_socket_path(config.paths.project_home))
+        thread = _start_server(server)
+        try:
+            capsys.readouterr()
+            exit_code = run_with_daemon(["run", "test"], config.paths.project_home)
+
+            read = capsys.readouterr()
+            assert exit_code == 0
+            assert read.out == "some command\n"
+
+            assert run_with_daemon(["features"], config.paths.project_home) is None
+            assert run_with_daemon(["--clear-cache", "run", "test"], config.paths.project_home) is None
+        finally:
+            server.stop()
+            thread.join(10)
+
+        assert not os.path.exists(get_socket_path(config.paths.project_home))
+
+    def test_stale_on_configuration_change(self, project_loader):
+        self._load(project_loader)
+
+        server = DaemonServer(get_socket_path(config.paths.project_home))
+        thread = _start_server(server)
+        try:
+            time.sleep(0.01)
+            with open("ddb.yml", "w") as file:
+                file.write("core: {}\n")
+
+            assert run_with_daemon(["run", "test"], config.paths.project_home) is None
+            thread.join(10)
+            assert not thread.is_alive()
+        finally:
+            server.stop()
+            thread.join(10)
+
+    def test_rejected_on_override_change(self, project_loader):
+        self._load(project_loader)
+
+        server = DaemonServer(get_socket_path(config.paths.project_home))
+        thread = _start_server(server)
+        try:
+            os.environ["DDB_OVERRIDE_CORE_DOMAIN_EXT"] = "local"
+            assert run_with_daemon(["run", "test"], config.paths.project_home) is None
+            assert thread.is_alive()
+        finally:
+            server.stop()
+            thread.join(10)
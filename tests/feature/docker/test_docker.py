@@ -1,11 +1,12 @@
 import os
 import shutil
 
+import netifaces
 import pytest
 from _pytest.capture import CaptureFixture
 from dotty_dict import Dotty
 
-from ddb.__main__ import load_registered_features, register_actions_in_event_bus
+from ddb.__main__ import load_registered_features, register_actions_in_event_bus, reset
 from ddb.action import actions
 from ddb.binary import binaries
 from ddb.binary.binary import DefaultBinary
@@ -56,7 +57,101 @@ class TestDockerComposeControl:
         assert control.config()['services']
 
 
+    def test_cached_config(self, project_loader, mocker, monkeypatch):
+        project_loader("cached-config")
+
+        features.register(DockerFeature())
+        load_registered_features()
+
+        monkeypatch.delenv("APP_IMAGE", raising=False)
+        run = mocker.patch("ddb.feature.docker.utils.run",
+                           return_value=b"services:\n  web:\n    image: ubuntu\n")
+
+        control = DockerComposeControl()
+
+        digest, compose_config = control.cached_config()
+        assert compose_config == {'services': {'web': {'image': 'ubuntu'}}}
+        assert run.call_count == 1
+
+        assert DockerComposeControl().cached_config() == (digest, compose_config)
+        assert run.call_count == 1
+
+        with open(".env", "w") as env_file:
+            env_file.write("APP_IMAGE=debian\n")
+
+        other_digest, _ = control.cached_config()
+        assert other_digest != digest
+        assert run.call_count == 2
+
+        monkeypatch.setenv("APP_IMAGE", "alpine")
+        control.cached_config()
+        assert run.call_count == 3
+
+        monkeypatch.setenv("UNRELATED_VARIABLE", "value")
+        control.cached_config()
+        assert run.call_count == 3
+
+
+    def test_cached_config_extends_include(self, project_loader, mocker, monkeypatch):
+        project_loader("cached-config-extends")
+
+        features.register(DockerFeature())
+        load_registered_features()
+
+        monkeypatch.delenv("BASE_IMAGE", raising=False)
+        run = mocker.patch("ddb.feature.docker.utils.run",
+                           return_value=b"services:\n  web:\n    image: ubuntu\n")
+
+        control = DockerComposeControl()
+
+        digest, _ = control.cached_config()
+        assert control.cached_config()[0] == digest
+        assert run.call_count == 1
+
+        with open("base.yml", "a") as base_file:
+            base_file.write("    restart: always\n")
+
+        control.cached_config()
+        assert run.call_count == 2
+
+        with open(os.path.join("common", "compose.yml"), "a") as included_file:
+            included_file.write("    restart: always\n")
+
+        control.cached_config()
+        assert run.call_count == 3
+
+        monkeypatch.setenv("BASE_IMAGE", "alpine")
+        control.cached_config()
+        assert run.call_count == 4
+
+        control.cached_config()
+        assert run.call_count == 4
+
 class TestDockerFeature:
+    def test_autodetect_cache(self, project_loader, mocker):
+        project_loader("autodetect")
+
+        ifaddresses = mocker.patch("ddb.feature.docker.netifaces.ifaddresses",
+                                   return_value={netifaces.AF_INET: [{'addr': '10.1.2.3'}]})
+
+        features.register(CoreFeature())
+        features.register(DockerFeature())
+        load_registered_features()
+
+        assert config.data.get('docker.ip') == '10.1.2.3'
+        assert ifaddresses.call_count == 1
+        assert 'docker.ip' not in config.cached_defaults
+
+        reset()
+
+        features.register(CoreFeature())
+        features.register(DockerFeature())
+        load_registered_features()
+
+        assert config.data.get('docker.ip') == '10.1.2.3'
+        assert ifaddresses.call_count == 1
+        assert 'docker.ip' in config.cached_defaults
+
     def test_empty_project_without_core(self, project_loader):
         project_loader("empty")
 
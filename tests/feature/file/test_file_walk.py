@@ -0,0 +1,71 @@
+import os
+
+from pytest_mock import MockerFixture
+
+from ddb.__main__ import load_registered_features, register_actions_in_event_bus
+from ddb.cache import caches
+from ddb.event import bus
+from ddb.feature import features
+from ddb.feature.core import CoreFeature
+from ddb.feature.file import FileFeature, FileWalkAction
+from ddb.utils.file import get_file_signature
+
+
+class TestFileWalkAction:
+    def _load(self, project_loader):
+        project_loader("project")
+
+        features.register(CoreFeature())
+        features.register(FileFeature())
+        load_registered_features()
+        register_actions_in_event_bus(True)
+
+    def test_found_and_deleted(self, project_loader):
+        self._load(project_loader)
+
+        found = []
+        deleted = []
+        bus.on("file:found", found.append)
+        bus.on("file:deleted", deleted.append)
+
+        action = FileWalkAction()
+        action.initialize()
+        action.execute()
+
+        assert sorted(found) == sorted(["a.txt", "ddb.yml", "sub", os.path.join(".", "sub", "b.txt")])
+        assert not deleted
+
+        os.remove(os.path.join(".", "sub", "b.txt"))
+        found.clear()
+
+        action.execute()
+
+        assert sorted(found) == sorted(["a.txt", "ddb.yml", "sub"])
+        assert deleted == [os.path.join(".", "sub", "b.txt")]
+
+    def test_walk_once(self, project_loader, mocker: MockerFixture):
+        self._load(project_loader)
+
+        walk = mocker.spy(os, "walk")
+
+        action = FileWalkAction()
+        action.initialize()
+        action.execute()
+
+        assert walk.call_count == 1
+
+    def test_cache_file_signature(self, project_loader):
+        self._load(project_loader)
+
+        action = FileWalkAction()
+        action.initialize()
+        action.execute()
+
+        assert caches.get("file").get("a.txt") == get_file_signature("a.txt")
+
+        with open("a.txt", "a") as file:
+            file.write("modified")
+
+        action.execute()
+
+        assert caches.get("file").get("a.txt") == get_file_signature("a.txt")
@@ -1,7 +1,10 @@
 import os
+import threading
 
 from ddb.__main__ import load_registered_features, register_actions_in_event_bus
+from ddb.action import actions
 from ddb.config import config, migrations
+from ddb.context import context
 from ddb.config.migrations import PropertyMigration
 from ddb.feature import features
 from ddb.feature.core import CoreFeature
@@ -54,6 +57,102 @@ class TestJinjaAction:
 
         assert foo == 'env: dev'
 
+    def test_incremental(self, project_loader, mocker):
+        project_loader("incremental")
+
+        features.register(CoreFeature())
+        features.register(FileFeature())
+        features.register(JinjaFeature())
+        load_registered_features()
+        register_actions_in_event_bus(True)
+
+        action = FileWalkAction()
+        action.initialize()
+        action.execute()
+
+        with open('foo.yml', 'r') as f:
+            assert f.read() == 'env: dev'
+
+        jinja_action = actions.get('jinja:render')
+        render_spy = mocker.spy(jinja_action, '_render_template')
+
+        context.reset()
+        action.execute()
+        assert render_spy.call_count == 0
+
+        with open(os.path.join('partials', 'env.txt'), 'w') as f:
+            f.write('env: {{ core.env.current }}-modified')
+
+        context.reset()
+        action.execute()
+        assert render_spy.call_count == 1
+
+        with open('foo.yml', 'r') as f:
+            assert f.read() == 'env: dev-modified'
+
+        os.remove('foo.yml')
+
+        context.reset()
+        action.execute()
+        assert render_spy.call_count == 2
+        assert os.path.exists('foo.yml')
+
+        config.args.full = True
+        jinja_action.initialize()
+
+        context.reset()
+        action.execute()
+        assert render_spy.call_count == 3
+
+    def test_parallel(self, project_loader, mocker):
+        project_loader("parallel")
+
+        features.register(CoreFeature())
+        features.register(FileFeature())
+        features.register(JinjaFeature())
+        load_registered_features()
+        register_actions_in_event_bus(True)
+
+        jinja_action = actions.get('jinja:render')
+        render_spy = mocker.spy(jinja_action, '_render_template')
+
+        action = FileWalkAction()
+        action.initialize()
+        action.execute()
+
+        assert render_spy.call_count == 0
+        for i in range(1, 6):
+            with open('file%i.yml' % i, 'r') as f:
+                assert f.read() == 'file: %i\nenv: dev' % i
+
+    def test_parallel_disabled_with_threads(self, project_loader, mocker):
+        project_loader("parallel")
+
+        features.register(CoreFeature())
+        features.register(FileFeature())
+        features.register(JinjaFeature())
+        load_registered_features()
+        register_actions_in_event_bus(True)
+
+        jinja_action = actions.get('jinja:render')
+        render_spy = mocker.spy(jinja_action, '_render_template')
+
+        stop = threading.Event()
+        thread = threading.Thread(target=stop.wait)
+        thread.start()
+        try:
+            action = FileWalkAction()
+            action.initialize()
+            action.execute()
+        finally:
+            stop.set()
+            thread.join()
+
+        assert render_spy.call_count == 5
+        for i in range(1, 6):
+            with open('file%i.yml' % i, 'r') as f:
+                assert f.read() == 'file: %i\nenv: dev' % i
+
     def test_project2(self, project_loader):
         project_loader("project2")
 
@@ -0,0 +1 @@
+{value: "lib"}
@@ -1,3 +1,4 @@
+import json
 import os
 import pathlib
 import re
@@ -6,13 +7,15 @@ import pytest
 import yaml
 
 from ddb.__main__ import load_registered_features, register_actions_in_event_bus
+from ddb.action import actions
 from ddb.config import config, migrations
 from ddb.config.migrations import PropertyMigration
+from ddb.event import events
 from ddb.feature import features
 from ddb.feature.core import CoreFeature
 from ddb.feature.docker import DockerFeature
 from ddb.feature.file import FileFeature, FileWalkAction
-from ddb.feature.jsonnet import JsonnetFeature
+from ddb.feature.jsonnet import JsonnetFeature, actions as jsonnet_actions
 from ddb.utils.compat import path_as_posix_fast
 
 
@@ -239,6 +242,64 @@ class TestJsonnetAction:
 
         assert variables == variables_expected
 
+    def test_config_variables_flattened_once(self, project_loader, mocker):
+        project_loader("config_variables")
+
+        features.register(CoreFeature())
+        features.register(FileFeature())
+        features.register(JsonnetFeature())
+        load_registered_features()
+        register_actions_in_event_bus(True)
+
+        flatten_spy = mocker.spy(jsonnet_actions, "flatten")
+
+        action = FileWalkAction()
+        action.initialize()
+        action.execute()
+
+        assert flatten_spy.call_count == 2
+
+        jsonnet_action = actions.get("jsonnet:render")
+        ext = jsonnet_action._get_ext()
+        assert flatten_spy.call_count == 2
+
+        events.config.reloaded()
+
+        assert jsonnet_action._get_ext() == ext
+        assert flatten_spy.call_count == 4
+
+    def test_imports_cache(self, project_loader):
+        project_loader("imports")
+
+        features.register(CoreFeature())
+        features.register(FileFeature())
+        features.register(JsonnetFeature())
+        load_registered_features()
+        register_actions_in_event_bus(True)
+
+        action = FileWalkAction()
+        action.initialize()
+        action.execute()
+
+        for name in ("one", "two"):
+            with open('%s.json' % name, 'r') as f:
+                assert json.load(f) == {"value": "lib", "name": name}
+
+        jsonnet_action = actions.get("jsonnet:render")
+        assert list(jsonnet_action._imports_cache.keys()) == ["lib.libsonnet"]
+        assert jsonnet_action._imports_cache_hits == 1
+
+        mtime_ns = os.stat("lib.libsonnet").st_mtime_ns
+        with open("lib.libsonnet", "w") as f:
+            f.write('{value: "modified"}')
+        os.utime("lib.libsonnet", ns=(mtime_ns + 10 ** 9, mtime_ns + 10 ** 9))
+
+        jsonnet_action.execute("one.json.jsonnet", "one.json")
+
+        with open('one.json', 'r') as f:
+            assert json.load(f) == {"value": "modified", "name": "one"}
+        assert jsonnet_action._imports_cache_hits == 0
+
     @pytest.mark.parametrize("variant", [
         "test-dev",
         "test-ci",
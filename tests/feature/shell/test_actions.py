@@ -1,15 +1,20 @@
 import os
 import re
+import subprocess
 from abc import ABC, abstractmethod
 
+import pytest
 from _pytest.capture import CaptureFixture
 from ddb.__main__ import main, load_registered_features
+from ddb.binary import binaries
 from ddb.config import config
 from ddb.config.config import ConfigPaths
 from ddb.feature import features
 from ddb.feature.core import CoreFeature
+from ddb.feature.docker import DockerFeature
+from ddb.feature.docker.binaries import DockerBinary
 from ddb.feature.shell import ActivateAction, DeactivateAction, ShellFeature
-from ddb.feature.shell.actions import encode_environ_backup
+from ddb.feature.shell.actions import encode_environ_backup, CreateBinaryShim
 from ddb.feature.shell.integrations import BashShellIntegration, ShellIntegration, CmdShellIntegration
 from tests.utilstest import expect_gitignore
 
@@ -407,3 +412,92 @@ class TestCmdDeactivateAction(DeactivateActionBase):
 
     def build_shell_integration(self) -> ShellIntegration:
         return CmdShellIntegration()
+
+
+@pytest.mark.skipif("os.name == 'nt'")
+class TestBashCreateBinaryShim:
+    def _create_shim(self, project_loader, precompiled_shims: bool, binary: DockerBinary):
+        project_loader("project")
+
+        features.register(CoreFeature())
+        features.register(DockerFeature())
+        features.register(ShellFeature())
+        load_registered_features()
+        config.data['shell.precompiled_shims'] = precompiled_shims
+
+        binaries.register(binary)
+        action = CreateBinaryShim(BashShellIntegration())
+        action.execute(binary)
+
+        return os.path.join(config.paths.project_home, ".bin", binary.name)
+
+    @staticmethod
+    def _run_shim(shim: str, cwd: str, tmp_path, *args: str, environ=None):
+        fake_bin = tmp_path / "fake-bin"
+        fake_bin.mkdir(exist_ok=True)
+        for fake in ("docker", "ddb"):
+            fake_path = fake_bin / fake
+            fake_path.write_text('#!/usr/bin/env bash\necho "' + fake + ' $*"\n')
+            fake_path.chmod(0o755)
+
+        env = dict(os.environ)
+        env["PATH"] = str(fake_bin) + os.pathsep + env.get("PATH", "")
+        env.pop("DDB_RUN_OPTS", None)
+        if environ:
+            env.update(environ)
+        return subprocess.run(["bash", shim, *args], cwd=cwd, env=env, check=True,
+                              stdout=subprocess.PIPE).stdout.decode("utf-8").strip()
+
+    def test_precompiled(self, project_loader, tmp_path):
+        binary = DockerBinary("psql", "db", workdir="/workdir", args="psql --dbname=postgres")
+        shim = self._create_shim(project_loader, True, binary)
+
+        project_home = config.paths.project_home
+        compose_file = os.path.join(project_home, "docker-compose.yml")
+
+        output = self._run_shim(shim, project_home, tmp_path, "-c", "select 1")
+        assert output == "docker compose -f " + compose_file + \
+               " run --rm --workdir=/workdir/. db psql --dbname=postgres -c select 1"
+
+        subdirectory = os.path.join(project_home, "sub")
+        os.makedirs(subdirectory)
+        output = self._run_shim(shim, subdirectory, tmp_path)
+        assert output == "docker compose -f " + compose_file + \
+               " run --rm --workdir=/workdir/sub db psql --dbname=postgres"
+
+    def test_precompiled_fallback(self, project_loader, tmp_path):
+        binary = DockerBinary("psql", "db", workdir="/workdir")
+        shim = self._create_shim(project_loader, True, binary)
+
+        output = self._run_shim(shim, str(tmp_path), tmp_path)
+        assert output == "ddb run psql"
+
+        output = self._run_shim(shim, config.paths.project_home, tmp_path, environ={"DDB_RUN_OPTS": "-e TEST"})
+        assert output == "ddb run psql"
+
+    def test_precompiled_fallback_custom_env_prefix(self, project_loader, tmp_path, monkeypatch):
+        binary = DockerBinary("psql", "db", workdir="/workdir")
+        shim = self._create_shim(project_loader, True, binary)
+
+        monkeypatch.setattr(config, "env_prefix", "CUSTOM")
+        CreateBinaryShim(BashShellIntegration()).execute(binary)
+
+        output = self._run_shim(shim, config.paths.project_home, tmp_path, environ={"DDB_RUN_OPTS": "-e TEST"})
+        assert output == "ddb run psql"
+
+        output = self._run_shim(shim, config.paths.project_home, tmp_path, environ={"CUSTOM_RUN_OPTS": "-e TEST"})
+        assert output.startswith("docker compose ")
+
+    def test_condition_is_not_precompiled(self, project_loader, tmp_path):
+        binary = DockerBinary("psql", "db", workdir="/workdir", condition="True")
+        shim = self._create_shim(project_loader, True, binary)
+
+        output = self._run_shim(shim, config.paths.project_home, tmp_path)
+        assert output == "ddb run psql"
+
+    def test_disabled(self, project_loader, tmp_path):
+        binary = DockerBinary("psql", "db", workdir="/workdir")
+        shim = self._create_shim(project_loader, False, binary)
+
+        output = self._run_shim(shim, config.paths.project_home, tmp_path)
+        assert output == "ddb run psql"
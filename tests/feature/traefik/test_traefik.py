@@ -1,7 +1,11 @@
 import os
 from pathlib import Path
 
+import pytest
+import responses
+
 from ddb.__main__ import load_registered_features
+from ddb.action.runner import ExpectedError
 from ddb.config import config
 from ddb.feature import features
 from ddb.feature.core import CoreFeature
@@ -9,7 +13,7 @@ from ddb.feature.docker import DockerFeature
 from ddb.feature.jsonnet import JsonnetFeature
 from ddb.feature.traefik import TraefikFeature
 from ddb.feature.traefik.actions import TraefikInstalllCertsAction, TraefikUninstalllCertsAction, \
-    TraefikExtraServicesAction
+    TraefikExtraServicesAction, get_template
 
 
 class TestTraefikFeature:
@@ -187,3 +191,15 @@ class TestTraefikFeature:
                                                   "secured.project.test.extra-service.no-redirect.expected.toml"))
 
         assert secured_toml_expected.read_text() == Path(secured_toml).read_text()
+
+    @responses.activate
+    def test_template_download_error(self, project_loader, tmp_path, monkeypatch):
+        project_loader("empty")
+        monkeypatch.setattr(config, "paths", config.paths._replace(home=str(tmp_path)))
+
+        responses.add(responses.GET, "https://example.com/template.toml", body="{{ _local.value }}")
+        responses.add(responses.GET, "https://example.com/missing.toml", status=404, body="Not Found")
+
+        assert get_template("https://example.com/template.toml").render({"_local": {"value": "ok"}}) == "ok"
+        with pytest.raises(ExpectedError):
+            get_template("https://example.com/missing.toml")
@@ -1,10 +1,13 @@
+import os
+
 from pytest_mock import MockerFixture
 
 from ddb.__main__ import main, load_registered_features
 from ddb.config import config
 from ddb.feature import features
 from ddb.feature.core import CoreFeature
-from ddb.feature.version import VersionFeature, is_git_repository
+import ddb.feature.version
+from ddb.feature.version import VersionFeature, is_git_repository, get_vcs_info
 
 
 class TestVersionFeature:
@@ -102,3 +105,22 @@ class TestVersionFeature:
         assert config.data.get('version.branch') is None
         assert config.data.get('version.version') is None
         assert config.data.get('version.tag') is None
+
+    def test_vcs_info_cache(self, project_loader, mocker: MockerFixture):
+        project_loader("tag_repo")
+
+        run = mocker.spy(ddb.feature.version, "run")
+
+        vcs_info = get_vcs_info()
+        assert vcs_info['branch'] == 'master'
+        assert vcs_info['tag'] == 'v1.0.0'
+        assert run.call_count == 1
+
+        assert get_vcs_info() == vcs_info
+        assert run.call_count == 1
+
+        with open(os.path.join(".git", "refs", "tags", "v1.0.1"), "w") as tag_file:
+            tag_file.write(vcs_info['hash'] + "\n")
+
+        assert get_vcs_info()['tag'] in ('v1.0.0', 'v1.0.1')
+        assert run.call_count == 2
@@ -5,6 +5,7 @@ import pytest
 from ddb.__main__ import load_registered_features, register_actions_in_event_bus
 from ddb.config import migrations, config
 from ddb.config.migrations import PropertyMigration
+from ddb.context import context
 from ddb.feature import features
 from ddb.feature.core import CoreFeature
 from ddb.feature.file import FileFeature, FileWalkAction
@@ -121,6 +122,44 @@ class TestYttAction:
         assert rendered == expected
 
 
+    def test_batch(self, project_loader):
+        project_loader("batch")
+
+        features.register(CoreFeature())
+        features.register(FileFeature())
+        features.register(YttFeature())
+        load_registered_features()
+        register_actions_in_event_bus(True)
+
+        action = FileWalkAction()
+        action.initialize()
+        action.execute()
+
+        for name in ('first', 'second'):
+            assert os.path.exists('%s.yml' % name)
+            with open('%s.yml' % name, 'r') as f:
+                rendered = f.read()
+
+            with open('%s.expected.yml' % name, 'r') as f:
+                expected = f.read()
+
+            assert rendered == expected
+
+        batch_rendered = {}
+        for name in ('first', 'second', 'third'):
+            with open('%s.yml' % name, 'r') as f:
+                batch_rendered[name] = f.read()
+            os.remove('%s.yml' % name)
+
+        config.data['ytt.batch'] = False
+        context.reset()
+        action.execute()
+
+        for name in ('first', 'second', 'third'):
+            with open('%s.yml' % name, 'r') as f:
+                assert f.read() == batch_rendered[name]
+
+
 @pytest.mark.skipif("os.name == 'nt'")
 class TestYttAutofix:
     def teardown_method(self, test_method):
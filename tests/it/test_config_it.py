@@ -1,11 +1,12 @@
 import os
+import sys
 
 import yaml
 from _pytest.capture import CaptureFixture
 from dotty_dict import Dotty
 
 from ddb.__main__ import main, reset
-from ddb.config import config
+from ddb.config import config, Config
 
 
 class TestConfig:
@@ -34,6 +35,87 @@ class TestConfig:
 
         reset()
 
+    def test_config_snapshot(self, project_loader, mocker):
+        project_loader("extra-filenames")
+
+        Config.defaults = {'defaults': {'fail_fast': True}, 'core': {'check_updates': False}}
+        Config.overrides = None
+        read = mocker.spy(Config, "read")
+
+        main(["features"], reset_disabled=True)
+        assert read.call_count > 0
+        assert config.data.get('app.value') == 'local'
+        assert config.data.get('some') is True
+        docker_ip = config.data.get('docker.ip')
+        reset()
+
+        read.reset_mock()
+        main(["features"], reset_disabled=True)
+        assert read.call_count == 0
+        assert config.data.get('app.value') == 'local'
+        assert config.data.get('some') is True
+        assert config.data.get('docker.ip') == docker_ip
+        reset()
+
+        with open('some.custom.yml', 'w') as some_custom:
+            some_custom.write('some: false\n')
+
+        main(["features"], reset_disabled=True)
+        assert read.call_count > 0
+        assert config.data.get('some') is False
+        reset()
+
+    def test_config_snapshot_new_plugin_feature(self, project_loader):
+        project_loader("extra-filenames")
+
+        Config.defaults = {'defaults': {'fail_fast': True}, 'core': {'check_updates': False}}
+        Config.overrides = None
+
+        main(["features"], reset_disabled=True)
+        assert 'myplugin' not in config.data
+        reset()
+
+        os.makedirs(".ddb", exist_ok=True)
+        with open(os.path.join(".ddb", "myplugin.py"), "w", encoding="utf-8") as plugin:
+            plugin.write("""from marshmallow import fields
+
+from ddb.feature import Feature
+from ddb.feature.schema import FeatureSchema
+
+
+class MyPluginSchema(FeatureSchema):
+    greeting = fields.String(required=True, dump_default="hello")
+
+
+class MyPluginFeature(Feature):
+    @property
+    def name(self) -> str:
+        return "myplugin"
+
+    @property
+    def schema(self):
+        return MyPluginSchema
+""")
+
+        try:
+            main(["features"], reset_disabled=True)
+            assert config.data.get('myplugin.greeting') == 'hello'
+            reset()
+
+            with open(os.path.join(".ddb", "myplugin.py"), "r+", encoding="utf-8") as plugin:
+                content = plugin.read().replace('"hello"', '"bonjour"')
+                plugin.seek(0)
+                plugin.write(content)
+                plugin.truncate()
+            sys.modules.pop("myplugin", None)
+
+            main(["features"], reset_disabled=True)
+            assert config.data.get('myplugin.greeting') == 'bonjour'
+            reset()
+        finally:
+            sys.modules.pop("myplugin", None)
+            sys.path.remove(os.path.abspath(".ddb"))
+
     def test_config_output_extra_filenames(self, project_loader, capsys: CaptureFixture):
         project_loader("extra-filenames")
 
@@ -2,7 +2,7 @@
 import pytest
 from _pytest.capture import CaptureFixture
 
-from ddb.__main__ import main, ParseCommandLineException
+from ddb.__main__ import main, ParseCommandLineException, _get_command_name
 
 
 def test_main_no_args(project_loader):
@@ -33,3 +33,10 @@ def test_main_config_should_display_error(project_loader, capsys: CaptureFixture
 def test_main_config_variables(project_loader):
     project_loader("no-config")
     main(["config", "--variables"])
+
+
+def test_get_command_name():
+    assert _get_command_name([]) is None
+    assert _get_command_name(["-v", "--clear-cache"]) is None
+    assert _get_command_name(["-vv", "config", "--variables"]) == "config"
+    assert _get_command_name(["run", "-x", "npm"]) == "run"
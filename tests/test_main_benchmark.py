@@ -0,0 +1,58 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+lazy_modules = ["pkg_resources", "jinja2", "git", "requests", "cryptography", "cfssl", "cookiecutter",
+                "watchdog.observers", "multiprocessing"]
+
+
+@pytest.fixture
+def cold_start_env(tmp_path):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "ddb.yml").write_text("core:\n  check_updates: false\n")
+
+    env = dict(os.environ)
+    env["DDB_USER_HOME"] = str(tmp_path / "home")
+    env.pop("DDB_PROFILE_IMPORT", None)
+    return str(project), env
+
+
+def run_ddb(cwd, env, *args):
+    return subprocess.run([sys.executable, "-m", "ddb.console", *args], cwd=cwd, env=env,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True, check=False)
+
+
+def test_main_import_is_lazy(cold_start_env):
+    cwd, env = cold_start_env
+    code = "import sys, ddb.__main__; print(' '.join(m for m in %r if m in sys.modules))" % (lazy_modules,)
+    process = subprocess.run([sys.executable, "-c", code], cwd=cwd, env=env,
+                             stdout=subprocess.PIPE, universal_newlines=True, check=True)
+    assert process.stdout.split() == []
+
+
+def test_console_import_is_light(cold_start_env):
+    cwd, env = cold_start_env
+    code = "import sys, ddb.console; print(' '.join(m for m in sys.modules if m.startswith(%r)))" % (
+        ("ddb.feature", "ddb.cache", "ddb.action", "ddb.__main__"),)
+    process = subprocess.run([sys.executable, "-c", code], cwd=cwd, env=env,
+                             stdout=subprocess.PIPE, universal_newlines=True, check=True)
+    assert process.stdout.split() == []
+
+
+def test_bench_cold_start_version(benchmark, cold_start_env):
+    cwd, env = cold_start_env
+
+    process = benchmark.pedantic(run_ddb, args=(cwd, env, "--version", "--silent"), rounds=3, iterations=1)
+    assert process.returncode == 0
+    assert process.stdout.strip()
+
+
+def test_bench_cold_start_run(benchmark, cold_start_env):
+    cwd, env = cold_start_env
+
+    process = benchmark.pedantic(run_ddb, args=(cwd, env, "run", "unknown"), rounds=3, iterations=1)
+    assert process.returncode == 1
+    assert 'Binary name "unknown" is not registered' in process.stderr
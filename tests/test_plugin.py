@@ -1,6 +1,9 @@
 import os
+import time
 
-from ddb.__main__ import main
+import ddb.__main__
+import ddb.feature.plugins
+from ddb.__main__ import main, load_plugins, reset_available_features
 
 
 class TestPlugin:
@@ -18,3 +21,36 @@ class TestPlugin:
         assert os.path.exists("test2")
         assert os.path.exists("test3")
         assert os.path.exists("some")
+
+    def test_plugins_manifest(self, project_loader, mocker):
+        project_loader("feature")
+
+        past = time.time() - 60
+        for dirpath, _, _ in os.walk(".ddb"):
+            os.utime(dirpath, (past, past))
+
+        scan = mocker.spy(ddb.feature.plugins, "scan_plugins_modules")
+        load_module = mocker.spy(ddb.__main__, "_load_plugins_module")
+
+        load_plugins()
+        assert scan.call_count == 1
+        modules = [call.args[0] for call in load_module.call_args_list]
+        assert sorted(modules) == ["custom", "custom.actions", "custom2", "deep.directory",
+                                   "deep.directory.actions"]
+
+        reset_available_features()
+        load_module.reset_mock()
+
+        load_plugins()
+        assert scan.call_count == 1
+        assert [call.args[0] for call in load_module.call_args_list] == modules
+
+        reset_available_features()
+        load_module.reset_mock()
+
+        with open(os.path.join(".ddb", "custom3.py"), "w", encoding="utf-8") as custom3:
+            custom3.write("# -*- coding: utf-8 -*-\n")
+
+        load_plugins()
+        assert scan.call_count == 2
+        assert "custom3" in [call.args[0] for call in load_module.call_args_list]
@@ -7,7 +7,7 @@ from ddb.config import config
 from ddb.feature import features
 from ddb.feature.core import CoreFeature
 from ddb.utils import file
-from ddb.utils.file import FileWalker, FileUtils
+from ddb.utils.file import FileWalker, FileUtils, PathMatcher
 
 
 class TestHasSameContent:
@@ -22,6 +22,53 @@ class TestHasSameContent:
             file.has_same_content(os.path.join(data_dir, "512bytes.bin"), os.path.join(data_dir, "another.bin"))
 
 
+class TestWriteIfDifferent:
+    def test_should_write_only_if_different(self, tmp_path, mocker):
+        target = str(tmp_path / "target.txt")
+
+        assert file.write_if_different(target, "line1\nline2\n") is True
+        with open(target, "rb") as read_file:
+            assert read_file.read() == file.encode_content("line1\nline2\n", False)
+
+        open_spy = mocker.patch.object(file, "open", create=True, wraps=open)
+        assert file.write_if_different(target, "line1\nline2\n") is False
+        assert file.write_if_different(target, "line1\nline2 with a different size\n") is True
+        assert file.write_if_different(target, "line1\nline2 with a different size\n") is False
+        assert [call.kwargs["mode"] for call in open_spy.call_args_list] == ["rb", "w", "rb"]
+
+    def test_should_write_binary_only_if_different(self, tmp_path):
+        target = str(tmp_path / "target.bin")
+
+        assert file.write_if_different(target, b"\x00\x01", "rb", "wb") is True
+        assert file.write_if_different(target, b"\x00\x01", "rb", "wb") is False
+        assert file.write_if_different(target, b"\x00\x02", "rb", "wb") is True
+
+    def test_should_replace_directory(self, tmp_path):
+        target = tmp_path / "target"
+        target.mkdir()
+
+        assert file.write_if_different(str(target), "content") is True
+        assert target.read_text() == "content"
+
+
+class TestContentDigest:
+    def test_encode_content(self):
+        assert file.encode_content(b"a\nb", True) == b"a\nb"
+        assert file.encode_content("a\nb\u00e9", False, "\n") == "a\nb\u00e9".encode("utf-8")
+        assert file.encode_content("a\nb", False, "\r\n") == b"a\r\nb"
+        assert file.encode_content("a\nb", False) == ("a" + os.linesep + "b").encode("utf-8")
+
+    def test_is_content_digest_equal(self, tmp_path):
+        target = tmp_path / "target.bin"
+        target.write_bytes(b"some content")
+
+        assert file.get_content_digest(b"some content")[0] == len(b"some content")
+        assert file.is_content_digest_equal(str(target), file.get_content_digest(b"some content"))
+        assert not file.is_content_digest_equal(str(target), file.get_content_digest(b"some contend"))
+        assert not file.is_content_digest_equal(str(target), file.get_content_digest(b"other content"))
+        assert not file.is_content_digest_equal(str(tmp_path / "missing"), file.get_content_digest(b""))
+
+
 class TestFileWalker:
     def test_should_exclude_files_in_excluded_directory(self):
         fw = FileWalker([], ["**/node_modules"], [], [], [], ".")
@@ -31,6 +78,36 @@ class TestFileWalker:
         assert fw.is_source_filtered("blabla/another/subdirectory/file") is False
 
 
+class TestPathMatcher:
+    def test_buckets(self):
+        matcher = PathMatcher(["ddb.yml", "build/*", "**/.git", "*/_*", "*.jinja.*", "src/**/*.y?ml"])
+        assert matcher.literals == {"ddb.yml"}
+        assert matcher.prefixes == ("build/",)
+        assert matcher.suffixes == ("/.git",)
+        assert matcher.contains == ["/_", ".jinja."]
+        assert [prefix for prefix, _ in matcher.globs] == ["src/"]
+
+    def test_match(self):
+        matcher = PathMatcher(["ddb.yml", "build/*", "**/.git", "*/_*", "*.jinja.*", "src/**/*.y?ml"])
+        assert matcher.match("ddb.yml")
+        assert matcher.match("./ddb.yml")
+        assert not matcher.match("sub/ddb.yml")
+        assert matcher.match("build/output")
+        assert matcher.match(".git")
+        assert matcher.match("sub/.git")
+        assert matcher.match("sub\\.git")
+        assert matcher.match("sub/_partial.txt")
+        assert matcher.match("config.jinja.yml")
+        assert matcher.match("src/main/app.yaml")
+        assert not matcher.match("src/main/app.json")
+        assert not matcher.match("other.txt")
+
+    def test_empty(self):
+        matcher = PathMatcher([])
+        assert not matcher
+        assert not matcher.match("ddb.yml")
+
+
 class TestFileUtils:
     def test_get_file_content(self, data_dir: str, project_loader):
         project_loader()
@@ -1,15 +1,25 @@
+import fnmatch
+import os
+import re
+from pathlib import Path
+
+import pytest
+
 from ddb.utils.file import FileWalker
+from ddb.utils.re import build_or_pattern
+
+excludes = ["**/.git",
+            "**/.idea",
+            "**/node_modules",
+            "**/vendor",
+            "**/target",
+            "**/dist"]
 
 
 def file_walker_real_project():
     fw = FileWalker(
         [],
-        ["**/.git",
-         "**/.idea",
-         "**/node_modules",
-         "**/vendor",
-         "**/target",
-         "**/dist"],
+        excludes,
         [],
         [],
         [],
@@ -21,3 +31,125 @@ def file_walker_real_project():
 def xtest_should_bench(benchmark):
     result = benchmark(file_walker_real_project)
     assert len(result) == 15144
+
+
+class LegacyMatcher:
+    """
+    Matcher implementation used by FileWalker before PathMatcher, kept for comparison.
+    """
+
+    def __init__(self, patterns):
+        self.patterns = [re.compile(build_or_pattern([fnmatch.translate(x) for x in patterns]))] if patterns else []
+
+    def __bool__(self):
+        return bool(self.patterns)
+
+    def match(self, candidate):
+        candidate = candidate.replace('\\', '/')
+        for pattern in self.patterns:
+            for alternative in self._alternatives(candidate):
+                if pattern.match(alternative):
+                    return True
+        return False
+
+    def match_normalized(self, alternatives):
+        return self.match(alternatives[0])
+
+    @staticmethod
+    def _alternatives(path):
+        if path[0:2] == './':
+            yield path[2:]
+            yield path
+        else:
+            yield path
+            yield './' + path
+
+
+class LegacyFileWalker(FileWalker):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.includes = LegacyMatcher(self.includes.patterns)
+        self.excludes = LegacyMatcher(self.excludes.patterns)
+        self.include_files = LegacyMatcher(self.include_files.patterns)
+        self.exclude_files = LegacyMatcher(self.exclude_files.patterns)
+
+    def _has_ancestor_excluded(self, candidate):
+        candidate_path = Path(candidate)
+        while True:
+            if self.excludes and self.excludes.match(str(candidate_path)):
+                return True
+            candidate_path_parent = candidate_path.parent
+            if not candidate_path_parent or candidate_path_parent == candidate_path:
+                break
+            candidate_path = candidate_path_parent
+        return False
+
+
+def synthetic_tree(modules=100, packages=10, files=100):
+    """
+    Build a synthetic tree of modules * packages * files paths, with excluded directories in each module.
+    """
+    tree = {".": (["module%03d" % module for module in range(modules)] + [".git"], ["ddb.yml"])}
+    tree[".git"] = ([], ["HEAD", "config"])
+    for module in range(modules):
+        module_dir = "module%03d" % module
+        tree[module_dir] = (["package%02d" % package for package in range(packages)] + ["node_modules"],
+                            ["README.md"])
+        tree[module_dir + "/node_modules"] = ([], ["index.js"] * files)
+        for package in range(packages):
+            package_dir = module_dir + "/package%02d" % package
+            tree[package_dir] = ([], ["file%03d.py" % file for file in range(files)] +
+                                 ["config.yml.jinja", "docker-compose.yml.jsonnet"])
+    return tree
+
+
+def synthetic_walk(tree):
+    """
+    Build a replacement for os.walk, browsing the synthetic tree and honoring directories pruning.
+    """
+
+    def walk(path):
+        dirs, files = tree[path]
+        dirs = list(dirs)
+        yield path, dirs, list(files)
+        for directory in dirs:
+            yield from walk(directory if path == "." else path + "/" + directory)
+
+    return walk
+
+
+def synthetic_paths(tree):
+    paths = []
+    for directory, (_, files) in tree.items():
+        for file in files:
+            paths.append(file if directory == "." else directory + "/" + file)
+    return paths
+
+
+@pytest.fixture(scope="module")
+def tree():
+    return synthetic_tree()
+
+
+@pytest.mark.parametrize("walker_class", [LegacyFileWalker, FileWalker])
+def test_bench_walk_synthetic_tree(benchmark, mocker, tree, walker_class):
+    mocker.patch.object(os, "walk", synthetic_walk(tree))
+
+    def walk():
+        return list(walker_class([], excludes, ["*.jinja", "*.jsonnet", "*.py"], ["**/_*"], [], ".").items)
+
+    result = benchmark.pedantic(walk, rounds=2, iterations=1)
+    assert len(result) == 100 * 10 * 102 + 100 * 10 + 100
+
+
+@pytest.mark.parametrize("walker_class", [LegacyFileWalker, FileWalker])
+def test_bench_is_source_filtered_synthetic_tree(benchmark, tree, walker_class):
+    paths = synthetic_paths(tree)
+    assert len(paths) > 100000
+
+    def is_source_filtered():
+        walker = walker_class([], excludes, ["*.jinja", "*.jsonnet", "*.py"], ["**/_*"], [], ".")
+        return [path for path in paths if not walker.is_source_filtered(path)]
+
+    result = benchmark.pedantic(is_source_filtered, rounds=2, iterations=1)
+    assert len(result) == 100 * 10 * 102
@@ -0,0 +1,36 @@
+from ddb.utils.importtime import parse_importtime, format_importtime, is_profile_import_enabled, ImportTime
+
+importtime_output = """import time: self [us] | cumulative | imported package
+import time:       262 |      11445 |       multiprocessing
+import time:       219 |      15474 |   certifi
+some other output
+import time:       920 |     251735 | ddb.__main__
+"""
+
+
+def test_parse_importtime():
+    assert parse_importtime(importtime_output.splitlines(keepends=True)) == [
+        ImportTime("multiprocessing", 262, 11445, 3),
+        ImportTime("certifi", 219, 15474, 1),
+        ImportTime("ddb.__main__", 920, 251735, 0),
+    ]
+
+
+def test_format_importtime():
+    lines = format_importtime(parse_importtime(importtime_output.splitlines()), limit=2).splitlines()
+    assert len(lines) == 4
+    assert lines[1].split() == ["0.9", "251.7", "ddb.__main__"]
+    assert lines[2].split() == ["0.3", "11.4", "multiprocessing"]
+    assert lines[3].split() == ["1.4", "total", "(3", "modules)"]
+
+
+def test_is_profile_import_enabled(monkeypatch):
+    monkeypatch.delenv("DDB_PROFILE_IMPORT", raising=False)
+    assert not is_profile_import_enabled(["run", "foo"])
+    assert is_profile_import_enabled(["--profile-import", "run", "foo"])
+
+    monkeypatch.setenv("DDB_PROFILE_IMPORT", "0")
+    assert not is_profile_import_enabled([])
+
+    monkeypatch.setenv("DDB_PROFILE_IMPORT", "1")
+    assert is_profile_import_enabled([])